@@ -0,0 +1,20 @@
+import os
+
+from core.errors import SettingsError
+
+
+def env_int(name: str, default: int) -> int:
+    """
+    Read an optional integer environment variable.
+    Empty or unset values fall back to `default`.
+    """
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        return default
+
+    try:
+        return int(value)
+    except ValueError as exc:
+        raise SettingsError(
+            f"Environment variable '{name}' must be an integer, got '{value}'"
+        ) from exc
@@ -1,9 +1,19 @@
 import json
+import logging
+import threading
+import time
 
 import boto3
 
 from core.errors import SettingsError
 
+logger = logging.getLogger(__name__)
+
+# Secrets are re-fetched after this long
+DEFAULT_SECRET_TTL_S = 3600
+# ... and refreshed in the background this long before they expire
+DEFAULT_SECRET_REFRESH_AHEAD_S = 300
+
 
 class SecretsManagerError(RuntimeError):
     pass
@@ -32,3 +42,103 @@ class SecretsManager:
             )
 
         return json.loads(secret_string)
+
+
+class SecretCache:
+    """
+    Secrets Manager values cached for `ttl_s` seconds.
+
+    - within the last `refresh_ahead_s` seconds of a value's lifetime,
+      a read returns the cached value and starts one background refresh
+    - an expired value is fetched synchronously (a failure raises)
+    - `refresh` re-fetches now, e.g. after the credentials were rejected
+      because the secret was rotated
+    - a failed background refresh keeps the cached value until it expires
+
+    The Secrets Manager client is created on first fetch and reused.
+    """
+
+    def __init__(
+        self,
+        region: str | None = None,
+        *,
+        ttl_s: float = DEFAULT_SECRET_TTL_S,
+        refresh_ahead_s: float = DEFAULT_SECRET_REFRESH_AHEAD_S,
+        manager_factory=SecretsManager,
+    ):
+        if ttl_s <= 0:
+            raise ValueError("ttl_s must be positive")
+
+        self.region = region
+        self.ttl_s = ttl_s
+        self.refresh_ahead_s = min(max(refresh_ahead_s, 0), ttl_s)
+        self._manager_factory = manager_factory
+        self._manager: SecretsManager | None = None
+
+        # secret_id -> (value, fetched_at)
+        self._values: dict[str, tuple[dict, float]] = {}
+        self._refreshing: set[str] = set()
+        self._lock = threading.Lock()
+        self._fetch_lock = threading.Lock()
+
+    def _fetch(self, secret_id: str, newer_than: float) -> dict:
+        """
+        Fetch `secret_id` unless a value fetched after `newer_than`
+        (monotonic time) is already cached: concurrent callers that
+        all found the value expired share one Secrets Manager call.
+        """
+        with self._fetch_lock:
+            with self._lock:
+                cached = self._values.get(secret_id)
+            if cached is not None and cached[1] > newer_than:
+                return cached[0]
+
+            if self._manager is None:
+                self._manager = self._manager_factory(region=self.region)
+            started_at = time.monotonic()
+            value = self._manager.get_secret(secret_id)
+
+            with self._lock:
+                self._values[secret_id] = (value, started_at)
+        logger.info("Secret fetched | secret_id=%s", secret_id)
+        return value
+
+    def _refresh_in_background(self, secret_id: str, requested_at: float) -> None:
+        try:
+            self._fetch(secret_id, requested_at)
+        except Exception:
+            logger.warning(
+                "Background secret refresh failed, keeping the cached value | secret_id=%s",
+                secret_id,
+                exc_info=True,
+            )
+        finally:
+            with self._lock:
+                self._refreshing.discard(secret_id)
+
+    def get(self, secret_id: str) -> dict:
+        with self._lock:
+            cached = self._values.get(secret_id)
+
+            if cached is not None:
+                value, fetched_at = cached
+                age = time.monotonic() - fetched_at
+
+                if age < self.ttl_s:
+                    if (
+                        age >= self.ttl_s - self.refresh_ahead_s
+                        and secret_id not in self._refreshing
+                    ):
+                        self._refreshing.add(secret_id)
+                        threading.Thread(
+                            target=self._refresh_in_background,
+                            args=(secret_id, time.monotonic()),
+                            name=f"secret-refresh-{secret_id}",
+                            daemon=True,
+                        ).start()
+                    return value
+
+        return self._fetch(secret_id, time.monotonic() - self.ttl_s)
+
+    def refresh(self, secret_id: str) -> dict:
+        return self._fetch(secret_id, time.monotonic())
@@ -1,14 +1,32 @@
 import os
+import threading
 
-from .base import SettingsError
+from .base import BaseSettings, SettingsError
 from .dev import DevSettings
 from .prod import ProdSettings
 from .staging import StagingSettings
 
+# One settings object per APP_ENV and process
+_settings: dict[str | None, BaseSettings] = {}
+_settings_lock = threading.Lock()
 
-def load_settings():
+
+def load_settings() -> BaseSettings:
+    """
+    Settings of the current APP_ENV, created on first use and then
+    reused (secrets are cached and refreshed by the settings object).
+    """
     env = os.getenv("APP_ENV")
 
+    with _settings_lock:
+        settings = _settings.get(env)
+        if settings is None:
+            settings = _create_settings(env)
+            _settings[env] = settings
+        return settings
+
+
+def _create_settings(env: str | None) -> BaseSettings:
     if env == "ci":
         return DevSettings(skip_secrets=True)
 
@@ -1,9 +1,14 @@
 import logging
 import os
 
+from core.env import env_int
 from core.errors import SettingsError
 from core.logging_config import setup_logging
-from core.secrets import SecretsManager
+from core.secrets import (
+    DEFAULT_SECRET_REFRESH_AHEAD_S,
+    DEFAULT_SECRET_TTL_S,
+    SecretCache,
+)
 
 # -------------------------------------------------------------------
 # Logging
@@ -11,6 +16,15 @@ from core.secrets import SecretsManager
 setup_logging()
 logger = logging.getLogger(__name__)
 
+# DB "secret" of CI runs (no Secrets Manager)
+CI_DB_SECRET = {
+    "host": "localhost",
+    "port": 5432,
+    "dbname": "dummy",
+    "username": "dummy",
+    "password": "dummy",
+}
+
 
 def require_env(name: str) -> str:
     value = os.getenv(name)
@@ -24,32 +38,82 @@ def require_env(name: str) -> str:
 class BaseSettings:
     """
     Base configuration shared by all environments.
+
+    DB credentials are read through a TTL cache of the Secrets Manager
+    secret (SECRET_TTL_S, SECRET_REFRESH_AHEAD_S), so a long-lived
+    settings object picks up rotated credentials.
     """
 
     def __init__(self, skip_secrets: bool = False):
         # Environment
         self.APP_ENV = require_env("APP_ENV")
 
+        self._secrets: SecretCache | None = None
+
         if skip_secrets:
             logger.info("Running in CI mode: Secrets Manager disabled")
-            self.DB_HOST = "localhost"
-            self.DB_PORT = 5432
-            self.DB_NAME = "dummy"
-            self.DB_USER = "dummy"
-            self.DB_PASSWORD = "dummy"
             return
 
         # Secrets Manager
         self.DB_SECRET_ID = require_env("DB_SECRET_ID")
         self.AWS_REGION = os.getenv("AWS_REGION")
 
-        # Load DB credentials from Secrets Manager
-        secrets = SecretsManager(region=self.AWS_REGION)
-        db_secret = secrets.get_secret(self.DB_SECRET_ID)
+        self._secrets = SecretCache(
+            region=self.AWS_REGION,
+            ttl_s=env_int("SECRET_TTL_S", DEFAULT_SECRET_TTL_S),
+            refresh_ahead_s=env_int(
+                "SECRET_REFRESH_AHEAD_S", DEFAULT_SECRET_REFRESH_AHEAD_S
+            ),
+        )
+
+        # Fail at startup when the DB secret cannot be read
+        self._db_secret()
+
+    def _db_secret(self) -> dict:
+        if self._secrets is None:
+            return CI_DB_SECRET
+        return self._secrets.get(self.DB_SECRET_ID)
+
+    def refresh_secrets(self) -> None:
+        """
+        Re-fetch the DB secret now (the database rejected the cached
+        credentials, e.g. after a rotation).
+        """
+        if self._secrets is not None:
+            self._secrets.refresh(self.DB_SECRET_ID)
+
+    def db_credentials(self) -> dict:
+        """
+        Connection parameters from a single read of the DB secret, so
+        user and password always come from the same secret version
+        (the DB_* properties each read it again).
+        """
+        secret = self._db_secret()
+        return {
+            "host": secret["host"],
+            "port": secret.get("port", 5432),
+            "database": secret["dbname"],
+            "user": secret["username"],
+            "password": secret["password"],
+        }
+
+    # Map secret fields → settings
+    @property
+    def DB_HOST(self) -> str:
+        return self._db_secret()["host"]
+
+    @property
+    def DB_PORT(self) -> int:
+        return self._db_secret().get("port", 5432)
+
+    @property
+    def DB_NAME(self) -> str:
+        return self._db_secret()["dbname"]
+
+    @property
+    def DB_USER(self) -> str:
+        return self._db_secret()["username"]
 
-        # Map secret fields → settings
-        self.DB_HOST = db_secret["host"]
-        self.DB_PORT = db_secret.get("port", 5432)
-        self.DB_NAME = db_secret["dbname"]
-        self.DB_USER = db_secret["username"]
-        self.DB_PASSWORD = db_secret["password"]
+    @property
+    def DB_PASSWORD(self) -> str:
+        return self._db_secret()["password"]
@@ -0,0 +1,171 @@
+import fcntl
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+
+from core.env import env_int
+from data_loader.spool import SpooledInput
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+
+DEFAULT_CACHE_MAX_MB = 10 * 1024
+
+# Entries are locked through a fixed set of lock files (by digest prefix),
+# so lock files never have to be cleaned up
+LOCK_STRIPES = 256
+
+ENTRY_SUFFIX = ".bin"
+
+TMP_PREFIX = ".tmp-"
+
+# Partial writes older than this were left by a killed process
+STALE_TMP_S = 3600
+
+
+def input_cache() -> "InputCache | None":
+    """
+    Cache configured through INPUT_CACHE_DIR / INPUT_CACHE_MAX_MB,
+    or None when caching is off (default).
+    """
+    directory = os.getenv("INPUT_CACHE_DIR")
+    if not directory:
+        return None
+
+    return InputCache(
+        directory,
+        max_bytes=env_int("INPUT_CACHE_MAX_MB", DEFAULT_CACHE_MAX_MB) * MB,
+    )
+
+
+class InputCache:
+    """
+    Local copies of S3 inputs, addressed by (bucket, key, ETag).
+
+    A new ETag means new content, so stale entries are never served;
+    they simply age out. Entries are least-recently-used evicted once
+    the directory exceeds `max_bytes`.
+
+    Safe across processes on one host:
+    - entries appear atomically (written aside, then renamed)
+    - one process downloads a given object, the others wait for it
+    - eviction runs under a directory-wide lock
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+        os.makedirs(os.path.join(directory, "locks"), exist_ok=True)
+
+    def path(self, digest: str) -> str:
+        return os.path.join(self.directory, digest + ENTRY_SUFFIX)
+
+    @staticmethod
+    def digest(bucket: str, key: str, etag: str) -> str:
+        return hashlib.sha256(f"{bucket}\0{key}\0{etag}".encode()).hexdigest()
+
+    @contextmanager
+    def _lock(self, name: str):
+        with open(os.path.join(self.directory, "locks", name), "a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def get(self, digest: str) -> SpooledInput | None:
+        """
+        Open an entry (marking it recently used), or None on a miss.
+        """
+        path = self.path(digest)
+        try:
+            spool = SpooledInput.from_file(path)
+        except FileNotFoundError:
+            return None
+
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            # Evicted since it was opened: the open file stays readable
+            pass
+
+        return spool
+
+    def put(self, digest: str, spool: SpooledInput) -> None:
+        """
+        Store a downloaded input, then evict down to the size limit.
+        Inputs larger than the whole cache are not stored.
+        """
+        if spool.size > self.max_bytes:
+            return
+
+        fd, tmp = tempfile.mkstemp(prefix=TMP_PREFIX, dir=self.directory)
+        os.close(fd)
+        os.unlink(tmp)
+
+        try:
+            spool.save(tmp)
+            os.replace(tmp, self.path(digest))
+        except OSError as e:
+            logger.warning("Could not cache input %s: %s", digest, e)
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            return
+
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Delete least recently used entries until the cache fits, and
+        partial writes abandoned by killed processes.
+        Processes still reading a deleted entry keep their open file.
+        """
+        with self._lock("evict"):
+            stale_before = time.time() - STALE_TMP_S
+            entries = []
+            for entry in os.scandir(self.directory):
+                is_tmp = entry.name.startswith(TMP_PREFIX)
+                if not is_tmp and not entry.name.endswith(ENTRY_SUFFIX):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+
+                if not is_tmp:
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                elif stat.st_mtime < stale_before:
+                    try:
+                        os.unlink(entry.path)
+                    except FileNotFoundError:
+                        pass
+                    logger.info("Deleted abandoned partial input %s", entry.name)
+
+            total = sum(size for _, size, _ in entries)
+
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+                logger.info("Evicted cached input %s", os.path.basename(path))
+
+    @contextmanager
+    def filling(self, digest: str):
+        """
+        Serialize downloads of one entry across processes: whoever holds
+        this lock downloads; the others find the entry once it is released.
+        """
+        with self._lock(f"{int(digest[:8], 16) % LOCK_STRIPES}.lock"):
+            yield
@@ -1,12 +1,231 @@
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import boto3
+from botocore.exceptions import (
+    ConnectionError,
+    IncompleteReadError,
+    ReadTimeoutError,
+    ResponseStreamingError,
+)
+
+from core.env import env_int
+from data_loader.input_cache import input_cache
+from data_loader.spool import SpooledInput
+
+logger = logging.getLogger(__name__)
 
 s3 = boto3.client("s3")
 
+MB = 1024 * 1024
+
+# Objects above this size are spooled to a temp file instead of RAM
+DEFAULT_SPOOL_THRESHOLD_MB = 64
+
+# Objects above this size are fetched as concurrent byte ranges
+DEFAULT_PARALLEL_THRESHOLD_MB = 128
+DEFAULT_PART_SIZE_MB = 16
+DEFAULT_MAX_WORKERS = 8
+
+# Size of the reads pulled from the S3 response stream
+DOWNLOAD_CHUNK_SIZE = 8 * MB
+
+# A dropped stream only costs one part, so parts are retried individually
+PART_ATTEMPTS = 3
+RETRYABLE_ERRORS = (
+    ConnectionError,
+    IncompleteReadError,
+    ReadTimeoutError,
+    ResponseStreamingError,
+)
+
+
 def parse_s3_path(path: str):
     parts = path.replace("s3://", "").split("/", 1)
     return parts[0], parts[1]
 
 def download_file_bytes(s3_path: str) -> bytes:
+    with download_file(s3_path) as spool:
+        return spool.open().read()
+
+
+def download_file(s3_path: str, client=None) -> SpooledInput:
+    """
+    Stream an S3 object into a SpooledInput.
+
+    The body is copied chunk by chunk, so the object is never held
+    as one `bytes` value; objects larger than S3_SPOOL_THRESHOLD_MB
+    go straight to a temp file (in DQ_SPOOL_DIR, if set).
+
+    Objects larger than S3_PARALLEL_THRESHOLD_MB are fetched as
+    S3_PART_SIZE_MB byte ranges by S3_MAX_WORKERS threads.
+
+    With INPUT_CACHE_DIR set, an object whose ETag is already cached
+    locally costs only the HEAD request.
+
+    The spool carries the ETag / VersionId of the object that was read.
+    """
+    client = client or s3
     bucket, key = parse_s3_path(s3_path)
-    obj = s3.get_object(Bucket = bucket, Key = key)
-    return obj["Body"].read()
+    head = client.head_object(Bucket=bucket, Key=key)
+
+    cache = input_cache()
+    if cache is None:
+        return _pinned(_download(client, bucket, key, head), head)
+
+    digest = cache.digest(bucket, key, head["ETag"])
+
+    with cache.filling(digest):
+        spool = cache.get(digest)
+        if spool is not None:
+            logger.info("Input cache hit | key=%s size=%d", key, spool.size)
+            return _pinned(spool, head)
+
+        spool = _download(client, bucket, key, head)
+        cache.put(digest, spool)
+
+    return _pinned(spool, head)
+
+
+def _pinned(spool: SpooledInput, head: dict) -> SpooledInput:
+    # The object version that was read (e.g. to archive that one later)
+    spool.etag = head["ETag"]
+    spool.version_id = head.get("VersionId")
+    return spool
+
+
+def _download(client, bucket: str, key: str, head: dict) -> SpooledInput:
+    size = head["ContentLength"]
+
+    spool = SpooledInput(
+        size=size,
+        threshold=env_int("S3_SPOOL_THRESHOLD_MB", DEFAULT_SPOOL_THRESHOLD_MB) * MB,
+        spool_dir=os.getenv("DQ_SPOOL_DIR"),
+    )
+
+    parallel_threshold = env_int(
+        "S3_PARALLEL_THRESHOLD_MB", DEFAULT_PARALLEL_THRESHOLD_MB
+    ) * MB
+
+    try:
+        if size > parallel_threshold:
+            download_ranges(
+                client=client,
+                bucket=bucket,
+                key=key,
+                etag=head["ETag"],
+                spool=spool,
+                part_size=env_int("S3_PART_SIZE_MB", DEFAULT_PART_SIZE_MB) * MB,
+                max_workers=env_int("S3_MAX_WORKERS", DEFAULT_MAX_WORKERS),
+            )
+        else:
+            _download_range(
+                client=client,
+                bucket=bucket,
+                key=key,
+                etag=head["ETag"],
+                spool=spool,
+                start=0,
+                end=size - 1,
+            )
+    except Exception:
+        spool.close()
+        raise
+
+    return spool
+
+
+def download_ranges(
+    *,
+    client,
+    bucket: str,
+    key: str,
+    etag: str,
+    spool: SpooledInput,
+    part_size: int,
+    max_workers: int,
+) -> None:
+    """
+    Fetch the object as concurrent byte ranges, each written
+    straight to its offset in the spool.
+    """
+    if part_size <= 0 or max_workers <= 0:
+        raise ValueError("part_size and max_workers must be positive")
+
+    ranges = [
+        (start, min(start + part_size, spool.size) - 1)
+        for start in range(0, spool.size, part_size)
+    ]
+
+    logger.info(
+        "Ranged download | key=%s size=%d parts=%d workers=%d",
+        key,
+        spool.size,
+        len(ranges),
+        max_workers,
+    )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(
+                _download_range,
+                client=client,
+                bucket=bucket,
+                key=key,
+                etag=etag,
+                spool=spool,
+                start=start,
+                end=end,
+            )
+            for start, end in ranges
+        ]
+
+        # Surface the first failure; remaining parts are cancelled
+        for future in futures:
+            try:
+                future.result()
+            except Exception:
+                for pending in futures:
+                    pending.cancel()
+                raise
+
+
+def _download_range(
+    *,
+    client,
+    bucket: str,
+    key: str,
+    etag: str,
+    spool: SpooledInput,
+    start: int,
+    end: int,
+) -> None:
+    if end < start:
+        return
+
+    for attempt in range(1, PART_ATTEMPTS + 1):
+        try:
+            # IfMatch fails the part if the object changed mid-download
+            obj = client.get_object(
+                Bucket=bucket,
+                Key=key,
+                Range=f"bytes={start}-{end}",
+                IfMatch=etag,
+            )
+
+            offset = start
+            for chunk in obj["Body"].iter_chunks(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                spool.write_at(offset, chunk)
+                offset += len(chunk)
+            return
+        except RETRYABLE_ERRORS:
+            if attempt == PART_ATTEMPTS:
+                raise
+            logger.warning(
+                "Retrying range | key=%s bytes=%d-%d attempt=%d",
+                key,
+                start,
+                end,
+                attempt,
+            )
@@ -26,14 +26,47 @@ def upload_bytes(
         ContentType=content_type,
     )
 
+def copy_object(
+    source_bucket: str,
+    source_key: str,
+    bucket: str,
+    key: str,
+    etag: str | None = None,
+    version_id: str | None = None,
+) -> None:
+    """
+    Server-side copy (multipart for large objects); no data passes
+    through this process.
+
+    `version_id` / `etag` pin the source to the object version that was
+    read: S3 fails the copy (PreconditionFailed) rather than copying an
+    object that was overwritten since.
+    """
+    copy_source = {"Bucket": source_bucket, "Key": source_key}
+    if version_id is not None:
+        copy_source["VersionId"] = version_id
+
+    s3.copy(
+        CopySource=copy_source,
+        Bucket=bucket,
+        Key=key,
+        ExtraArgs={"CopySourceIfMatch": etag} if etag is not None else None,
+    )
+
+def render_json(payload: dict) -> bytes:
+    """
+    The document upload_json stores for `payload`.
+    """
+    return json.dumps(
+        payload,
+        indent=2,
+        default=_json_default,
+    ).encode("utf-8")
+
 def upload_json(bucket: str, key: str, payload: dict) -> None:
     upload_bytes(
         bucket=bucket,
         key=key,
-        content=json.dumps(
-            payload,
-            indent=2,
-            default=_json_default,
-        ).encode("utf-8"),
+        content=render_json(payload),
         content_type="application/json",
     )
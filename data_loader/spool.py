@@ -0,0 +1,193 @@
+import io
+import mmap
+import os
+import shutil
+import tempfile
+import threading
+from io import BytesIO
+from typing import BinaryIO
+
+
+class MappedReader(io.RawIOBase):
+    """
+    Seekable, read-only file object over a memory map.
+    (mmap itself is not a full file object: zipfile/openpyxl need `seekable()`.)
+    """
+
+    def __init__(self, view: mmap.mmap):
+        self._view = view
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        self._pos = max(offset, 0)
+        return self._pos
+
+    def read(self, size: int = -1) -> bytes:
+        end = len(self._view) if size is None or size < 0 else self._pos + size
+        data = self._view[self._pos:end]
+        self._pos += len(data)
+        return data
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+class SpooledInput:
+    """
+    Downloaded dataset held either in memory (small objects)
+    or in a temporary file on disk (objects above `threshold` bytes).
+
+    Parsers get a read-only view through `open()`:
+    - in memory: a BytesIO sharing the downloaded bytes
+    - on disk:   a reader over a read-only memory map of the temp file
+
+    Neither path copies the payload. `close()` releases the buffer,
+    unmaps every view and deletes the temp file.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        threshold: int,
+        spool_dir: str | None = None,
+    ):
+        self.size = size
+        self.on_disk = size > threshold
+
+        # S3 object the payload was downloaded from (download_file)
+        self.etag: str | None = None
+        self.version_id: str | None = None
+
+        self._lock = threading.Lock()
+        self._parts: dict[int, bytes] = {}
+        self._data: bytes | None = None
+        self._views: list[mmap.mmap] = []
+        self._file = None
+
+        if self.on_disk:
+            self._file = tempfile.NamedTemporaryFile(
+                prefix="dq-input-",
+                dir=spool_dir,
+            )
+            self._file.truncate(size)
+
+    @classmethod
+    def from_file(cls, path: str) -> "SpooledInput":
+        """
+        Read-only spool over an existing file (e.g. an input cache entry).
+        The file is opened here, so it stays readable even if it is
+        deleted afterwards.
+        """
+        file = open(path, "rb")
+        size = os.fstat(file.fileno()).st_size
+
+        spool = cls(size=size, threshold=size)
+        if size:
+            spool.on_disk = True
+            spool._file = file
+        else:
+            # Empty objects cannot be memory-mapped
+            file.close()
+
+        return spool
+
+    @property
+    def path(self) -> str | None:
+        """
+        File holding the payload when spooled on disk, else None.
+        """
+        if not self.on_disk or self._file is None:
+            return None
+        return self._file.name
+
+    def save(self, path: str) -> None:
+        """
+        Persist the payload at `path`: a hard link to the temp file when
+        spooled on disk (no copy on the same filesystem), else a write.
+        """
+        if not self.on_disk:
+            with open(path, "wb") as f:
+                f.write(self.open().getbuffer())
+            return
+
+        with self._lock:
+            self._file.flush()
+
+        try:
+            os.link(self._file.name, path)
+        except OSError:
+            shutil.copyfile(self._file.name, path)
+
+    def write_at(self, offset: int, chunk: bytes) -> None:
+        """
+        Store `chunk` at `offset`. Safe to call from several threads.
+        """
+        if not self.on_disk:
+            with self._lock:
+                self._parts[offset] = chunk
+            return
+
+        with self._lock:
+            self._file.seek(offset)
+            self._file.write(chunk)
+
+    def open(self) -> BinaryIO:
+        """
+        Return a fresh, independently positioned reader over the payload.
+        """
+        if not self.on_disk:
+            data = self._data
+            if data is None:
+                # Sheets running in threads open the input concurrently
+                with self._lock:
+                    if self._data is None:
+                        self._data = b"".join(
+                            self._parts[offset] for offset in sorted(self._parts)
+                        )
+                        self._parts = {}
+                    data = self._data
+            return BytesIO(data)
+
+        with self._lock:
+            self._file.flush()
+            view = mmap.mmap(
+                self._file.fileno(),
+                0,
+                access=mmap.ACCESS_READ,
+            )
+            self._views.append(view)
+
+        return MappedReader(view)
+
+    def close(self) -> None:
+        for view in self._views:
+            view.close()
+        self._views = []
+
+        self._parts = {}
+        self._data = None
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "SpooledInput":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,153 @@
+import json
+import logging
+from collections.abc import Iterable, Iterator
+from datetime import date, datetime
+
+from psycopg2.extras import Json, execute_values
+
+logger = logging.getLogger(__name__)
+
+# "copy": COPY ... FROM STDIN; "values": multi-row INSERT (execute_values)
+BULK_WRITE_METHODS = {"copy", "values"}
+
+# Rows per INSERT statement of the "values" method
+VALUES_PAGE_SIZE = 1000
+
+
+# -------------------------------------------------------------------
+# COPY text format
+# -------------------------------------------------------------------
+def _copy_value(value) -> str:
+    """
+    One field in COPY text format (tab separated, \\N for NULL).
+    """
+    if value is None:
+        return r"\N"
+
+    if isinstance(value, Json):
+        text = value.dumps(value.adapted)
+    elif isinstance(value, bool):
+        return "t" if value else "f"
+    elif isinstance(value, datetime | date):
+        text = value.isoformat()
+    elif isinstance(value, dict | list):
+        text = json.dumps(value)
+    else:
+        text = str(value)
+
+    return (
+        text.replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+class _CopyStream:
+    """
+    File-like view of `rows` in COPY text format, rendered as
+    copy_expert reads it (the rows are not formatted all at once).
+    """
+
+    def __init__(self, rows: Iterable[tuple]):
+        self._lines: Iterator[str] = (
+            "\t".join(_copy_value(value) for value in row) + "\n"
+            for row in rows
+        )
+        self._buffer = ""
+
+    def read(self, size: int = -1) -> str:
+        parts = [self._buffer]
+        length = len(self._buffer)
+
+        while size < 0 or length < size:
+            line = next(self._lines, None)
+            if line is None:
+                break
+            parts.append(line)
+            length += len(line)
+
+        text = "".join(parts)
+        if size < 0:
+            size = len(text)
+
+        self._buffer = text[size:]
+        return text[:size]
+
+
+def copy_rows(cur, table: str, columns: tuple[str, ...], rows: list[tuple]) -> None:
+    """
+    COPY `rows` into `table` (`columns`, in order) through `cur`.
+    """
+    cur.copy_expert(
+        f"COPY {table} ({', '.join(columns)}) FROM STDIN",
+        _CopyStream(rows),
+    )
+
+
+def insert_rows(cur, table: str, columns: tuple[str, ...], rows: list[tuple]) -> None:
+    """
+    Multi-row INSERT of `rows` into `table` through `cur`.
+    """
+    execute_values(
+        cur,
+        f"INSERT INTO {table} ({', '.join(columns)}) VALUES %s",
+        rows,
+        page_size=VALUES_PAGE_SIZE,
+    )
+
+
+# -------------------------------------------------------------------
+# Bulk writer
+# -------------------------------------------------------------------
+class BulkWriter:
+    """
+    Result rows of one or more runs, buffered per table and written
+    with one COPY (or multi-row INSERTs) per table on `flush`.
+
+    Everything is written through the cursor given to `flush`, so the
+    rows are committed or rolled back with the rest of its transaction.
+    The "copy" method falls back to "values" when the cursor has no
+    copy_expert.
+    """
+
+    def __init__(self, method: str = "copy"):
+        if method not in BULK_WRITE_METHODS:
+            raise ValueError(
+                f"Unsupported bulk write method '{method}', "
+                f"expected one of {sorted(BULK_WRITE_METHODS)}"
+            )
+
+        self.method = method
+        # table -> (columns, rows), flushed in order of first use
+        self.tables: dict[str, tuple[tuple[str, ...], list[tuple]]] = {}
+
+    def add(self, table: str, columns: tuple[str, ...], rows: Iterable[tuple]) -> None:
+        buffered_columns, buffered = self.tables.setdefault(table, (columns, []))
+        if buffered_columns != columns:
+            raise ValueError(
+                f"Rows for {table} must have columns {buffered_columns}, got {columns}"
+            )
+        buffered.extend(rows)
+
+    def flush(self, cur) -> None:
+        method = self.method
+        if method == "copy" and not hasattr(cur, "copy_expert"):
+            logger.info("Cursor does not support COPY, using multi-row INSERTs")
+            method = "values"
+
+        write = copy_rows if method == "copy" else insert_rows
+
+        for table, (columns, rows) in self.tables.items():
+            if not rows:
+                continue
+
+            write(cur, table, columns, rows)
+            logger.info(
+                "Persisted %d rows | table=%s method=%s",
+                len(rows),
+                table,
+                method,
+            )
+
+        self.tables.clear()
@@ -1,51 +1,270 @@
+import logging
+import os
+import threading
+import time
 from contextlib import contextmanager
 
 import psycopg2
+import psycopg2.extensions
 
+from core.env import env_int
 from core.settings import load_settings
 
+logger = logging.getLogger(__name__)
+
+# Unqualified table names resolve to the dq schema
+SEARCH_PATH = "dq, public"
+
+DEFAULT_POOL_MAX_SIZE = 4
+DEFAULT_POOL_TIMEOUT_S = 30
+# Idle connections older than this are pinged before reuse
+DEFAULT_POOL_CHECK_AFTER_S = 30
+DEFAULT_POOL_MAX_LIFETIME_S = 3600
+
+# invalid_password, invalid_authorization_specification
+AUTH_FAILURE_CODES = {"28P01", "28000"}
+
+
+class PooledConnection(psycopg2.extensions.connection):
+    """
+    psycopg2 connection that remembers its age.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.created_at = time.monotonic()
+        self.released_at = self.created_at
+
+
+def _is_auth_failure(exc: psycopg2.OperationalError) -> bool:
+    # libpq reports rejected logins without a SQLSTATE
+    return exc.pgcode in AUTH_FAILURE_CODES or "authentication failed" in str(exc)
+
 
 def get_connection():
     """
     Create and return a new PostgreSQL connection.
-    Sets search_path so unqualified table names resolve correctly.
+    search_path is part of the startup packet (no extra statement).
+
+    Credentials come from the cached DB secret; when the database
+    rejects them (rotated secret) the secret is re-fetched and the
+    connection retried once.
     """
     settings = load_settings()
 
-    conn = psycopg2.connect(
-        host=settings.DB_HOST,
-        database=settings.DB_NAME,
-        user=settings.DB_USER,
-        password=settings.DB_PASSWORD,
-        port=settings.DB_PORT,
+    try:
+        return _connect(settings)
+    except psycopg2.OperationalError as exc:
+        if not _is_auth_failure(exc):
+            raise
+
+        logger.warning("Database rejected the cached credentials, re-fetching the secret")
+        settings.refresh_secrets()
+        return _connect(settings)
+
+
+def _connect(settings):
+    return psycopg2.connect(
+        **settings.db_credentials(),
         connect_timeout=5,
+        options=f"-c search_path={SEARCH_PATH.replace(' ', '')}",
+        connection_factory=PooledConnection,
     )
 
-    # Ensure dq schema is used by default
-    with conn.cursor() as cur:
-        cur.execute("SET search_path TO dq, public")
 
-    return conn
+# -------------------------------------------------------------------
+# Connection pool
+# -------------------------------------------------------------------
+class ConnectionPool:
+    """
+    Process-wide pool of at most `max_size` connections.
+
+    - idle connections are reused most-recently-released first
+    - connections idle longer than `check_after` seconds are pinged
+      (SELECT 1) before reuse, and replaced when the ping fails
+    - connections older than `max_lifetime` seconds are closed on release
+    - `acquire` waits up to `timeout` seconds when every connection is
+      in use
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        *,
+        timeout: float = DEFAULT_POOL_TIMEOUT_S,
+        check_after: float = DEFAULT_POOL_CHECK_AFTER_S,
+        max_lifetime: float = DEFAULT_POOL_MAX_LIFETIME_S,
+        connect=get_connection,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.max_size = max_size
+        self.timeout = timeout
+        self.check_after = check_after
+        self.max_lifetime = max_lifetime
+        self._connect = connect
+
+        self._idle: list = []
+        self._size = 0
+        self._condition = threading.Condition()
+        self._closed = False
+
+    @staticmethod
+    def _healthy(conn) -> bool:
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def _discard(self, conn) -> None:
+        try:
+            conn.close()
+        except psycopg2.Error:
+            pass
+
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+
+    def acquire(self):
+        deadline = time.monotonic() + self.timeout
+
+        while True:
+            with self._condition:
+                if self._closed:
+                    raise ValueError("Connection pool is closed")
+
+                conn = self._idle.pop() if self._idle else None
+
+                if conn is None and self._size < self.max_size:
+                    self._size += 1
+                elif conn is None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(
+                            f"No database connection available within {self.timeout}s "
+                            f"(pool size {self.max_size})"
+                        )
+                    self._condition.wait(remaining)
+                    continue
+
+            if conn is None:
+                # A slot was reserved: connect outside the lock
+                try:
+                    return self._connect()
+                except BaseException:
+                    with self._condition:
+                        self._size -= 1
+                        self._condition.notify()
+                    raise
+
+            idle = time.monotonic() - getattr(conn, "released_at", 0)
+            if conn.closed or (idle > self.check_after and not self._healthy(conn)):
+                logger.warning("Dropping broken pooled database connection")
+                self._discard(conn)
+                continue
+
+            return conn
+
+    def release(self, conn) -> None:
+        """
+        Return a connection; it must not be inside a transaction.
+        Broken or expired connections are closed instead.
+        """
+        expired = (
+            time.monotonic() - getattr(conn, "created_at", 0) > self.max_lifetime
+        )
+        if self._closed or conn.closed or expired:
+            self._discard(conn)
+            return
+
+        if conn.get_transaction_status() != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+            try:
+                conn.rollback()
+            except psycopg2.Error:
+                self._discard(conn)
+                return
+
+        conn.released_at = time.monotonic()
+        with self._condition:
+            self._idle.append(conn)
+            self._condition.notify()
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+
+        for conn in idle:
+            self._discard(conn)
+
+
+_pool: ConnectionPool | None = None
+_pool_pid: int | None = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    """
+    The process-wide pool, configured from DB_POOL_* on first use.
+    A forked child never reuses its parent's connections.
+    """
+    global _pool, _pool_pid
+
+    with _pool_lock:
+        if _pool is None or _pool_pid != os.getpid():
+            _pool = ConnectionPool(
+                env_int("DB_POOL_MAX_SIZE", DEFAULT_POOL_MAX_SIZE),
+                timeout=env_int("DB_POOL_TIMEOUT_S", DEFAULT_POOL_TIMEOUT_S),
+                check_after=env_int("DB_POOL_CHECK_AFTER_S", DEFAULT_POOL_CHECK_AFTER_S),
+                max_lifetime=env_int("DB_POOL_MAX_LIFETIME_S", DEFAULT_POOL_MAX_LIFETIME_S),
+            )
+            _pool_pid = os.getpid()
+        return _pool
+
+
+def close_pool() -> None:
+    """
+    Close every idle pooled connection (e.g. at worker shutdown).
+    """
+    global _pool
+
+    with _pool_lock:
+        pool, _pool = _pool, None
+
+    if pool is not None:
+        pool.close()
 
 
 @contextmanager
 def get_db_cursor():
     """
-    Context manager that provides a transactional cursor.
+    Context manager that provides a transactional cursor
+    on a pooled connection.
 
     Automatically commits on success,
     rolls back on failure,
-    and closes connection safely.
+    and returns the connection to the pool
+    (or drops it when it broke).
     """
-    conn = get_connection()
+    pool = get_pool()
+    conn = pool.acquire()
     cur = conn.cursor()
 
     try:
         yield cur
         conn.commit()
     except Exception:
-        conn.rollback()
+        if not conn.closed:
+            try:
+                conn.rollback()
+            except psycopg2.Error:
+                pass
         raise
     finally:
         cur.close()
-        conn.close()
+        pool.release(conn)
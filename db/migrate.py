@@ -0,0 +1,166 @@
+"""
+Apply the schema migrations in db/migrations/ that the database has not
+seen yet, in version order, each in its own transaction.
+
+    python -m db.migrate            # apply pending migrations
+    python -m db.migrate --status   # list applied / pending migrations
+"""
+import argparse
+import hashlib
+import logging
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+from core.logging_config import setup_logging
+from db.connection import get_db_cursor
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_DIR = Path(__file__).with_name("migrations")
+
+# NNNN_description.sql
+MIGRATION_FILE = re.compile(r"^(\d{4})_(\w+)\.sql$")
+
+# pg_advisory_xact_lock key: one migrating process at a time
+MIGRATION_LOCK_ID = 0x4451_4D49_4752  # "DQMIGR"
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    sql: str
+
+    @property
+    def checksum(self) -> str:
+        return hashlib.sha256(self.sql.encode("utf-8")).hexdigest()
+
+
+def load_migrations(directory: Path = MIGRATIONS_DIR) -> list[Migration]:
+    """
+    Migrations in `directory`, by version.
+    """
+    migrations = {}
+
+    for path in sorted(directory.glob("*.sql")):
+        match = MIGRATION_FILE.match(path.name)
+        if not match:
+            raise ValueError(f"Migration file name must look like 0001_name.sql, got '{path.name}'")
+
+        version = int(match.group(1))
+        if version in migrations:
+            raise ValueError(f"Duplicate migration version {version}: '{path.name}'")
+
+        migrations[version] = Migration(version, match.group(2), path.read_text(encoding="utf-8"))
+
+    return [migrations[version] for version in sorted(migrations)]
+
+
+def _ensure_history(cur) -> None:
+    cur.execute(
+        """
+        CREATE SCHEMA IF NOT EXISTS dq;
+
+        CREATE TABLE IF NOT EXISTS dq.schema_migrations (
+            version INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            checksum TEXT NOT NULL,
+            applied_at TIMESTAMP NOT NULL DEFAULT (now() AT TIME ZONE 'UTC')
+        )
+        """
+    )
+
+
+def applied_migrations(cur) -> dict[int, str]:
+    """
+    {version: checksum} of the migrations already applied.
+    """
+    _ensure_history(cur)
+    cur.execute("SELECT version, checksum FROM dq.schema_migrations")
+    return dict(cur.fetchall())
+
+
+def _lock(cur) -> None:
+    # Held until the transaction ends
+    cur.execute("SELECT pg_advisory_xact_lock(%s)", (MIGRATION_LOCK_ID,))
+
+
+def _check_unchanged(migrations: list[Migration], applied: dict[int, str]) -> None:
+    for migration in migrations:
+        checksum = applied.get(migration.version)
+        if checksum is not None and checksum != migration.checksum:
+            raise ValueError(
+                f"Migration {migration.version:04d}_{migration.name} was changed "
+                f"after it was applied; add a new migration instead"
+            )
+
+
+def migrate(
+    migrations: list[Migration] | None = None,
+    cursor=get_db_cursor,
+) -> list[Migration]:
+    """
+    Apply pending migrations. Each one runs in its own transaction
+    together with its schema_migrations row, under an advisory lock,
+    so concurrent deployments apply it once. Returns those applied.
+    """
+    migrations = load_migrations() if migrations is None else migrations
+
+    with cursor() as cur:
+        _lock(cur)
+        _check_unchanged(migrations, applied_migrations(cur))
+
+    done = []
+    for migration in migrations:
+        with cursor() as cur:
+            _lock(cur)
+
+            # Re-read under the lock: another process may have applied it
+            if migration.version in applied_migrations(cur):
+                continue
+
+            logger.info("Applying migration %04d_%s", migration.version, migration.name)
+            cur.execute(migration.sql)
+            cur.execute(
+                """
+                INSERT INTO dq.schema_migrations (version, name, checksum)
+                VALUES (%s, %s, %s)
+                """,
+                (migration.version, migration.name, migration.checksum),
+            )
+
+        done.append(migration)
+
+    logger.info("Schema up to date | applied=%d", len(done))
+    return done
+
+
+def main() -> None:
+    setup_logging()
+
+    parser = argparse.ArgumentParser(description="Apply dq schema migrations")
+    parser.add_argument(
+        "--status",
+        action="store_true",
+        help="List applied and pending migrations without applying any",
+    )
+    args = parser.parse_args()
+
+    if not args.status:
+        migrate()
+        return
+
+    migrations = load_migrations()
+    with get_db_cursor() as cur:
+        _lock(cur)
+        applied = applied_migrations(cur)
+    _check_unchanged(migrations, applied)
+
+    for migration in migrations:
+        state = "applied" if migration.version in applied else "pending"
+        print(f"{migration.version:04d}_{migration.name}: {state}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,6 @@
+-- Baseline: the schema as it was before managed migrations (idempotent,
+-- so databases created from the old db/schema.sql adopt it unchanged)
+
 CREATE SCHEMA IF NOT EXISTS dq;
 
 CREATE TABLE IF NOT EXISTS dq.structural_validation_results (
@@ -30,9 +33,23 @@ CREATE TABLE IF NOT EXISTS dq.validation_runs (
     null_ratio NUMERIC,
     duplicate_ratio NUMERIC,
     schema_changed BOOLEAN,
-    invalid_row_count INTEGER
+    invalid_row_count INTEGER,
+    -- Approximate validation (sampling / sketches): quality_score bounds
+    approximate BOOLEAN NOT NULL DEFAULT FALSE,
+    sample_rows BIGINT,
+    quality_score_lower NUMERIC,
+    quality_score_upper NUMERIC,
+    -- Fail-fast runs: rules not evaluated after a blocking failure
+    rules_skipped INTEGER NOT NULL DEFAULT 0
 );
 
+ALTER TABLE dq.validation_runs
+    ADD COLUMN IF NOT EXISTS approximate BOOLEAN NOT NULL DEFAULT FALSE,
+    ADD COLUMN IF NOT EXISTS sample_rows BIGINT,
+    ADD COLUMN IF NOT EXISTS quality_score_lower NUMERIC,
+    ADD COLUMN IF NOT EXISTS quality_score_upper NUMERIC,
+    ADD COLUMN IF NOT EXISTS rules_skipped INTEGER NOT NULL DEFAULT 0;
+
 CREATE TABLE IF NOT EXISTS dq.validation_rule_results (
     id BIGSERIAL PRIMARY KEY,
     run_id UUID NOT NULL,
@@ -41,7 +58,40 @@ CREATE TABLE IF NOT EXISTS dq.validation_rule_results (
     expectation_type TEXT NOT NULL,
     column_name TEXT,
     success BOOLEAN NOT NULL,
-    unexpected_count INTEGER
+    unexpected_count INTEGER,
+    skipped BOOLEAN NOT NULL DEFAULT FALSE,
+    -- Rule history for cost-based scheduling
+    template_id TEXT,
+    sheet_name TEXT,
+    duration_ms NUMERIC
+);
+
+ALTER TABLE dq.validation_rule_results
+    ADD COLUMN IF NOT EXISTS skipped BOOLEAN NOT NULL DEFAULT FALSE,
+    ADD COLUMN IF NOT EXISTS template_id TEXT,
+    ADD COLUMN IF NOT EXISTS sheet_name TEXT,
+    ADD COLUMN IF NOT EXISTS duration_ms NUMERIC;
+
+CREATE INDEX IF NOT EXISTS validation_rule_results_template_idx
+    ON dq.validation_rule_results (template_id, validated_at);
+
+-- Incremental Iceberg validation: last validated snapshot per dataset/template
+CREATE TABLE IF NOT EXISTS dq.iceberg_validation_state (
+    dataset TEXT NOT NULL,
+    template_id TEXT NOT NULL,
+    snapshot_id BIGINT NOT NULL,
+    run_id UUID NOT NULL,
+    validated_at TIMESTAMP NOT NULL,
+    PRIMARY KEY (dataset, template_id)
+);
+
+-- Fingerprints of unique keys already validated (uniqueness across snapshots)
+CREATE TABLE IF NOT EXISTS dq.iceberg_key_index (
+    dataset TEXT NOT NULL,
+    template_id TEXT NOT NULL,
+    key_name TEXT NOT NULL,
+    key_hash BIGINT NOT NULL,
+    PRIMARY KEY (dataset, template_id, key_name, key_hash)
 );
 
 CREATE OR REPLACE VIEW dq.v_validation_runs AS
@@ -60,7 +110,12 @@ SELECT
     vr.duplicate_ratio,
     vr.schema_changed,
     vr.invalid_row_count,
-    vr.dataset AS input_dataset
+    vr.dataset AS input_dataset,
+    vr.approximate,
+    vr.sample_rows,
+    vr.quality_score_lower,
+    vr.quality_score_upper,
+    vr.rules_skipped
 FROM dq.validation_runs vr;
 
 CREATE OR REPLACE VIEW dq.v_validation_metrics AS
@@ -111,8 +166,10 @@ SELECT
     expectation_type,
     column_name,
     COUNT(*) FILTER (WHERE success)     AS passed_count,
-    COUNT(*) FILTER (WHERE NOT success) AS failed_count,
-    SUM(unexpected_count)               AS unexpected_total
+    COUNT(*) FILTER (WHERE NOT success AND NOT skipped) AS failed_count,
+    SUM(unexpected_count)               AS unexpected_total,
+    COUNT(*) FILTER (WHERE skipped)     AS skipped_count,
+    SUM(duration_ms)                    AS duration_ms_total
 FROM dq.validation_rule_results
 GROUP BY
     run_id,
@@ -0,0 +1,327 @@
+-- Monthly range partitions (on validated_at) for the three result tables,
+-- and (dataset, validated_at) indexes for dashboard queries.
+--
+-- Plain tables cannot be turned into partitioned ones: each table is
+-- renamed to *_legacy, recreated partitioned, refilled and dropped.
+-- Ids keep coming from the same sequences.
+
+-- Views are recreated on the new tables at the end
+DROP VIEW IF EXISTS dq.v_validation_runs;
+DROP VIEW IF EXISTS dq.v_validation_metrics;
+DROP VIEW IF EXISTS dq.v_validation_rule_stats;
+
+ALTER TABLE dq.structural_validation_results RENAME TO structural_validation_results_legacy;
+ALTER INDEX dq.structural_validation_results_pkey RENAME TO structural_validation_results_legacy_pkey;
+
+ALTER TABLE dq.validation_runs RENAME TO validation_runs_legacy;
+ALTER INDEX dq.validation_runs_pkey RENAME TO validation_runs_legacy_pkey;
+
+ALTER TABLE dq.validation_rule_results RENAME TO validation_rule_results_legacy;
+ALTER INDEX dq.validation_rule_results_pkey RENAME TO validation_rule_results_legacy_pkey;
+DROP INDEX IF EXISTS dq.validation_rule_results_template_idx;
+
+-- -------------------------------------------------------------------
+-- Partitioned tables (the partition key must be part of the primary key)
+-- -------------------------------------------------------------------
+CREATE TABLE dq.structural_validation_results (
+    id BIGINT NOT NULL DEFAULT nextval('dq.structural_validation_results_id_seq'),
+    run_id UUID NOT NULL,
+    dataset TEXT NOT NULL,
+    template_id TEXT NOT NULL,
+    template_version INTEGER NOT NULL,
+    sheet_name TEXT NOT NULL,
+    passed BOOLEAN NOT NULL,
+    error_count INTEGER NOT NULL,
+    warning_count INTEGER NOT NULL,
+    errors JSONB NOT NULL,
+    warnings JSONB NOT NULL,
+    validated_at TIMESTAMP NOT NULL,
+    PRIMARY KEY (id, validated_at)
+) PARTITION BY RANGE (validated_at);
+
+CREATE TABLE dq.validation_runs (
+    id BIGINT NOT NULL DEFAULT nextval('dq.validation_runs_id_seq'),
+    run_id UUID NOT NULL,
+    dataset TEXT NOT NULL,
+    success BOOLEAN NOT NULL,
+    validated_at TIMESTAMP NOT NULL,
+    row_count INTEGER,
+    validation_duration_ms INTEGER,
+    rules_total INTEGER,
+    rules_passed INTEGER,
+    rules_failed INTEGER,
+    quality_score NUMERIC,
+    null_ratio NUMERIC,
+    duplicate_ratio NUMERIC,
+    schema_changed BOOLEAN,
+    invalid_row_count INTEGER,
+    approximate BOOLEAN NOT NULL DEFAULT FALSE,
+    sample_rows BIGINT,
+    quality_score_lower NUMERIC,
+    quality_score_upper NUMERIC,
+    rules_skipped INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (id, validated_at)
+) PARTITION BY RANGE (validated_at);
+
+CREATE TABLE dq.validation_rule_results (
+    id BIGINT NOT NULL DEFAULT nextval('dq.validation_rule_results_id_seq'),
+    run_id UUID NOT NULL,
+    validated_at TIMESTAMP NOT NULL,
+    dataset TEXT NOT NULL,
+    expectation_type TEXT NOT NULL,
+    column_name TEXT,
+    success BOOLEAN NOT NULL,
+    unexpected_count INTEGER,
+    skipped BOOLEAN NOT NULL DEFAULT FALSE,
+    template_id TEXT,
+    sheet_name TEXT,
+    duration_ms NUMERIC,
+    PRIMARY KEY (id, validated_at)
+) PARTITION BY RANGE (validated_at);
+
+ALTER SEQUENCE dq.structural_validation_results_id_seq OWNED BY dq.structural_validation_results.id;
+ALTER SEQUENCE dq.validation_runs_id_seq OWNED BY dq.validation_runs.id;
+ALTER SEQUENCE dq.validation_rule_results_id_seq OWNED BY dq.validation_rule_results.id;
+
+-- Rows outside every monthly partition (e.g. the maintenance job did not
+-- run); moved into their month when its partition is created
+CREATE TABLE dq.structural_validation_results_default
+    PARTITION OF dq.structural_validation_results DEFAULT;
+CREATE TABLE dq.validation_runs_default
+    PARTITION OF dq.validation_runs DEFAULT;
+CREATE TABLE dq.validation_rule_results_default
+    PARTITION OF dq.validation_rule_results DEFAULT;
+
+-- Partitioned indexes: created on every partition, present and future
+CREATE INDEX structural_validation_results_dataset_idx
+    ON dq.structural_validation_results (dataset, validated_at);
+CREATE INDEX structural_validation_results_run_idx
+    ON dq.structural_validation_results (run_id);
+
+CREATE INDEX validation_runs_dataset_idx
+    ON dq.validation_runs (dataset, validated_at);
+CREATE INDEX validation_runs_run_idx
+    ON dq.validation_runs (run_id);
+
+CREATE INDEX validation_rule_results_dataset_idx
+    ON dq.validation_rule_results (dataset, validated_at);
+CREATE INDEX validation_rule_results_template_idx
+    ON dq.validation_rule_results (template_id, validated_at);
+
+-- -------------------------------------------------------------------
+-- Partition maintenance
+-- -------------------------------------------------------------------
+-- Monthly partition dq.<parent>_YYYY_MM; rows of that month already in
+-- the default partition are moved into it. No-op if it exists.
+CREATE OR REPLACE FUNCTION dq.create_monthly_partition(parent TEXT, month_start DATE)
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    lower_bound TIMESTAMP := date_trunc('month', month_start::timestamp);
+    upper_bound TIMESTAMP := date_trunc('month', month_start::timestamp) + INTERVAL '1 month';
+    partition_name TEXT := format('%s_%s', parent, to_char(lower_bound, 'YYYY_MM'));
+BEGIN
+    IF to_regclass(format('dq.%I', partition_name)) IS NOT NULL THEN
+        RETURN;
+    END IF;
+
+    EXECUTE format(
+        'CREATE TABLE dq.%I (LIKE dq.%I INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+        partition_name,
+        parent
+    );
+
+    EXECUTE format(
+        'WITH moved AS (
+             DELETE FROM dq.%I
+             WHERE validated_at >= $1 AND validated_at < $2
+             RETURNING *
+         )
+         INSERT INTO dq.%I SELECT * FROM moved',
+        parent || '_default',
+        partition_name
+    ) USING lower_bound, upper_bound;
+
+    EXECUTE format(
+        'ALTER TABLE dq.%I ATTACH PARTITION dq.%I FOR VALUES FROM (%L) TO (%L)',
+        parent,
+        partition_name,
+        lower_bound,
+        upper_bound
+    );
+END;
+$$;
+
+-- Partitions of the result tables from the current month to
+-- `months_ahead` months ahead (run by the maintenance job)
+CREATE OR REPLACE FUNCTION dq.ensure_result_partitions(months_ahead INTEGER DEFAULT 3)
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    parent TEXT;
+    month_start DATE;
+BEGIN
+    FOREACH parent IN ARRAY ARRAY[
+        'structural_validation_results',
+        'validation_runs',
+        'validation_rule_results'
+    ]
+    LOOP
+        FOR month_start IN
+            SELECT generate_series(
+                date_trunc('month', now() AT TIME ZONE 'UTC'),
+                date_trunc('month', now() AT TIME ZONE 'UTC') + make_interval(months => months_ahead),
+                INTERVAL '1 month'
+            )::date
+        LOOP
+            PERFORM dq.create_monthly_partition(parent, month_start);
+        END LOOP;
+    END LOOP;
+END;
+$$;
+
+-- -------------------------------------------------------------------
+-- Existing rows: partitions for every month they cover, then copy
+-- -------------------------------------------------------------------
+SELECT dq.create_monthly_partition(parent, month_start::date)
+FROM (
+    SELECT 'structural_validation_results' AS parent, MIN(validated_at) AS first_at
+    FROM dq.structural_validation_results_legacy
+    UNION ALL
+    SELECT 'validation_runs', MIN(validated_at)
+    FROM dq.validation_runs_legacy
+    UNION ALL
+    SELECT 'validation_rule_results', MIN(validated_at)
+    FROM dq.validation_rule_results_legacy
+) history,
+LATERAL generate_series(
+    date_trunc('month', history.first_at),
+    date_trunc('month', now() AT TIME ZONE 'UTC'),
+    INTERVAL '1 month'
+) AS month_start
+WHERE history.first_at IS NOT NULL;
+
+SELECT dq.ensure_result_partitions(3);
+
+INSERT INTO dq.structural_validation_results (
+    id, run_id, dataset, template_id, template_version, sheet_name, passed,
+    error_count, warning_count, errors, warnings, validated_at
+)
+SELECT
+    id, run_id, dataset, template_id, template_version, sheet_name, passed,
+    error_count, warning_count, errors, warnings, validated_at
+FROM dq.structural_validation_results_legacy;
+
+INSERT INTO dq.validation_runs (
+    id, run_id, dataset, success, validated_at, row_count, validation_duration_ms,
+    rules_total, rules_passed, rules_failed, quality_score, null_ratio,
+    duplicate_ratio, schema_changed, invalid_row_count, approximate, sample_rows,
+    quality_score_lower, quality_score_upper, rules_skipped
+)
+SELECT
+    id, run_id, dataset, success, validated_at, row_count, validation_duration_ms,
+    rules_total, rules_passed, rules_failed, quality_score, null_ratio,
+    duplicate_ratio, schema_changed, invalid_row_count, approximate, sample_rows,
+    quality_score_lower, quality_score_upper, rules_skipped
+FROM dq.validation_runs_legacy;
+
+INSERT INTO dq.validation_rule_results (
+    id, run_id, validated_at, dataset, expectation_type, column_name, success,
+    unexpected_count, skipped, template_id, sheet_name, duration_ms
+)
+SELECT
+    id, run_id, validated_at, dataset, expectation_type, column_name, success,
+    unexpected_count, skipped, template_id, sheet_name, duration_ms
+FROM dq.validation_rule_results_legacy;
+
+DROP TABLE dq.structural_validation_results_legacy;
+DROP TABLE dq.validation_runs_legacy;
+DROP TABLE dq.validation_rule_results_legacy;
+
+-- -------------------------------------------------------------------
+-- Views (unchanged definitions, on the partitioned tables)
+-- -------------------------------------------------------------------
+CREATE VIEW dq.v_validation_runs AS
+SELECT
+    vr.run_id,
+    vr.dataset,
+    vr.success,
+    vr.validated_at,
+    vr.row_count,
+    vr.validation_duration_ms,
+    vr.rules_total,
+    vr.rules_passed,
+    vr.rules_failed,
+    vr.quality_score,
+    vr.null_ratio,
+    vr.duplicate_ratio,
+    vr.schema_changed,
+    vr.invalid_row_count,
+    vr.dataset AS input_dataset,
+    vr.approximate,
+    vr.sample_rows,
+    vr.quality_score_lower,
+    vr.quality_score_upper,
+    vr.rules_skipped
+FROM dq.validation_runs vr;
+
+CREATE VIEW dq.v_validation_metrics AS
+SELECT
+    vr.run_id,
+    vr.dataset,
+    vr.validated_at,
+
+    -- Structural validation
+    BOOL_AND(svr.passed)                    AS structural_passed,
+    SUM(svr.error_count)                    AS structural_error_count,
+    SUM(svr.warning_count)                  AS structural_warning_count,
+
+    -- GE metrics
+    vr.rules_total,
+    vr.rules_passed,
+    vr.rules_failed,
+    vr.quality_score,
+    vr.schema_changed,
+    vr.invalid_row_count,
+
+    -- Health flags
+    CASE
+        WHEN vr.rules_failed = 0
+         AND BOOL_AND(svr.passed)
+        THEN true
+        ELSE false
+    END AS overall_passed
+
+FROM dq.validation_runs vr
+LEFT JOIN dq.structural_validation_results svr
+    ON vr.run_id = svr.run_id
+GROUP BY
+    vr.run_id,
+    vr.dataset,
+    vr.validated_at,
+    vr.rules_total,
+    vr.rules_passed,
+    vr.rules_failed,
+    vr.quality_score,
+    vr.schema_changed,
+    vr.invalid_row_count;
+
+CREATE VIEW dq.v_validation_rule_stats AS
+SELECT
+    run_id,
+    dataset,
+    expectation_type,
+    column_name,
+    COUNT(*) FILTER (WHERE success)     AS passed_count,
+    COUNT(*) FILTER (WHERE NOT success AND NOT skipped) AS failed_count,
+    SUM(unexpected_count)               AS unexpected_total,
+    COUNT(*) FILTER (WHERE skipped)     AS skipped_count,
+    SUM(duration_ms)                    AS duration_ms_total
+FROM dq.validation_rule_results
+GROUP BY
+    run_id,
+    dataset,
+    expectation_type,
+    column_name;
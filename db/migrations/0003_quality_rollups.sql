@@ -0,0 +1,131 @@
+-- Hourly and daily per-dataset quality aggregates of validation_runs,
+-- kept up to date by dq.refresh_quality_rollups (maintenance job).
+-- Averages are stored as sums: avg quality = quality_score_sum / scored_runs.
+
+CREATE TABLE IF NOT EXISTS dq.quality_rollup_hourly (
+    dataset TEXT NOT NULL,
+    bucket_start TIMESTAMP NOT NULL,
+    runs INTEGER NOT NULL,
+    successful_runs INTEGER NOT NULL,
+    rules_total BIGINT NOT NULL,
+    rules_passed BIGINT NOT NULL,
+    rules_failed BIGINT NOT NULL,
+    rules_skipped BIGINT NOT NULL,
+    row_count BIGINT NOT NULL,
+    invalid_row_count BIGINT NOT NULL,
+    scored_runs INTEGER NOT NULL,
+    quality_score_sum NUMERIC,
+    quality_score_min NUMERIC,
+    quality_score_max NUMERIC,
+    validation_duration_ms BIGINT NOT NULL,
+    refreshed_at TIMESTAMP NOT NULL,
+    PRIMARY KEY (dataset, bucket_start)
+);
+
+CREATE TABLE IF NOT EXISTS dq.quality_rollup_daily (
+    LIKE dq.quality_rollup_hourly INCLUDING DEFAULTS,
+    PRIMARY KEY (dataset, bucket_start)
+);
+
+-- Recompute every hourly and daily bucket from the start of the day of
+-- `since` on. Idempotent; late runs (e.g. delivered from the result
+-- spool) are picked up as long as `since` reaches back to them.
+CREATE OR REPLACE FUNCTION dq.refresh_quality_rollups(since TIMESTAMP)
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    from_day TIMESTAMP := date_trunc('day', since);
+    refreshed TIMESTAMP := now() AT TIME ZONE 'UTC';
+BEGIN
+    INSERT INTO dq.quality_rollup_hourly (
+        dataset, bucket_start, runs, successful_runs, rules_total, rules_passed,
+        rules_failed, rules_skipped, row_count, invalid_row_count, scored_runs,
+        quality_score_sum, quality_score_min, quality_score_max,
+        validation_duration_ms, refreshed_at
+    )
+    SELECT
+        dataset,
+        date_trunc('hour', validated_at),
+        COUNT(*),
+        COUNT(*) FILTER (WHERE success),
+        COALESCE(SUM(rules_total), 0),
+        COALESCE(SUM(rules_passed), 0),
+        COALESCE(SUM(rules_failed), 0),
+        COALESCE(SUM(rules_skipped), 0),
+        COALESCE(SUM(row_count), 0),
+        COALESCE(SUM(invalid_row_count), 0),
+        COUNT(quality_score),
+        SUM(quality_score),
+        MIN(quality_score),
+        MAX(quality_score),
+        COALESCE(SUM(validation_duration_ms), 0),
+        refreshed
+    FROM dq.validation_runs
+    WHERE validated_at >= from_day
+    GROUP BY dataset, date_trunc('hour', validated_at)
+    ON CONFLICT (dataset, bucket_start) DO UPDATE SET
+        runs = EXCLUDED.runs,
+        successful_runs = EXCLUDED.successful_runs,
+        rules_total = EXCLUDED.rules_total,
+        rules_passed = EXCLUDED.rules_passed,
+        rules_failed = EXCLUDED.rules_failed,
+        rules_skipped = EXCLUDED.rules_skipped,
+        row_count = EXCLUDED.row_count,
+        invalid_row_count = EXCLUDED.invalid_row_count,
+        scored_runs = EXCLUDED.scored_runs,
+        quality_score_sum = EXCLUDED.quality_score_sum,
+        quality_score_min = EXCLUDED.quality_score_min,
+        quality_score_max = EXCLUDED.quality_score_max,
+        validation_duration_ms = EXCLUDED.validation_duration_ms,
+        refreshed_at = EXCLUDED.refreshed_at;
+
+    -- Days are rolled up from their (now complete) hours
+    INSERT INTO dq.quality_rollup_daily (
+        dataset, bucket_start, runs, successful_runs, rules_total, rules_passed,
+        rules_failed, rules_skipped, row_count, invalid_row_count, scored_runs,
+        quality_score_sum, quality_score_min, quality_score_max,
+        validation_duration_ms, refreshed_at
+    )
+    SELECT
+        dataset,
+        date_trunc('day', bucket_start),
+        SUM(runs),
+        SUM(successful_runs),
+        SUM(rules_total),
+        SUM(rules_passed),
+        SUM(rules_failed),
+        SUM(rules_skipped),
+        SUM(row_count),
+        SUM(invalid_row_count),
+        SUM(scored_runs),
+        SUM(quality_score_sum),
+        MIN(quality_score_min),
+        MAX(quality_score_max),
+        SUM(validation_duration_ms),
+        refreshed
+    FROM dq.quality_rollup_hourly
+    WHERE bucket_start >= from_day
+    GROUP BY dataset, date_trunc('day', bucket_start)
+    ON CONFLICT (dataset, bucket_start) DO UPDATE SET
+        runs = EXCLUDED.runs,
+        successful_runs = EXCLUDED.successful_runs,
+        rules_total = EXCLUDED.rules_total,
+        rules_passed = EXCLUDED.rules_passed,
+        rules_failed = EXCLUDED.rules_failed,
+        rules_skipped = EXCLUDED.rules_skipped,
+        row_count = EXCLUDED.row_count,
+        invalid_row_count = EXCLUDED.invalid_row_count,
+        scored_runs = EXCLUDED.scored_runs,
+        quality_score_sum = EXCLUDED.quality_score_sum,
+        quality_score_min = EXCLUDED.quality_score_min,
+        quality_score_max = EXCLUDED.quality_score_max,
+        validation_duration_ms = EXCLUDED.validation_duration_ms,
+        refreshed_at = EXCLUDED.refreshed_at;
+END;
+$$;
+
+-- Existing history
+SELECT dq.refresh_quality_rollups(
+    COALESCE((SELECT MIN(validated_at) FROM dq.validation_runs), now() AT TIME ZONE 'UTC')
+);
@@ -1,8 +1,23 @@
 from abc import ABC, abstractmethod
+from io import BytesIO
+from typing import BinaryIO
 
 import pandas as pd
 
 
+def as_buffer(source: bytes | BinaryIO) -> BinaryIO:
+    """
+    Accept raw bytes or an already open file-like object
+    (BytesIO / mmap view from SpooledInput) and return a
+    readable buffer positioned at the start.
+    """
+    if isinstance(source, bytes | bytearray | memoryview):
+        return BytesIO(source)
+
+    source.seek(0)
+    return source
+
+
 class BaseParser(ABC):
 
     @staticmethod
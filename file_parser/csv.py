@@ -1,23 +1,157 @@
-from io import BytesIO
+import logging
+import os
+from collections.abc import Iterator
+from typing import BinaryIO
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 
-from file_parser.base import BaseParser
+from file_parser.base import BaseParser, as_buffer
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENGINE = "c"
+
+# `c`: pandas C parser; `pyarrow`: multi-threaded pyarrow.csv reader
+# (whole-file reads only, chunked mode always uses `c`)
+ENGINES = {"c", "pyarrow"}
+
+# Nullable dtypes the C parser handles several times slower than
+# inferring and casting afterwards (file_parser.types.coerce_types)
+C_ENGINE_CAST_AFTER = {"Int64", "boolean"}
+
+# Reader dtype -> Arrow column type for the pyarrow engine
+ARROW_TYPES = {
+    "str": pa.string(),
+    "float64": pa.float64(),
+    "Int64": pa.int64(),
+    "boolean": pa.bool_(),
+}
+
+# pandas' default NA tokens (pandas._libs.parsers.STR_NA_VALUES): the
+# pyarrow engine reads the same cells as missing as the `c` engine
+NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None",
+    "n/a", "nan", "null",
+]
+
+
+def resolve_engine(engine: str | None = None) -> str:
+    """
+    Pick the CSV engine: explicit argument, then CSV_ENGINE, then `c`.
+    """
+    engine = engine or os.getenv("CSV_ENGINE") or DEFAULT_ENGINE
+
+    if engine not in ENGINES:
+        raise ValueError(f"Unsupported CSV engine: {engine}")
+
+    return engine
 
 
 class CsvParser(BaseParser):
 
     @staticmethod
-    def read(file_bytes: bytes,
+    def read(source: bytes | BinaryIO,
              header: int = 1,
              usecols: list[str] | None = None,
-             delimiter: str = ","
+             delimiter: str = ",",
+             dtype: dict[str, str] | None = None,
+             engine: str | None = None,
              ) -> pd.DataFrame:
 
-        buffer = BytesIO(file_bytes)
+        buffer = as_buffer(source)
+
+        if resolve_engine(engine) == "pyarrow":
+            return CsvParser._read_pyarrow(buffer, header, usecols, delimiter, dtype)
+
         return pd.read_csv(
             buffer,
             header=header - 1,
             usecols=usecols,
             sep=delimiter,
+            dtype=CsvParser._c_dtypes(dtype),
         )
+
+    @staticmethod
+    def _c_dtypes(dtype: dict[str, str] | None) -> dict[str, str] | None:
+        if not dtype:
+            return dtype
+        return {
+            column: value for column, value in dtype.items()
+            if value not in C_ENGINE_CAST_AFTER
+        }
+
+    @staticmethod
+    def _read_pyarrow(
+        buffer: BinaryIO,
+        header: int,
+        usecols: list[str] | None,
+        delimiter: str,
+        dtype: dict[str, str] | None,
+    ) -> pd.DataFrame:
+        """
+        Typed columns get explicit Arrow column types (no inference,
+        dates kept as text); a value that does not convert raises
+        ArrowInvalid (a ValueError), like pandas does. Empty cells and
+        pandas' NA tokens are missing in every column, quoted or not.
+        """
+        table = pacsv.read_csv(
+            buffer,
+            read_options=pacsv.ReadOptions(skip_rows=header - 1),
+            parse_options=pacsv.ParseOptions(delimiter=delimiter),
+            convert_options=pacsv.ConvertOptions(
+                column_types={
+                    column: ARROW_TYPES[value]
+                    for column, value in (dtype or {}).items()
+                },
+                include_columns=usecols or [],
+                null_values=NA_VALUES,
+                strings_can_be_null=True,
+                quoted_strings_can_be_null=True,
+            ),
+        )
+        return table.to_pandas()
+
+    @staticmethod
+    def read_columns(source: bytes | BinaryIO,
+                     header: int = 1,
+                     delimiter: str = ","
+                     ) -> list[str]:
+        """
+        Schema-only probe: header row only, no data rows parsed.
+        """
+        buffer = as_buffer(source)
+        return list(
+            pd.read_csv(
+                buffer,
+                header=header - 1,
+                sep=delimiter,
+                nrows=0,
+            ).columns
+        )
+
+    @staticmethod
+    def iter_chunks(source: bytes | BinaryIO,
+                    chunksize: int,
+                    header: int = 1,
+                    usecols: list[str] | None = None,
+                    delimiter: str = ",",
+                    dtype: dict[str, str] | None = None,
+                    ) -> Iterator[pd.DataFrame]:
+        """
+        Yield the file as DataFrames of at most `chunksize` rows.
+        The index keeps counting across chunks (global row numbers).
+        Always uses the `c` engine (pyarrow cannot stream chunks).
+        """
+        buffer = as_buffer(source)
+        with pd.read_csv(
+            buffer,
+            header=header - 1,
+            usecols=usecols,
+            sep=delimiter,
+            dtype=CsvParser._c_dtypes(dtype),
+            chunksize=chunksize,
+        ) as reader:
+            yield from reader
@@ -1,24 +1,119 @@
-from io import BytesIO
+import importlib.util
+import logging
+import os
+import threading
+from typing import BinaryIO
 
 import pandas as pd
 
-from file_parser.base import BaseParser
+from file_parser.base import BaseParser, as_buffer
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENGINE = "openpyxl"
+
+# engine name → module that must be importable for it
+ENGINES = {
+    "openpyxl": "openpyxl",
+    "calamine": "python_calamine",
+}
+
+
+def resolve_engine(engine: str | None = None) -> str:
+    """
+    Pick the Excel engine: explicit argument, then EXCEL_ENGINE,
+    then openpyxl. `calamine` (Rust reader, optional dependency
+    `python-calamine`) falls back to openpyxl when not installed.
+    """
+    engine = engine or os.getenv("EXCEL_ENGINE") or DEFAULT_ENGINE
+
+    if engine not in ENGINES:
+        raise ValueError(f"Unsupported Excel engine: {engine}")
+
+    if importlib.util.find_spec(ENGINES[engine]) is None:
+        logger.warning(
+            "Excel engine '%s' is not installed, falling back to %s",
+            engine,
+            DEFAULT_ENGINE,
+        )
+        return DEFAULT_ENGINE
+
+    return engine
+
+
+class ExcelWorkbook:
+    """
+    Workbook session shared by all sheets of a run.
+
+    The archive is unzipped and the workbook (shared strings, styles,
+    sheet index) loaded once; each `read()` only parses its own sheet.
+    The underlying readers are not thread-safe: sheets read from several
+    threads are parsed one at a time.
+    """
+
+    def __init__(self, source: bytes | BinaryIO, engine: str | None = None):
+        self.engine = resolve_engine(engine)
+        self._book = pd.ExcelFile(as_buffer(source), engine=self.engine)
+        self._lock = threading.Lock()
+
+    def read(
+            self,
+            sheet_name: str,
+            header: int,
+            usecols: list[str] | None = None,
+            dtype: dict[str, str] | None = None,
+    ) -> pd.DataFrame:
+        with self._lock:
+            return self._book.parse(
+                sheet_name = sheet_name,
+                header = header - 1,
+                usecols = usecols,
+                dtype = dtype,
+            )
+
+    def read_columns(self, sheet_name: str, header: int) -> list[str]:
+        """
+        Schema-only probe: parses the sheet up to its header row.
+        """
+        with self._lock:
+            return list(
+                self._book.parse(
+                    sheet_name = sheet_name,
+                    header = header - 1,
+                    nrows = 0,
+                ).columns
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._book is not None:
+                self._book.close()
+                self._book = None
+
+    def __enter__(self) -> "ExcelWorkbook":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
 
 
 class ExcelParser(BaseParser):
 
     @staticmethod
     def read(
-            file_bytes: bytes,
+            source: bytes | BinaryIO,
             sheet_name: str,
             header: int,
             usecols: list[str] | None = None,
+            engine: str | None = None,
+            dtype: dict[str, str] | None = None,
     ) -> pd.DataFrame:
-        buffer = BytesIO(file_bytes)
-        return pd.read_excel(
-            buffer,
-            sheet_name = sheet_name,
-            header = header - 1,
-            usecols = usecols,
-            engine = "openpyxl",
-        )
+        with ExcelWorkbook(source, engine=engine) as workbook:
+            return workbook.read(sheet_name, header, usecols, dtype)
+
+    @staticmethod
+    def open_workbook(
+            source: bytes | BinaryIO,
+            engine: str | None = None,
+    ) -> ExcelWorkbook:
+        return ExcelWorkbook(source, engine=engine)
@@ -1,15 +1,13 @@
+from collections.abc import Iterator
 
+import pandas as pd
+import pyarrow as pa
 from pyiceberg.catalog import load_catalog
 
 
 class IcebergParser:
     @staticmethod
-    def read(
-        table_identifier: str,
-        columns: list[str] | None = None,
-        catalog_name: str = "glue",
-        **kwargs,
-    ):
+    def load_table(table_identifier: str, catalog_name: str):
         """
         table_identifier examples:
         - iceberg://glue.dq_iceberg_dev.orders
@@ -24,7 +22,16 @@ class IcebergParser:
 
         # identifier is now: dq_iceberg_dev.orders
         catalog = load_catalog(catalog_name)
-        table = catalog.load_table(identifier)
+        return catalog.load_table(identifier)
+
+    @staticmethod
+    def read(
+        table_identifier: str,
+        columns: list[str] | None = None,
+        catalog_name: str = "glue",
+        **kwargs,
+    ):
+        table = IcebergParser.load_table(table_identifier, catalog_name)
 
         scan = table.scan()
 
@@ -32,3 +39,68 @@ class IcebergParser:
             scan = scan.select(*columns)
 
         return scan.to_arrow().to_pandas()
+
+    @staticmethod
+    def read_table(
+        table,
+        columns: list[str] | None = None,
+        snapshot_id: int | None = None,
+    ) -> pa.Table:
+        """
+        Arrow-native read of an already loaded table: the scan result
+        is returned without converting it to pandas. `snapshot_id` pins
+        the snapshot (current one by default).
+        """
+        scan = table.scan(snapshot_id=snapshot_id)
+
+        if columns:
+            scan = scan.select(*columns)
+
+        return scan.to_arrow()
+
+    @staticmethod
+    def read_columns(
+        table_identifier: str,
+        catalog_name: str = "glue",
+    ) -> list[str]:
+        """
+        Schema-only probe: top-level column names from table metadata.
+        """
+        table = IcebergParser.load_table(table_identifier, catalog_name)
+        return [field.name for field in table.schema().fields]
+
+    @staticmethod
+    def iter_batches(
+        table,
+        columns: list[str] | None = None,
+        snapshot_id: int | None = None,
+        from_snapshot_id: int | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream a table snapshot as DataFrames, one Arrow record batch
+        at a time.
+
+        from_snapshot_id: only rows appended after this snapshot
+        (exclusive) up to `snapshot_id` (inclusive).
+        """
+        selected = tuple(columns) if columns else ("*",)
+
+        if from_snapshot_id is None:
+            scan = table.scan(snapshot_id=snapshot_id, selected_fields=selected)
+        else:
+            scan = table.incremental_append_scan(
+                from_snapshot_id_exclusive=from_snapshot_id,
+                to_snapshot_id_inclusive=snapshot_id,
+                selected_fields=selected,
+            )
+
+        # Continuous row index across batches (like CSV chunks)
+        offset = 0
+        for batch in scan.to_arrow_batch_reader():
+            if not batch.num_rows:
+                continue
+
+            df = batch.to_pandas()
+            df.index = pd.RangeIndex(offset, offset + len(df))
+            offset += len(df)
+            yield df
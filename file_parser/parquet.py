@@ -1,21 +1,64 @@
-from io import BytesIO
+from typing import BinaryIO
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
-from file_parser.base import BaseParser
+from file_parser.base import BaseParser, as_buffer
 
 
 class ParquetParser(BaseParser):
 
     @staticmethod
     def read(
-        file_bytes: bytes,
+        source: bytes | BinaryIO,
         usecols: list[str] | None = None,
     ) -> pd.DataFrame:
-        buffer = BytesIO(file_bytes)
+        buffer = as_buffer(source)
 
         return pd.read_parquet(
             buffer,
             columns=usecols,
             engine="pyarrow",
         )
+
+    @staticmethod
+    def read_table(
+        source: bytes | BinaryIO,
+        usecols: list[str] | None = None,
+    ) -> pa.Table:
+        """
+        Arrow-native read: no pandas conversion, strings stay in
+        Arrow buffers instead of Python objects.
+        """
+        parquet_file = pq.ParquetFile(as_buffer(source))
+
+        if usecols is None:
+            usecols = ParquetParser._data_columns(parquet_file.schema_arrow)
+
+        return parquet_file.read(columns=usecols)
+
+    @staticmethod
+    def read_metadata(source: bytes | BinaryIO) -> pq.FileMetaData:
+        """
+        Footer only: row groups with per-column statistics.
+        """
+        return pq.read_metadata(as_buffer(source))
+
+    @staticmethod
+    def read_columns(source: bytes | BinaryIO) -> list[str]:
+        """
+        Schema-only probe: column names from the Parquet footer
+        (pandas index columns excluded).
+        """
+        schema = pq.read_schema(as_buffer(source))
+        return ParquetParser._data_columns(schema)
+
+    @staticmethod
+    def _data_columns(schema: pa.Schema) -> list[str]:
+        pandas_meta = schema.pandas_metadata or {}
+        index_columns = {
+            c for c in pandas_meta.get("index_columns", [])
+            if isinstance(c, str)
+        }
+        return [name for name in schema.names if name not in index_columns]
@@ -0,0 +1,173 @@
+import logging
+from collections.abc import Callable, Iterable, Iterator
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Template column type -> pandas dtype requested from the reader
+READ_DTYPES = {
+    "string": "str",
+    "int": "Int64",
+    "decimal": "float64",
+    "float": "float64",
+    "boolean": "boolean",
+}
+
+# date / datetime: pinned to text for text formats (CSV) so the date
+# rules see the raw values whatever the engine infers; Excel cells keep
+# their native datetimes
+DATE_TYPES = {"date", "datetime"}
+
+BOOLEAN_VALUES = {
+    "true": True,
+    "false": False,
+    "1": True,
+    "0": False,
+    "yes": True,
+    "no": False,
+}
+
+# Sample of offending values kept per column in the structural result
+VIOLATION_SAMPLE_SIZE = 5
+
+
+def read_dtypes(
+    column_types: dict[str, str],
+    dates_as_text: bool = False,
+) -> dict[str, str]:
+    """
+    Explicit reader dtypes for the typed template columns
+    (no inference pass, no object columns for numbers).
+    """
+    dtypes = {
+        column: READ_DTYPES[type_]
+        for column, type_ in column_types.items()
+        if type_ in READ_DTYPES
+    }
+
+    if dates_as_text:
+        dtypes.update(
+            {
+                column: "str"
+                for column, type_ in column_types.items()
+                if type_ in DATE_TYPES
+            }
+        )
+
+    return dtypes
+
+
+def text_dtypes(
+    column_types: dict[str, str],
+    dates_as_text: bool = False,
+) -> dict[str, str]:
+    """
+    Fallback when a typed read fails: typed columns read as text,
+    then converted by coerce_types().
+    """
+    return {column: "str" for column in read_dtypes(column_types, dates_as_text)}
+
+
+def _coerce(series: pd.Series, type_: str) -> pd.Series:
+    if type_ == "boolean" and pd.api.types.is_bool_dtype(series):
+        return series.astype("boolean")
+
+    if type_ == "boolean":
+        values = series.astype("string").str.strip().str.lower()
+        return values.map(BOOLEAN_VALUES).astype("boolean")
+
+    numbers = pd.to_numeric(series, errors="coerce")
+    if type_ == "int":
+        numbers = numbers.where(numbers % 1 == 0)
+    return numbers.astype(READ_DTYPES[type_])
+
+
+def coerce_types(
+    df: pd.DataFrame,
+    column_types: dict[str, str],
+) -> tuple[pd.DataFrame, dict[str, dict]]:
+    """
+    Bring typed columns to their template dtype. Columns already read
+    with the right dtype are left alone; values that do not convert
+    become missing and are reported per column:
+
+        {column: {"type": ..., "count": n, "sample": [...]}}
+    """
+    violations = {}
+
+    for column, dtype in read_dtypes(column_types).items():
+        if column not in df.columns:
+            continue
+
+        series = df[column]
+        if dtype == "str" or series.dtype == dtype:
+            continue
+
+        converted = _coerce(series, column_types[column])
+        invalid = series.notna() & converted.isna()
+
+        if invalid.any():
+            violations[column] = {
+                "type": column_types[column],
+                "count": int(invalid.sum()),
+                "sample": series[invalid].head(VIOLATION_SAMPLE_SIZE).astype(str).tolist(),
+            }
+
+        df[column] = converted
+
+    return df, violations
+
+
+def merge_violations(total: dict[str, dict], violations: dict[str, dict]) -> None:
+    """
+    Add the coerce_types violations of one chunk to `total` (in place).
+    """
+    for column, violation in violations.items():
+        merged = total.setdefault(
+            column,
+            {"type": violation["type"], "count": 0, "sample": []},
+        )
+        merged["count"] += violation["count"]
+        merged["sample"].extend(
+            violation["sample"][: VIOLATION_SAMPLE_SIZE - len(merged["sample"])]
+        )
+
+
+def coerce_chunks(
+    chunks: Iterable[pd.DataFrame],
+    column_types: dict[str, str],
+    violations: dict[str, dict],
+) -> Iterator[pd.DataFrame]:
+    """
+    coerce_types over a stream of chunks; the violations of every
+    chunk are merged into `violations` as the chunks are consumed.
+    """
+    for chunk in chunks:
+        chunk, chunk_violations = coerce_types(chunk, column_types)
+        merge_violations(violations, chunk_violations)
+        yield chunk
+
+
+def read_typed(
+    read: Callable[..., pd.DataFrame],
+    column_types: dict[str, str],
+    dates_as_text: bool = False,
+    **kwargs,
+) -> tuple[pd.DataFrame, dict[str, dict]]:
+    """
+    Call a parser `read` with explicit dtypes. If a value does not fit
+    its declared type the reader raises; the typed columns are then
+    re-read as text and converted value by value, so the violation ends
+    up in the structural result instead of crashing the run.
+    """
+    if not column_types:
+        return read(**kwargs), {}
+
+    try:
+        df = read(dtype=read_dtypes(column_types, dates_as_text), **kwargs)
+    except (ValueError, TypeError) as e:
+        logger.info("Typed read failed, re-reading typed columns as text: %s", e)
+        df = read(dtype=text_dtypes(column_types, dates_as_text), **kwargs)
+
+    return coerce_types(df, column_types)
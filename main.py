@@ -5,7 +5,9 @@ import sys
 
 from core.logging_config import setup_logging
 from core.settings import load_settings
+from db.connection import close_pool
 from validation_engine.handler import handle_file
+from validation_engine.result_sink import close_result_sink
 
 
 def main():
@@ -52,6 +54,10 @@ def main():
     except Exception:
         logger.exception("Validation pipeline failed")
         sys.exit(1)
+    finally:
+        # Spooled results first: the sink writes through the pool
+        close_result_sink()
+        close_pool()
 
     logger.info(
         "Validation completed | run_id=%s success=%s",
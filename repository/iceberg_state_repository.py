@@ -0,0 +1,103 @@
+from psycopg2.extras import execute_values
+
+
+def get_last_snapshot(dataset: str, template_id: str, cur) -> int | None:
+    """
+    Snapshot id validated by the previous incremental run, if any.
+    """
+
+    cur.execute(
+        """
+        SELECT snapshot_id
+        FROM iceberg_validation_state
+        WHERE dataset = %s AND template_id = %s
+        """,
+        (dataset, template_id),
+    )
+    row = cur.fetchone()
+    return row[0] if row else None
+
+
+def upsert_snapshot(
+    dataset: str,
+    template_id: str,
+    snapshot_id: int,
+    meta: dict,
+    cur,
+) -> None:
+    """
+    Record the snapshot validated by this run.
+    """
+
+    cur.execute(
+        """
+        INSERT INTO iceberg_validation_state (
+            dataset,
+            template_id,
+            snapshot_id,
+            run_id,
+            validated_at
+        )
+        VALUES (%s, %s, %s, %s, %s)
+        ON CONFLICT (dataset, template_id) DO UPDATE SET
+            snapshot_id = EXCLUDED.snapshot_id,
+            run_id = EXCLUDED.run_id,
+            validated_at = EXCLUDED.validated_at
+        """,
+        (
+            dataset,
+            template_id,
+            snapshot_id,
+            meta["run_id"],
+            meta["validated_at"],
+        ),
+    )
+
+
+def insert_keys(
+    dataset: str,
+    template_id: str,
+    key_name: str,
+    key_hashes: list[int],
+    cur,
+) -> list[int]:
+    """
+    Add key fingerprints to the index.
+    Returns the hashes that were not present yet.
+    """
+
+    if not key_hashes:
+        return []
+
+    rows = execute_values(
+        cur,
+        """
+        INSERT INTO iceberg_key_index (
+            dataset,
+            template_id,
+            key_name,
+            key_hash
+        )
+        VALUES %s
+        ON CONFLICT DO NOTHING
+        RETURNING key_hash
+        """,
+        [(dataset, template_id, key_name, h) for h in key_hashes],
+        page_size=10000,
+        fetch=True,
+    )
+    return [row[0] for row in rows]
+
+
+def reset_keys(dataset: str, template_id: str, cur) -> None:
+    """
+    Drop the key index before a full rescan.
+    """
+
+    cur.execute(
+        """
+        DELETE FROM iceberg_key_index
+        WHERE dataset = %s AND template_id = %s
+        """,
+        (dataset, template_id),
+    )
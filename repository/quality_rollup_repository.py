@@ -0,0 +1,101 @@
+from datetime import datetime
+
+# Rollup table per granularity (db/migrations/0003_quality_rollups.sql)
+ROLLUP_TABLES = {
+    "hour": "quality_rollup_hourly",
+    "day": "quality_rollup_daily",
+}
+
+
+def ensure_result_partitions(months_ahead: int, cur) -> None:
+    """
+    Create the monthly partitions of the result tables up to
+    `months_ahead` months ahead (existing ones are left alone).
+    """
+
+    cur.execute("SELECT dq.ensure_result_partitions(%s)", (months_ahead,))
+
+
+def refresh_quality_rollups(since: datetime, cur) -> None:
+    """
+    Recompute the hourly and daily rollups from the day of `since` on.
+    """
+
+    cur.execute("SELECT dq.refresh_quality_rollups(%s)", (since,))
+
+
+def get_quality_history(
+    dataset: str,
+    since: datetime,
+    granularity: str,
+    cur,
+) -> list[dict]:
+    """
+    Per-bucket quality of `dataset` since `since` (bucket-aligned),
+    oldest first, read from the rollup of `granularity` ("hour" / "day").
+    """
+
+    if granularity not in ROLLUP_TABLES:
+        raise ValueError(
+            f"Unsupported granularity '{granularity}', expected one of {sorted(ROLLUP_TABLES)}"
+        )
+
+    cur.execute(
+        f"""
+        SELECT
+            bucket_start,
+            runs,
+            successful_runs,
+            rules_total,
+            rules_passed,
+            rules_failed,
+            rules_skipped,
+            row_count,
+            invalid_row_count,
+            quality_score_sum / NULLIF(scored_runs, 0),
+            quality_score_min,
+            quality_score_max,
+            validation_duration_ms / NULLIF(runs, 0)
+        FROM {ROLLUP_TABLES[granularity]}
+        WHERE dataset = %s
+          AND bucket_start >= date_trunc(%s, %s::timestamp)
+        ORDER BY bucket_start
+        """,
+        (dataset, granularity, since),
+    )
+
+    def _float(value) -> float | None:
+        return float(value) if value is not None else None
+
+    return [
+        {
+            "bucket_start": bucket_start,
+            "runs": runs,
+            "successful_runs": successful_runs,
+            "rules_total": rules_total,
+            "rules_passed": rules_passed,
+            "rules_failed": rules_failed,
+            "rules_skipped": rules_skipped,
+            "row_count": row_count,
+            "invalid_row_count": invalid_row_count,
+            "quality_score_avg": _float(quality_score_avg),
+            "quality_score_min": _float(quality_score_min),
+            "quality_score_max": _float(quality_score_max),
+            "validation_duration_ms_avg": _float(duration_ms_avg),
+        }
+        for (
+            bucket_start,
+            runs,
+            successful_runs,
+            rules_total,
+            rules_passed,
+            rules_failed,
+            rules_skipped,
+            row_count,
+            invalid_row_count,
+            quality_score_avg,
+            quality_score_min,
+            quality_score_max,
+            duration_ms_avg,
+        ) in cur.fetchall()
+    ]
@@ -1,44 +1,56 @@
 from psycopg2.extras import Json
 
+from db.bulk import BulkWriter
 
-def insert_structural_result(
+STRUCTURAL_RESULTS_TABLE = "structural_validation_results"
+
+STRUCTURAL_RESULT_COLUMNS = (
+    "run_id",
+    "dataset",
+    "template_id",
+    "template_version",
+    "sheet_name",
+    "passed",
+    "error_count",
+    "warning_count",
+    "errors",
+    "warnings",
+    "validated_at",
+)
+
+
+def structural_result_row(result: dict, meta: dict, sheet_name: str) -> tuple:
+    """
+    structural_validation_results row (STRUCTURAL_RESULT_COLUMNS) of one sheet.
+    """
+
+    return (
+        meta["run_id"],
+        meta["input_key"],
+        meta["template_id"],
+        meta["template_version"],
+        sheet_name,
+        result["passed"],
+        len(result["errors"]),
+        len(result["warnings"]),
+        Json(result["errors"]),
+        Json(result["warnings"]),
+        meta["validated_at"],
+    )
+
+
+def add_structural_result(
     result: dict,
     meta: dict,
     sheet_name: str,
-    cur
+    writer: BulkWriter
 ) -> None:
     """
-    Insert structural validation result for a single sheet
+    Buffer the structural validation result of a sheet in the run's bulk writer.
     """
 
-    cur.execute(
-        """
-        INSERT INTO structural_validation_results (
-            run_id,
-            dataset,
-            template_id,
-            template_version,
-            sheet_name,
-            passed,
-            error_count,
-            warning_count,
-            errors,
-            warnings,
-            validated_at
-        )
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """,
-        (
-            meta["run_id"],
-            meta["input_key"],
-            meta["template_id"],
-            meta["template_version"],
-            sheet_name,
-            result["passed"],
-            len(result["errors"]),
-            len(result["warnings"]),
-            Json(result["errors"]),
-            Json(result["warnings"]),
-            meta["validated_at"],
-        )
+    writer.add(
+        STRUCTURAL_RESULTS_TABLE,
+        STRUCTURAL_RESULT_COLUMNS,
+        [structural_result_row(result, meta, sheet_name)],
     )
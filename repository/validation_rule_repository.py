@@ -1,9 +1,27 @@
-from psycopg2.extras import execute_batch
+from datetime import datetime
 
+from db.bulk import BulkWriter
 
-def insert_rule_results(result: dict, cur) -> None:
+RULE_RESULTS_TABLE = "validation_rule_results"
+
+RULE_RESULT_COLUMNS = (
+    "run_id",
+    "validated_at",
+    "dataset",
+    "expectation_type",
+    "column_name",
+    "success",
+    "unexpected_count",
+    "skipped",
+    "template_id",
+    "sheet_name",
+    "duration_ms",
+)
+
+
+def rule_result_rows(result: dict) -> list[tuple]:
     """
-    Insert rule-level validation results into validation_rule_results table.
+    validation_rule_results rows (RULE_RESULT_COLUMNS) of one suite result.
     """
 
     records = []
@@ -18,22 +36,58 @@ def insert_rule_results(result: dict, cur) -> None:
                 r["expectation_config"].get("kwargs", {}).get("column"),
                 r["success"],
                 r.get("result", {}).get("unexpected_count", 0),
+                bool((r.get("meta") or {}).get("skipped")),
+                result["meta"].get("template_id"),
+                result["meta"].get("sheet_name"),
+                (r.get("meta") or {}).get("duration_ms"),
             )
         )
 
-    execute_batch(
-        cur,
+    return records
+
+
+def add_rule_results(result: dict, writer: BulkWriter) -> None:
+    """
+    Buffer rule-level validation results in the run's bulk writer.
+    """
+
+    writer.add(RULE_RESULTS_TABLE, RULE_RESULT_COLUMNS, rule_result_rows(result))
+
+
+def get_rule_costs(
+    template_id: str,
+    since: datetime,
+    cur,
+) -> dict[tuple[str, str, str | None], tuple[int, int, float | None]]:
+    """
+    Rule history of a template since `since`, for cost-based scheduling:
+    {(sheet_name, expectation_type, column_name): (runs, failures, mean duration_ms)}.
+    Skipped rules are left out.
+    """
+
+    cur.execute(
         """
-        INSERT INTO validation_rule_results (
-            run_id,
-            validated_at,
-            dataset,
+        SELECT
+            sheet_name,
             expectation_type,
             column_name,
-            success,
-            unexpected_count
-        )
-        VALUES (%s, %s, %s, %s, %s, %s, %s)
+            COUNT(*),
+            COUNT(*) FILTER (WHERE NOT success),
+            AVG(duration_ms)
+        FROM validation_rule_results
+        WHERE template_id = %s
+          AND validated_at >= %s
+          AND NOT skipped
+        GROUP BY sheet_name, expectation_type, column_name
         """,
-        records
+        (template_id, since),
     )
+
+    return {
+        (sheet_name, expectation_type, column_name): (
+            runs,
+            failures,
+            float(duration_ms) if duration_ms is not None else None,
+        )
+        for sheet_name, expectation_type, column_name, runs, failures, duration_ms in cur.fetchall()
+    }
@@ -1,42 +1,80 @@
-def insert_validation_run(result: dict, cur) -> None:
+from db.bulk import BulkWriter
+
+VALIDATION_RUNS_TABLE = "validation_runs"
+
+VALIDATION_RUN_COLUMNS = (
+    "run_id",
+    "dataset",
+    "success",
+    "validated_at",
+    "row_count",
+    "validation_duration_ms",
+    "rules_total",
+    "rules_passed",
+    "rules_failed",
+    "quality_score",
+    "null_ratio",
+    "duplicate_ratio",
+    "schema_changed",
+    "invalid_row_count",
+    "approximate",
+    "sample_rows",
+    "quality_score_lower",
+    "quality_score_upper",
+    "rules_skipped",
+)
+
+
+def validation_run_row(result: dict) -> tuple:
+    """
+    validation_runs row (VALIDATION_RUN_COLUMNS) of a run summary.
+    """
+
+    return (
+        result["meta"]["run_id"],
+        result["meta"]["input_key"],
+        result["success"],
+        result["meta"]["validated_at"],
+        result["meta"]["row_count"],
+        result["meta"]["validation_duration_ms"],
+        result["meta"]["rules_total"],
+        result["meta"]["rules_passed"],
+        result["meta"]["rules_failed"],
+        result["meta"]["quality_score"],
+        result["meta"]["null_ratio"],
+        result["meta"]["duplicate_ratio"],
+        result["meta"]["schema_changed"],
+        result["meta"]["invalid_row_count"],
+        result["meta"].get("approximate", False),
+        result["meta"].get("sample_rows"),
+        result["meta"].get("quality_score_lower", result["meta"]["quality_score"]),
+        result["meta"].get("quality_score_upper", result["meta"]["quality_score"]),
+        result["meta"].get("rules_skipped", 0),
+    )
+
+
+def add_validation_run(result: dict, writer: BulkWriter) -> None:
+    """
+    Buffer the validation run summary in the run's bulk writer.
+    """
+
+    writer.add(VALIDATION_RUNS_TABLE, VALIDATION_RUN_COLUMNS, [validation_run_row(result)])
+
+
+def get_existing_runs(run_ids: list[str], cur) -> set[str]:
     """
-    Insert a validation run summary into validation_runs table.
+    The run ids among `run_ids` that already have a validation_runs row.
     """
 
+    if not run_ids:
+        return set()
+
     cur.execute(
         """
-        INSERT INTO validation_runs(
-            run_id,
-            dataset,
-            success,
-            validated_at,
-            row_count,
-            validation_duration_ms,
-            rules_total,
-            rules_passed,
-            rules_failed,
-            quality_score,
-            null_ratio,
-            duplicate_ratio,
-            schema_changed,
-            invalid_row_count
-        )
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        SELECT run_id::text
+        FROM validation_runs
+        WHERE run_id = ANY(%s::uuid[])
         """,
-        (
-            result["meta"]["run_id"],
-            result["meta"]["input_key"],
-            result["success"],
-            result["meta"]["validated_at"],
-            result["meta"]["row_count"],
-            result["meta"]["validation_duration_ms"],
-            result["meta"]["rules_total"],
-            result["meta"]["rules_passed"],
-            result["meta"]["rules_failed"],
-            result["meta"]["quality_score"],
-            result["meta"]["null_ratio"],
-            result["meta"]["duplicate_ratio"],
-            result["meta"]["schema_changed"],
-            result["meta"]["invalid_row_count"],
-        )
+        (list(run_ids),),
     )
+    return {row[0] for row in cur.fetchall()}
@@ -0,0 +1,110 @@
+"""
+Benchmark the native rule engine against Great Expectations.
+
+Compiles a sheet's template rules once, then evaluates the same
+expectations on a synthetic frame with GE (legacy pandas validator)
+and with validation_engine.native, and checks the results agree.
+
+    python -m scripts.benchmark_rule_engine --rows 1000000
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from great_expectations.core import ExpectationConfiguration, ExpectationSuite
+
+from template_engine.models import SheetDef
+from validation_engine.native import compile_rules, evaluate_suite
+from validation_engine.validation import run_suite
+
+SHEET = {
+    "name": "bench",
+    "required": True,
+    "columns": {
+        "id": {"required": True, "type": "int"},
+        "amount": {"required": True, "type": "decimal"},
+        "quantity": {"required": False, "type": "int"},
+        "status": {"required": True, "type": "string"},
+        "order_date": {"required": False, "type": "date"},
+    },
+    "rules": [
+        {"name": "not_null_required"},
+        {"name": "positive", "columns": ["amount", "quantity"], "params": {"mostly": 0.95}},
+        {"name": "unique", "columns": ["id"]},
+        {
+            "name": "distinct_values_in_set",
+            "columns": ["status"],
+            "params": {"allowed_values": ["NEW", "PAID", "SHIPPED"], "mostly": 0.99},
+        },
+        {"name": "date_format", "columns": ["order_date"]},
+    ],
+}
+
+
+def make_frame(rows: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+
+    dates = pd.date_range("2020-01-01", periods=1500).strftime("%Y-%m-%d").to_numpy()
+    order_date = rng.choice(dates, rows).astype(object)
+    order_date[rng.random(rows) < 0.001] = "2024-02-30"
+
+    amount = rng.normal(100, 40, rows)
+    amount[rng.random(rows) < 0.01] = np.nan
+
+    return pd.DataFrame(
+        {
+            "id": rng.permutation(rows) + (rng.random(rows) < 0.0005),
+            "amount": amount,
+            "quantity": rng.integers(-1, 100, rows),
+            "status": rng.choice(["NEW", "PAID", "SHIPPED", "LOST"], rows, p=[0.4, 0.4, 0.195, 0.005]),
+            "order_date": order_date,
+        }
+    )
+
+
+def _counts(ge_result: dict) -> list[tuple]:
+    return [
+        (
+            r["expectation_config"]["expectation_type"],
+            r["expectation_config"]["kwargs"].get("column"),
+            r["success"],
+            r["result"].get("unexpected_count"),
+        )
+        for r in ge_result["results"]
+    ]
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--rows", type=int, default=1_000_000)
+    args = arg_parser.parse_args()
+
+    df = make_frame(args.rows)
+    sheet = SheetDef(**SHEET)
+
+    rule_suite = compile_rules(sheet, df)
+    suite = ExpectationSuite(
+        expectation_suite_name=rule_suite.name,
+        expectations=[ExpectationConfiguration(**e) for e in rule_suite.expectations],
+    )
+
+    started = time.perf_counter()
+    ge_result = run_suite(df, suite)
+    ge_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    native_result = evaluate_suite(df, rule_suite)
+    native_seconds = time.perf_counter() - started
+
+    assert _counts(ge_result) == _counts(native_result), "results differ"
+
+    print(f"rows         {args.rows}")
+    print(f"expectations {len(rule_suite.expectations)}")
+    print(f"ge           {ge_seconds:8.2f}s")
+    print(f"native       {native_seconds:8.2f}s")
+    print(f"speedup      {ge_seconds / native_seconds:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
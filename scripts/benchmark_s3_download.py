@@ -0,0 +1,135 @@
+"""
+Benchmark sequential vs ranged parallel S3 downloads.
+
+By default runs against an in-process S3 stand-in that caps every
+response stream at --stream-mbps (mimicking per-connection S3
+bandwidth). Pass --endpoint-url to run against a local S3-compatible
+server (MinIO, moto_server, LocalStack) instead.
+
+    python -m scripts.benchmark_s3_download --size-mb 256
+    python -m scripts.benchmark_s3_download --endpoint-url http://localhost:9000
+"""
+import argparse
+import io
+import os
+import time
+
+import boto3
+
+from data_loader.s3_loader import download_file
+
+BENCH_BUCKET = "dq-benchmark"
+BENCH_KEY = "bench/object.bin"
+
+
+class _ThrottledBody:
+    def __init__(self, payload: bytes, bytes_per_second: float, latency: float):
+        self._stream = io.BytesIO(payload)
+        self._rate = bytes_per_second
+        self._latency = latency
+
+    def iter_chunks(self, chunk_size: int):
+        time.sleep(self._latency)
+        while True:
+            started = time.perf_counter()
+            chunk = self._stream.read(chunk_size)
+            if not chunk:
+                return
+            # Sleep off whatever time the chunk "should" have taken
+            remaining = len(chunk) / self._rate - (time.perf_counter() - started)
+            if remaining > 0:
+                time.sleep(remaining)
+            yield chunk
+
+
+class ThrottledS3Stub:
+    """
+    Minimal S3 stand-in: head_object + (ranged) get_object with a
+    bandwidth cap per response stream.
+    """
+
+    def __init__(self, payload: bytes, stream_mbps: float, latency_ms: float):
+        self.payload = payload
+        self.etag = '"bench"'
+        self.rate = stream_mbps * 1024 * 1024
+        self.latency = latency_ms / 1000
+
+    def head_object(self, Bucket: str, Key: str) -> dict:
+        return {"ContentLength": len(self.payload), "ETag": self.etag}
+
+    def get_object(self, Bucket: str, Key: str, Range: str | None = None, IfMatch: str | None = None) -> dict:
+        if IfMatch not in (None, self.etag):
+            raise RuntimeError("PreconditionFailed")
+
+        start, end = 0, len(self.payload) - 1
+        if Range:
+            start, end = (int(v) for v in Range.removeprefix("bytes=").split("-"))
+
+        body = self.payload[start:end + 1]
+        return {
+            "ContentLength": len(body),
+            "Body": _ThrottledBody(body, self.rate, self.latency),
+        }
+
+
+def _run(label: str, client, expected: bytes, env: dict) -> float:
+    os.environ.update(env)
+
+    started = time.perf_counter()
+    with download_file(f"s3://{BENCH_BUCKET}/{BENCH_KEY}", client=client) as spool:
+        elapsed = time.perf_counter() - started
+        with spool.open() as reader:
+            assert reader.read() == expected, f"{label}: payload mismatch"
+
+    mb = len(expected) / (1024 * 1024)
+    print(f"{label:<12} {elapsed:8.2f}s  {mb / elapsed:8.1f} MB/s")
+    return elapsed
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--size-mb", type=int, default=256)
+    arg_parser.add_argument("--part-size-mb", type=int, default=16)
+    arg_parser.add_argument("--workers", type=int, default=8)
+    arg_parser.add_argument("--stream-mbps", type=float, default=80.0)
+    arg_parser.add_argument("--latency-ms", type=float, default=20.0)
+    arg_parser.add_argument("--endpoint-url")
+    args = arg_parser.parse_args()
+
+    payload = os.urandom(args.size_mb * 1024 * 1024)
+
+    if args.endpoint_url:
+        client = boto3.client("s3", endpoint_url=args.endpoint_url)
+        try:
+            client.create_bucket(Bucket=BENCH_BUCKET)
+        except client.exceptions.BucketAlreadyOwnedByYou:
+            pass
+        client.put_object(Bucket=BENCH_BUCKET, Key=BENCH_KEY, Body=payload)
+    else:
+        client = ThrottledS3Stub(payload, args.stream_mbps, args.latency_ms)
+
+    common = {"S3_SPOOL_THRESHOLD_MB": "64"}
+
+    sequential = _run(
+        "sequential",
+        client,
+        payload,
+        {**common, "S3_PARALLEL_THRESHOLD_MB": str(args.size_mb + 1)},
+    )
+    parallel = _run(
+        "parallel",
+        client,
+        payload,
+        {
+            **common,
+            "S3_PARALLEL_THRESHOLD_MB": "0",
+            "S3_PART_SIZE_MB": str(args.part_size_mb),
+            "S3_MAX_WORKERS": str(args.workers),
+        },
+    )
+
+    print(f"speedup      {sequential / parallel:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,444 @@
+"""
+Check the schema migrations against a real PostgreSQL.
+
+Two scratch databases are created next to the configured one (the DB
+role needs CREATEDB):
+
+- empty:  every migration applied from scratch
+- legacy: the pre-migration schema (0001, as db/schema.sql used to
+          create it) filled with result rows spread over several
+          months, then migrated
+
+Both must end up with partitioned result tables whose rows, ids and
+views are unchanged, whose ids keep increasing, where
+dq.create_monthly_partition moves rows out of the default partition
+and whose quality rollups match the runs they summarize. The result
+writers (COPY and multi-row INSERT) and the result sink delivery run
+against the migrated tables. The scratch databases are dropped at the
+end.
+
+    APP_ENV=ci python -m scripts.check_migrations --runs 300
+"""
+import argparse
+import random
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import psycopg2
+
+from core.settings import load_settings
+from db.bulk import BulkWriter
+from db.connection import SEARCH_PATH
+from db.migrate import Migration, applied_migrations, load_migrations, migrate
+from repository.quality_rollup_repository import (
+    ensure_result_partitions,
+    get_quality_history,
+    refresh_quality_rollups,
+)
+from repository.structural_validation_repository import add_structural_result
+from repository.validation_rule_repository import add_rule_results
+from repository.validation_run_repository import add_validation_run, get_existing_runs
+from validation_engine.result_sink import (
+    ResultRecord,
+    deliver_records,
+    is_permanent_failure,
+)
+
+RESULT_TABLES = (
+    "structural_validation_results",
+    "validation_runs",
+    "validation_rule_results",
+)
+VIEWS = ("v_validation_runs", "v_validation_metrics", "v_validation_rule_stats")
+DATASETS = ("s3://check/orders.csv", "s3://check/sales.xlsx", "s3://check/events.parquet")
+RULES_PER_RUN = 4
+
+
+# -------------------------------------------------------------------
+# Scratch databases
+# -------------------------------------------------------------------
+@contextmanager
+def scratch_database(name: str):
+    """
+    Create database `name`, yield a cursor factory for it (one
+    transaction per cursor, like db.connection.get_db_cursor), drop it.
+    """
+    credentials = load_settings().db_credentials()
+
+    admin = psycopg2.connect(**credentials, connect_timeout=5)
+    admin.autocommit = True
+    with admin.cursor() as cur:
+        cur.execute(f"DROP DATABASE IF EXISTS {name}")
+        cur.execute(f"CREATE DATABASE {name}")
+
+    @contextmanager
+    def cursor():
+        conn = psycopg2.connect(
+            **{**credentials, "database": name},
+            connect_timeout=5,
+            options=f"-c search_path={SEARCH_PATH.replace(' ', '')}",
+        )
+        try:
+            with conn, conn.cursor() as cur:
+                yield cur
+        finally:
+            conn.close()
+
+    try:
+        yield cursor
+    finally:
+        with admin.cursor() as cur:
+            cur.execute(f"DROP DATABASE IF EXISTS {name} WITH (FORCE)")
+        admin.close()
+
+
+# -------------------------------------------------------------------
+# Result rows
+# -------------------------------------------------------------------
+def add_run(writer: BulkWriter, validated_at: datetime, rng: random.Random) -> str:
+    """
+    Buffer one run (summary, structural result, rule results) as
+    handle_file does.
+    """
+    run_id = str(uuid.uuid4())
+    rules_passed = rng.randint(0, RULES_PER_RUN)
+    meta = {
+        "run_id": run_id,
+        "input_key": rng.choice(DATASETS),
+        "validated_at": validated_at,
+        "template_id": "check",
+        "template_version": 1,
+        "sheet_name": "data",
+    }
+
+    add_structural_result(
+        {"passed": True, "errors": [], "warnings": ["tab\there"]},
+        meta,
+        meta["sheet_name"],
+        writer,
+    )
+    add_rule_results(
+        {
+            "meta": meta,
+            "results": [
+                {
+                    "expectation_config": {
+                        "expectation_type": "expect_column_values_to_not_be_null",
+                        "kwargs": {"column": f"col_{rule}"},
+                    },
+                    "success": rule < rules_passed,
+                    "result": {"unexpected_count": 0 if rule < rules_passed else rule + 1},
+                    "meta": {"duration_ms": 0.25},
+                }
+                for rule in range(RULES_PER_RUN)
+            ],
+        },
+        writer,
+    )
+    add_validation_run(
+        {
+            "success": rules_passed == RULES_PER_RUN,
+            "meta": {
+                **meta,
+                "row_count": rng.randint(1, 10_000),
+                "validation_duration_ms": rng.randint(5, 500),
+                "rules_total": RULES_PER_RUN,
+                "rules_passed": rules_passed,
+                "rules_failed": RULES_PER_RUN - rules_passed,
+                "quality_score": round(rules_passed / RULES_PER_RUN, 4),
+                "null_ratio": 0.0,
+                "duplicate_ratio": 0.0,
+                "schema_changed": False,
+                "invalid_row_count": RULES_PER_RUN - rules_passed,
+            },
+        },
+        writer,
+    )
+    return run_id
+
+
+def month_start(moment: datetime, months: int = 0) -> datetime:
+    index = moment.year * 12 + moment.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+# -------------------------------------------------------------------
+# Checks
+# -------------------------------------------------------------------
+def snapshot(cur) -> dict:
+    """
+    Row count, largest id and a digest of the rows of every result
+    table and view.
+    """
+    state = {}
+    for table in RESULT_TABLES:
+        cur.execute(
+            f"""
+            SELECT COUNT(*), MAX(id), md5(string_agg(to_jsonb(t)::text, '|' ORDER BY id))
+            FROM dq.{table} t
+            """
+        )
+        state[table] = cur.fetchone()
+
+    for view in VIEWS:
+        cur.execute(
+            f"""
+            SELECT COUNT(*), md5(string_agg(to_jsonb(v)::text, '|' ORDER BY to_jsonb(v)::text))
+            FROM dq.{view} v
+            """
+        )
+        state[view] = cur.fetchone()
+    return state
+
+
+def check_partitioned(cur) -> None:
+    for table in RESULT_TABLES:
+        cur.execute("SELECT relkind FROM pg_class WHERE oid = %s::regclass", (f"dq.{table}",))
+        assert cur.fetchone()[0] == "p", f"{table} is not partitioned"
+
+        cur.execute(f"SELECT COUNT(*) FROM dq.{table}_default")
+        assert cur.fetchone()[0] == 0, f"{table}_default is not empty"
+
+        cur.execute(
+            """
+            SELECT COUNT(*) FROM pg_indexes
+            WHERE schemaname = 'dq' AND tablename = %s AND indexdef LIKE '%%(dataset, validated_at)'
+            """,
+            (table,),
+        )
+        assert cur.fetchone()[0] == 1, f"{table} has no (dataset, validated_at) index"
+
+
+def check_ids_increase(cursor, before: dict, rng: random.Random) -> None:
+    writer = BulkWriter()
+    add_run(writer, datetime.utcnow(), rng)
+    with cursor() as cur:
+        writer.flush(cur)
+
+    with cursor() as cur:
+        for table in RESULT_TABLES:
+            cur.execute(
+                f"SELECT MIN(id) FROM dq.{table} WHERE id > %s",
+                (before[table][1] or 0,),
+            )
+            assert cur.fetchone()[0] is not None, f"{table}: new id not above {before[table][1]}"
+
+
+def check_default_partition(cursor, rng: random.Random) -> None:
+    """
+    A run beyond the partitions created ahead lands in the default
+    partition; creating its month moves it out.
+    """
+    far_month = month_start(datetime.utcnow(), 12)
+
+    writer = BulkWriter("values")
+    add_run(writer, far_month + timedelta(days=3), rng)
+    with cursor() as cur:
+        writer.flush(cur)
+
+    with cursor() as cur:
+        for table in RESULT_TABLES:
+            cur.execute(f"SELECT COUNT(*) FROM dq.{table}_default")
+            assert cur.fetchone()[0] > 0, f"{table}: far-future row not in the default partition"
+
+            cur.execute(f"SELECT COUNT(*) FROM dq.{table}")
+            total = cur.fetchone()[0]
+
+            cur.execute("SELECT dq.create_monthly_partition(%s, %s)", (table, far_month.date()))
+
+            cur.execute(f"SELECT COUNT(*) FROM dq.{table}_default")
+            assert cur.fetchone()[0] == 0, f"{table}: rows left in the default partition"
+
+            partition = f"{table}_{far_month:%Y_%m}"
+            cur.execute(f"SELECT COUNT(*) FROM dq.{partition}")
+            assert cur.fetchone()[0] > 0, f"{partition}: rows not moved"
+
+            cur.execute(f"SELECT COUNT(*) FROM dq.{table}")
+            assert cur.fetchone()[0] == total, f"{table}: rows lost moving out of the default partition"
+
+
+def check_rollups(cursor, since: datetime, refresh: bool = True) -> int:
+    """
+    Daily and hourly rollups against the runs they summarize, after
+    refreshing them from `since` (or as they are). Returns the number
+    of daily buckets compared.
+    """
+    if refresh:
+        with cursor() as cur:
+            refresh_quality_rollups(since, cur)
+
+    buckets = 0
+    with cursor() as cur:
+        for granularity in ("hour", "day"):
+            cur.execute(
+                """
+                SELECT dataset, date_trunc(%s, validated_at), COUNT(*),
+                       SUM(rules_passed), AVG(quality_score)
+                FROM dq.validation_runs
+                WHERE validated_at >= date_trunc('day', %s::timestamp)
+                GROUP BY 1, 2
+                """,
+                (granularity, since),
+            )
+            expected = {(dataset, bucket): rest for dataset, bucket, *rest in cur.fetchall()}
+
+            actual = {}
+            for dataset in DATASETS:
+                for row in get_quality_history(dataset, since, granularity, cur):
+                    actual[(dataset, row["bucket_start"])] = [
+                        row["runs"],
+                        row["rules_passed"],
+                        row["quality_score_avg"],
+                    ]
+
+            assert actual.keys() == expected.keys(), f"{granularity} rollup buckets differ"
+            for key, (runs, rules_passed, quality) in expected.items():
+                assert actual[key][:2] == [runs, rules_passed], f"{granularity} rollup {key} differs"
+                assert abs(actual[key][2] - float(quality)) < 1e-9, f"{granularity} rollup {key} differs"
+
+            if granularity == "day":
+                buckets = len(actual)
+    return buckets
+
+
+def check_sink_delivery(cursor, rng: random.Random) -> None:
+    """
+    Result sink delivery into the partitioned tables: runs stored once,
+    a replay is skipped, a rejected row is a permanent failure.
+    """
+    writer = BulkWriter()
+    run_id = add_run(writer, datetime.utcnow(), rng)
+    record = ResultRecord(run_id=run_id, tables=dict(writer.tables))
+
+    deliver_records([record], "copy", cursor=cursor)
+    deliver_records([record], "copy", cursor=cursor)
+    with cursor() as cur:
+        assert get_existing_runs([run_id], cur) == {run_id}
+        cur.execute("SELECT COUNT(*) FROM dq.validation_runs WHERE run_id = %s", (run_id,))
+        assert cur.fetchone()[0] == 1, "replayed run stored twice"
+
+    columns, rows = record.tables["validation_runs"]
+    broken_row = list(rows[0])
+    broken_row[0] = str(uuid.uuid4())
+    broken_row[columns.index("rules_total")] = "not a number"
+    broken = ResultRecord(run_id=broken_row[0], tables={"validation_runs": (columns, [tuple(broken_row)])})
+    try:
+        deliver_records([broken], "copy", cursor=cursor)
+    except psycopg2.Error as exc:
+        assert is_permanent_failure(exc), f"{type(exc).__name__} not treated as permanent"
+    else:
+        raise AssertionError("invalid row accepted")
+
+
+def check_migration_history(cursor, migrations: list[Migration]) -> None:
+    assert migrate(migrations, cursor=cursor) == [], "migrations applied twice"
+
+    with cursor() as cur:
+        assert applied_migrations(cur) == {m.version: m.checksum for m in migrations}
+
+    edited = [
+        Migration(m.version, m.name, m.sql + "\n-- edited") if m.version == 1 else m
+        for m in migrations
+    ]
+    try:
+        migrate(edited, cursor=cursor)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("edited migration not rejected")
+
+
+# -------------------------------------------------------------------
+# Scenarios
+# -------------------------------------------------------------------
+def check_empty(name: str, rng: random.Random) -> None:
+    migrations = load_migrations()
+
+    with scratch_database(name) as cursor:
+        applied = migrate(migrations, cursor=cursor)
+        assert [m.version for m in applied] == [m.version for m in migrations]
+
+        with cursor() as cur:
+            check_partitioned(cur)
+            before = snapshot(cur)
+            ensure_result_partitions(3, cur)
+            ensure_result_partitions(3, cur)
+
+        check_ids_increase(cursor, before, rng)
+        check_default_partition(cursor, rng)
+        check_sink_delivery(cursor, rng)
+        buckets = check_rollups(cursor, datetime.utcnow() - timedelta(days=1))
+        check_migration_history(cursor, migrations)
+
+    print(f"empty   : {len(applied)} migrations applied, {buckets} daily rollup buckets checked")
+
+
+def check_legacy(name: str, runs: int, months: int, rng: random.Random) -> None:
+    migrations = load_migrations()
+    baseline = migrations[0]
+    now = datetime.utcnow()
+    first_month = month_start(now, -months)
+
+    with scratch_database(name) as cursor:
+        # The schema db/schema.sql created before migrations existed
+        with cursor() as cur:
+            cur.execute(baseline.sql)
+
+        writer = BulkWriter()
+        span_s = int((now - first_month).total_seconds())
+        for _ in range(runs):
+            add_run(writer, first_month + timedelta(seconds=rng.randrange(span_s)), rng)
+        with cursor() as cur:
+            writer.flush(cur)
+            before = snapshot(cur)
+
+        applied = migrate(migrations, cursor=cursor)
+        assert [m.version for m in applied] == [m.version for m in migrations]
+
+        with cursor() as cur:
+            after = snapshot(cur)
+            check_partitioned(cur)
+
+            cur.execute(
+                """
+                SELECT COUNT(*) FROM pg_inherits
+                WHERE inhparent = 'dq.validation_runs'::regclass
+                """
+            )
+            partitions = cur.fetchone()[0]
+
+        for key, value in before.items():
+            assert after[key] == value, f"{key} changed by the migration: {value} -> {after[key]}"
+
+        # 0003 rolled up the existing history
+        buckets = check_rollups(cursor, first_month, refresh=False)
+
+        check_ids_increase(cursor, before, rng)
+        check_default_partition(cursor, rng)
+        check_sink_delivery(cursor, rng)
+        check_rollups(cursor, first_month)
+        check_migration_history(cursor, migrations)
+
+    print(
+        f"legacy  : {runs} runs over {months + 1} months migrated, "
+        f"rows / ids / views unchanged, {partitions} validation_runs partitions, "
+        f"{buckets} daily rollup buckets checked"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=300)
+    parser.add_argument("--months", type=int, default=5, help="History months before the current one")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    check_empty("dq_migration_check_empty", rng)
+    check_legacy("dq_migration_check_legacy", args.runs, args.months, rng)
+    print("OK: migrations verified on", load_settings().db_credentials()["host"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+"""
+Check that spooled results survive database outages and restarts.
+
+Runs the result sink against an in-process PostgreSQL stand-in that
+keeps committed COPY rows in memory and can be taken down or fail
+randomly. Runs are submitted while the database is down; the first
+writer "crashes" after each commit, before it can clear the spool; a
+second writer on the same spool directory replays what is left. Every
+run must end up in the stand-in exactly once, except the "poison" runs
+whose rows the stand-in always rejects (DataError): those must be set
+aside without holding up the runs behind them.
+
+    python -m scripts.check_result_sink --runs 200 --failure-rate 0.2 --poison 3
+"""
+import argparse
+import random
+import re
+import tempfile
+import time
+import uuid
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+
+import psycopg2
+
+from db.bulk import BulkWriter
+from repository.structural_validation_repository import add_structural_result
+from repository.validation_rule_repository import add_rule_results
+from repository.validation_run_repository import add_validation_run
+from validation_engine.result_sink import (
+    ResultRecord,
+    ResultSink,
+    ResultSpool,
+    deliver_records,
+)
+
+RULES_PER_RUN = 25
+
+# Marks the rows of runs the stand-in rejects
+POISON = "poison"
+
+_UNESCAPE = {"\\\\": "\\", "\\t": "\t", "\\n": "\n", "\\r": "\r"}
+
+
+def _copy_field(text: str):
+    if text == r"\N":
+        return None
+    return re.sub(r"\\[\\tnr]", lambda m: _UNESCAPE[m.group()], text)
+
+
+class PostgresStandIn:
+    """
+    Committed rows per table. A transaction's COPY rows become visible
+    on commit only; `down` refuses connections, `failure_rate`
+    aborts that share of COPY statements and rows mentioning POISON
+    are always rejected.
+    """
+
+    def __init__(self, failure_rate: float, seed: int):
+        self.tables: dict[str, list[dict]] = defaultdict(list)
+        self.down = False
+        self.failure_rate = failure_rate
+        self.random = random.Random(seed)
+
+    @contextmanager
+    def cursor(self):
+        if self.down:
+            raise psycopg2.OperationalError("stand-in database is down")
+
+        cur = _StandInCursor(self)
+        yield cur
+        for table, rows in cur.staged.items():
+            self.tables[table].extend(rows)
+
+
+class _StandInCursor:
+    def __init__(self, db: PostgresStandIn):
+        self.db = db
+        self.staged: dict[str, list[dict]] = defaultdict(list)
+        self._result: list[tuple] = []
+
+    def execute(self, sql: str, params=None) -> None:
+        # get_existing_runs
+        if "FROM validation_runs" not in sql:
+            raise NotImplementedError(sql)
+        wanted = set(params[0])
+        self._result = [
+            (row["run_id"],)
+            for row in self.db.tables["validation_runs"]
+            if row["run_id"] in wanted
+        ]
+
+    def fetchall(self) -> list[tuple]:
+        return self._result
+
+    def copy_expert(self, sql: str, file) -> None:
+        table, columns = re.match(r"COPY (\w+) \(([^)]*)\) FROM STDIN", sql).groups()
+        columns = [column.strip() for column in columns.split(",")]
+
+        if self.db.random.random() < self.db.failure_rate:
+            raise psycopg2.OperationalError("stand-in: connection lost during COPY")
+
+        chunks = []
+        while chunk := file.read(8192):
+            chunks.append(chunk)
+
+        for line in "".join(chunks).splitlines():
+            if POISON in line:
+                raise psycopg2.DataError("stand-in: invalid input syntax")
+            fields = [_copy_field(text) for text in line.split("\t")]
+            self.staged[table].append(dict(zip(columns, fields, strict=True)))
+
+
+class _Crash(Exception):
+    pass
+
+
+def _crash_after_commit(records: list[ResultRecord], method: str, db: PostgresStandIn) -> None:
+    deliver_records(records, method, cursor=db.cursor)
+    # Delivered and committed, but the spool files are never removed
+    raise _Crash("writer died before clearing the spool")
+
+
+def _record(index: int, poison: bool = False) -> ResultRecord:
+    run_id = str(uuid.uuid4())
+    validated_at = datetime.utcnow()
+    meta = {
+        "run_id": run_id,
+        "input_key": f"s3://check/{POISON if poison else 'run'}-{index}.csv",
+        "validated_at": validated_at,
+        "template_id": "check",
+        "template_version": 1,
+        "sheet_name": "data\twith tab",
+    }
+
+    writer = BulkWriter()
+    add_structural_result(
+        {"passed": True, "errors": [], "warnings": ["back\\slash\nnewline"]},
+        meta,
+        meta["sheet_name"],
+        writer,
+    )
+    add_rule_results(
+        {
+            "meta": meta,
+            "results": [
+                {
+                    "expectation_config": {
+                        "expectation_type": "expect_column_values_to_not_be_null",
+                        "kwargs": {"column": f"col_{rule}"},
+                    },
+                    "success": rule % 3 != 0,
+                    "result": {"unexpected_count": rule},
+                    "meta": {"duration_ms": 0.5},
+                }
+                for rule in range(RULES_PER_RUN)
+            ],
+        },
+        writer,
+    )
+    add_validation_run(
+        {
+            "success": True,
+            "meta": {
+                **meta,
+                "row_count": 1000,
+                "validation_duration_ms": 10,
+                "rules_total": RULES_PER_RUN,
+                "rules_passed": RULES_PER_RUN,
+                "rules_failed": 0,
+                "quality_score": 1.0,
+                "null_ratio": 0.0,
+                "duplicate_ratio": 0.0,
+                "schema_changed": False,
+                "invalid_row_count": 0,
+            },
+        },
+        writer,
+    )
+    return ResultRecord(run_id=run_id, tables=writer.tables)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--batch-runs", type=int, default=16)
+    parser.add_argument("--failure-rate", type=float, default=0.2)
+    parser.add_argument("--poison", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    db = PostgresStandIn(args.failure_rate, args.seed)
+    records = [_record(index) for index in range(args.runs)]
+    poisoned = [_record(args.runs + index, poison=True) for index in range(args.poison)]
+    # Spread over the queue, first one at its head
+    for index, record in enumerate(poisoned):
+        records.insert(index * len(records) // max(len(poisoned), 1), record)
+
+    with tempfile.TemporaryDirectory() as directory:
+        # 1. database down: runs are only spooled
+        db.down = True
+        first = ResultSink(
+            ResultSpool(directory),
+            batch_runs=args.batch_runs,
+            retry_max_s=0.05,
+            deliver=partial(_crash_after_commit, db=db),
+        )
+        started = time.perf_counter()
+        for record in records[: args.runs // 2]:
+            first.submit(record)
+        acknowledged_s = time.perf_counter() - started
+        time.sleep(0.2)
+        assert not db.tables["validation_runs"], "nothing can be delivered while down"
+
+        # 2. database back: the first writer commits, then dies every time
+        db.down = False
+        for record in records[args.runs // 2:]:
+            first.submit(record)
+        time.sleep(0.5)
+        first.close(timeout=1)
+
+        # 3. restart: a new writer replays the spool
+        second = ResultSink(
+            ResultSpool(directory),
+            batch_runs=args.batch_runs,
+            retry_max_s=0.05,
+            deliver=partial(deliver_records, cursor=db.cursor),
+        )
+        drained = second.close(timeout=60)
+        set_aside = {path.name.split("-", 1)[1].removesuffix(".bad") for path in Path(directory).glob("*.bad")}
+
+    runs = [row["run_id"] for row in db.tables["validation_runs"]]
+    rules = db.tables["validation_rule_results"]
+    structural = db.tables["structural_validation_results"]
+    expected = {record.run_id for record in records} - {record.run_id for record in poisoned}
+
+    print(f"runs submitted      : {len(records)} (acknowledged in {acknowledged_s * 1000:.0f} ms while down)")
+    print(f"runs delivered      : {len(set(runs))} (rows {len(runs)})")
+    print(f"rule result rows    : {len(rules)} (expected {len(expected) * RULES_PER_RUN})")
+    print(f"structural rows     : {len(structural)}")
+    print(f"spool drained       : {drained}")
+    print(f"poison runs aside   : {len(set_aside)} (expected {len(poisoned)})")
+
+    assert drained, "spool not drained"
+    assert set(runs) == expected and len(runs) == len(expected), "lost or duplicated runs"
+    assert len(rules) == len(expected) * RULES_PER_RUN, "lost or duplicated rule rows"
+    assert len(structural) == len(expected), "lost or duplicated structural rows"
+    assert set_aside == {record.run_id for record in poisoned}, "poison runs not set aside"
+    assert {row["sheet_name"] for row in structural} == {"data\twith tab"}
+    print("OK: no data lost, nothing written twice")
+
+
+if __name__ == "__main__":
+    main()
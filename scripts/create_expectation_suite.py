@@ -6,14 +6,14 @@ from pathlib import Path
 import great_expectations as ge
 
 from core.logging_config import setup_logging
-from data_loader.s3_loader import download_file_bytes
+from data_loader.s3_loader import download_file
 from file_parser.csv import CsvParser
 from file_parser.excel import ExcelParser
 from file_parser.iceberg import IcebergParser
 from file_parser.parquet import ParquetParser
 from template_engine.registry import TemplateRegistry
 from template_engine.resolver import TemplateResolver
-from validation_engine.rule_registry import apply_rule
+from validation_engine.rule_registry import apply_sheet_rules
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 TEMPLATES_DIR = PROJECT_ROOT / "templates"
@@ -82,24 +82,24 @@ def main():
         )
 
     else:
-        file_bytes = download_file_bytes(args.dataset)
+        source = download_file(args.dataset)
 
         if template.file_type == "parquet":
             df = data_parser.read(
-                file_bytes=file_bytes,
+                source=source.open(),
                 usecols=list(sheet.columns.keys()) if sheet.columns else None,
             )
 
         elif template.file_type == "csv":
             df = data_parser.read(
-                file_bytes=file_bytes,
+                source=source.open(),
                 header=sheet.header_row,
                 usecols=list(sheet.columns.keys()) if sheet.columns else None,
             )
 
         elif template.file_type == "excel":
             df = data_parser.read(
-                file_bytes=file_bytes,
+                source=source.open(),
                 sheet_name=sheet.name,
                 header=sheet.header_row,
                 usecols=list(sheet.columns.keys()) if sheet.columns else None,
@@ -108,6 +108,8 @@ def main():
         else:
             raise ValueError(f"Unsupported file type for suite creation: {template.file_type}")
 
+        source.close()
+
     validator = ge.from_pandas(df)
     validator.context = context
     validator._expectation_suite.expectation_suite_name = args.suite_name
@@ -130,20 +132,14 @@ def main():
             if e.expectation_type != "expect_column_values_to_be_of_type"
         ]
 
-    # Always ensure expected columns exist
-    for column in (sheet.columns or {}).keys():
-        validator.expect_column_to_exist(column)
-
     if not sheet.rules:
         raise ValueError(
             f"No rules defined for sheet '{sheet.name}' "
             f"in template '{template.template_id}'"
         )
 
-    for rule in sheet.rules:
-        apply_rule(rule, validator, sheet)
-
-    validator.expect_table_row_count_to_be_between(min_value=1)
+    # Column existence + rules + non-empty table
+    apply_sheet_rules(validator, sheet)
     context.save_expectation_suite(validator._expectation_suite)
 
     # DEV-ONLY: build Data Docs
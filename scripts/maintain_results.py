@@ -0,0 +1,57 @@
+"""
+Maintenance job for the result tables; schedule it hourly
+(cron, EventBridge, pg_cron calling the same SQL functions).
+
+- creates the monthly partitions of the coming months
+- refreshes the hourly / daily quality rollups of the last
+  --lookback-hours (runs delivered late from the result spool
+  are picked up as long as they fall in that window)
+
+    python -m scripts.maintain_results
+    python -m scripts.maintain_results --lookback-hours 720   # backfill a month
+"""
+import argparse
+import logging
+import time
+from datetime import datetime, timedelta
+
+from core.logging_config import setup_logging
+from db.connection import close_pool, get_db_cursor
+from repository.quality_rollup_repository import (
+    ensure_result_partitions,
+    refresh_quality_rollups,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    setup_logging()
+
+    parser = argparse.ArgumentParser(description="Result table partitions and quality rollups")
+    parser.add_argument("--months-ahead", type=int, default=3)
+    parser.add_argument("--lookback-hours", type=int, default=48)
+    args = parser.parse_args()
+
+    since = datetime.utcnow() - timedelta(hours=args.lookback_hours)
+    started = time.perf_counter()
+
+    try:
+        with get_db_cursor() as cur:
+            ensure_result_partitions(args.months_ahead, cur)
+
+        with get_db_cursor() as cur:
+            refresh_quality_rollups(since, cur)
+    finally:
+        close_pool()
+
+    logger.info(
+        "Result maintenance done | months_ahead=%d since=%s duration_ms=%d",
+        args.months_ahead,
+        since.isoformat(),
+        (time.perf_counter() - started) * 1000,
+    )
+
+
+if __name__ == "__main__":
+    main()
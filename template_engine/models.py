@@ -33,6 +33,24 @@ class RuleDef(BaseModel):
     name: str
     columns: list[str] | None = None
     params: dict[str, Any] | None = None
+    # Fail-fast runs stop the sheet when this rule fails
+    blocking: bool = False
+
+class ApproximateDef(BaseModel):
+    """
+    Opt-in approximate validation for very large tables: one streaming
+    pass keeps exact row / null counts, HyperLogLog sketches for
+    uniqueness and distinct counts, and a uniform sample of
+    `sample_rows` rows on which row-level rules are evaluated.
+    """
+
+    enabled: bool = True
+    sample_rows: int = Field(1_000_000, ge=1)
+    confidence: float = Field(0.95, gt=0, lt=1)
+    hll_precision: int = Field(14, ge=4, le=18)
+    # Fixed by default: the same table gives the same sample
+    seed: int | None = 0
+
 
 class SheetDef(BaseModel):
     name: str
@@ -41,6 +59,8 @@ class SheetDef(BaseModel):
     columns: dict[str, ColumnDef] | None = None
     rules: list[RuleDef] | None = None
     expectation_suite: list[str] | None = None
+    # Overrides the template's setting (enabled: false opts a sheet out)
+    approximate: ApproximateDef | None = None
 
     def validate(self) -> None:
         if self.header_row is not None and self.header_row < 1:
@@ -72,6 +92,16 @@ class TemplateDef(BaseModel):
     file_type: str
     file_pattern: str
     sheets: list[SheetDef]
+    # Iceberg only: validate the snapshots appended since the last run
+    incremental: bool = False
+    approximate: ApproximateDef | None = None
+
+    def approximation(self, sheet: SheetDef) -> ApproximateDef | None:
+        """
+        Approximate settings in effect for `sheet`, None when exact.
+        """
+        settings = sheet.approximate or self.approximate
+        return settings if settings is not None and settings.enabled else None
 
     def validate(self) -> None:
         if not self.sheets:
@@ -79,6 +109,20 @@ class TemplateDef(BaseModel):
                 f"Template '{self.template_id}': no sheets defined"
             )
 
+        if self.incremental and self.file_type != "iceberg":
+            raise ValueError(
+                f"Template '{self.template_id}': incremental is only supported "
+                f"for iceberg tables"
+            )
+
+        if self.incremental and any(
+            self.approximation(sheet) for sheet in self.sheets
+        ):
+            raise ValueError(
+                f"Template '{self.template_id}': approximate validation is not "
+                f"supported for incremental templates"
+            )
+
         sheet_names = set()
         for sheet in self.sheets:
             if sheet.name in sheet_names:
@@ -0,0 +1,591 @@
+import logging
+import math
+import time
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from validation_engine.hashing import hash_frame
+from validation_engine.profile import FrameProfile
+from validation_engine.results import map_result, mostly_success, suite_result
+from validation_engine.validation import compute_metrics, run_suite_with_profile
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PRECISION = 14
+
+# Distinct values per register up to which linear counting is used
+LINEAR_COUNTING_LOAD = 3
+
+# Answered exactly from the full scan (row count; not-null checks use
+# the scan's null counts as well)
+ROW_COUNT_EXPECTATIONS = {
+    "expect_table_row_count_to_be_between",
+    "expect_table_row_count_to_equal",
+}
+
+# Answered from HyperLogLog sketches of the full scan
+DISTINCT_EXPECTATIONS = {
+    "expect_column_values_to_be_unique",
+    "expect_compound_columns_to_be_unique",
+    "expect_column_unique_value_count_to_be_between",
+    "expect_column_proportion_of_unique_values_to_be_between",
+}
+
+# Schema-level: a sample has the same columns as the table
+SCHEMA_EXPECTATIONS = {
+    "expect_column_to_exist",
+    "expect_table_columns_to_match_ordered_list",
+    "expect_table_columns_to_match_set",
+    "expect_table_column_count_to_be_between",
+    "expect_table_column_count_to_equal",
+}
+
+# Sketch of whole rows (duplicate_ratio)
+ROW_KEY = ((), "never")
+
+
+# -------------------------------------------------------------------
+# HyperLogLog
+# -------------------------------------------------------------------
+def _leading_zeros(values: np.ndarray) -> np.ndarray:
+    """
+    Leading zero bits of uint64 values (64 for 0), exact: each 32-bit
+    half fits a float64 mantissa, so frexp gives its bit length.
+    """
+    high = (values >> np.uint64(32)).astype(np.float64)
+    low = (values & np.uint64(0xFFFFFFFF)).astype(np.float64)
+
+    high_bits = np.frexp(high)[1]
+    low_bits = np.frexp(low)[1]
+
+    return np.where(high_bits > 0, 32 - high_bits, 64 - low_bits)
+
+
+class HyperLogLog:
+    """
+    Distinct count sketch over 64-bit hashes (2^precision registers,
+    standard error 1.04 / sqrt(2^precision); 0.81% at precision 14).
+    """
+
+    def __init__(self, precision: int = DEFAULT_PRECISION):
+        if not 4 <= precision <= 18:
+            raise ValueError("HyperLogLog precision must be between 4 and 18")
+
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    @property
+    def relative_error(self) -> float:
+        return 1.04 / math.sqrt(len(self.registers))
+
+    def add(self, hashes: np.ndarray) -> None:
+        if not len(hashes):
+            return
+
+        hashes = hashes.astype(np.uint64, copy=False)
+        index = (hashes >> np.uint64(64 - self.precision)).astype(np.intp)
+        rest = hashes << np.uint64(self.precision)
+
+        rank = np.minimum(_leading_zeros(rest), 64 - self.precision) + 1
+        np.maximum.at(self.registers, index, rank.astype(np.uint8))
+
+    def merge(self, other: "HyperLogLog") -> None:
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches of different precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def count(self) -> float:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.exp2(-self.registers.astype(np.float64)))
+
+        # Small range: linear counting is more accurate, and the raw
+        # estimate is biased up to a few times m; decided on the linear
+        # count itself so the switch does not depend on that bias
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if zeros:
+            linear = m * math.log(m / zeros)
+            if linear <= LINEAR_COUNTING_LOAD * m:
+                estimate = linear
+
+        return float(estimate)
+
+
+# -------------------------------------------------------------------
+# Streaming scan
+# -------------------------------------------------------------------
+def sketch_keys(suites) -> set[tuple[tuple[str, ...], str]]:
+    """
+    (columns, ignore_row_if) of every distinct-value expectation in
+    `suites`; single columns ignore missing values like GE does.
+    """
+    keys = {ROW_KEY}
+    for suite in suites:
+        for expectation in suite.expectations:
+            kwargs = expectation["kwargs"]
+            if expectation["expectation_type"] not in DISTINCT_EXPECTATIONS:
+                continue
+            if "column_list" in kwargs:
+                keys.add(
+                    (
+                        tuple(kwargs["column_list"]),
+                        kwargs.get("ignore_row_if", "all_values_are_missing"),
+                    )
+                )
+            elif isinstance(kwargs.get("column"), str):
+                keys.add(((kwargs["column"],), "any_value_is_missing"))
+    return keys
+
+
+def _considered(frame: pd.DataFrame, columns: tuple[str, ...], ignore_row_if: str) -> np.ndarray:
+    if ignore_row_if == "never" or not columns:
+        return np.ones(len(frame), dtype=bool)
+
+    missing = frame.loc[:, list(columns)].isna().to_numpy()
+    if ignore_row_if == "all_values_are_missing":
+        return ~missing.all(axis=1)
+    if ignore_row_if == "any_value_is_missing":
+        return ~missing.any(axis=1)
+
+    raise ValueError(f"Unsupported ignore_row_if '{ignore_row_if}'")
+
+
+@dataclass
+class SheetScan:
+    """
+    One streaming pass over a sheet: exact row and null counts,
+    HyperLogLog sketches (with the number of rows fed to each) and a
+    uniform random sample of rows, indexed by their row number.
+    """
+
+    row_count: int = 0
+    columns: list[str] = field(default_factory=list)
+    null_counts: Counter = field(default_factory=Counter)
+    sketches: dict[tuple, HyperLogLog] = field(default_factory=dict)
+    considered: Counter = field(default_factory=Counter)
+    sample: pd.DataFrame | None = None
+
+    @property
+    def sample_size(self) -> int:
+        return 0 if self.sample is None else len(self.sample)
+
+    @property
+    def exhaustive(self) -> bool:
+        """
+        Every row made it into the sample: results can be exact.
+        """
+        return self.sample_size == self.row_count
+
+    def distinct(self, key: tuple) -> tuple[float, float]:
+        """
+        (estimate, relative error) of the distinct count for a sketch key,
+        the estimate clamped to the rows the sketch has seen.
+        """
+        sketch = self.sketches[key]
+        return min(sketch.count(), self.considered[key]), sketch.relative_error
+
+
+def scan_batches(
+    batches: Iterable[pd.DataFrame | pa.Table],
+    keys: set[tuple],
+    *,
+    sample_rows: int,
+    precision: int = DEFAULT_PRECISION,
+    seed: int | None = None,
+) -> SheetScan:
+    """
+    Stream `batches` once. The sample is a bottom-k sample on uniform
+    random priorities (equivalent to reservoir sampling, but vectorized):
+    memory stays at `sample_rows` plus one batch.
+    """
+    rng = np.random.default_rng(seed)
+    scan = SheetScan(sketches={key: HyperLogLog(precision) for key in keys})
+
+    priorities = np.empty(0)
+    for batch in batches:
+        frame = batch.to_pandas() if isinstance(batch, pa.Table) else batch
+        if not scan.columns:
+            scan.columns = list(frame.columns)
+        if not len(frame):
+            continue
+
+        frame = frame.set_axis(
+            pd.RangeIndex(scan.row_count, scan.row_count + len(frame)),
+            axis=0,
+        )
+        scan.row_count += len(frame)
+
+        for name in frame.columns:
+            scan.null_counts[name] += int(frame[name].isna().sum())
+
+        for key, sketch in scan.sketches.items():
+            columns, ignore_row_if = key
+            rows = _considered(frame, columns, ignore_row_if)
+            subset = frame.loc[rows, list(columns)] if columns else frame.loc[rows]
+            if len(subset.columns):
+                sketch.add(hash_frame(subset))
+            scan.considered[key] += int(rows.sum())
+
+        # Only rows that beat the current k-th priority can enter the sample
+        batch_priorities = rng.random(len(frame))
+        if len(priorities) >= sample_rows:
+            entering = batch_priorities < priorities.max()
+            frame = frame[entering]
+            batch_priorities = batch_priorities[entering]
+
+        if not len(frame):
+            continue
+
+        sample = frame if scan.sample is None else pd.concat([scan.sample, frame])
+        priorities = np.concatenate([priorities, batch_priorities])
+        if len(priorities) > sample_rows:
+            keep = np.sort(np.argpartition(priorities, sample_rows - 1)[:sample_rows])
+            sample = sample.iloc[keep]
+            priorities = priorities[keep]
+        scan.sample = sample
+
+    if scan.sample is None:
+        scan.sample = pd.DataFrame(columns=scan.columns)
+
+    order = np.argsort(scan.sample.index.to_numpy(), kind="stable")
+    scan.sample = scan.sample.iloc[order]
+    return scan
+
+
+# -------------------------------------------------------------------
+# Estimates
+# -------------------------------------------------------------------
+def z_score(confidence: float) -> float:
+    return NormalDist().inv_cdf(0.5 + confidence / 2)
+
+
+def proportion_interval(
+    hits: int,
+    sampled: int,
+    population: int,
+    z: float,
+) -> tuple[float, float]:
+    """
+    Wilson score interval of a proportion observed on a sample without
+    replacement (finite population correction applied to z).
+    """
+    if sampled <= 0:
+        return 0.0, 1.0
+
+    p = hits / sampled
+    if population <= 1 or sampled >= population:
+        return p, p
+
+    z = z * math.sqrt((population - sampled) / (population - 1))
+    denominator = 1 + z * z / sampled
+    center = (p + z * z / (2 * sampled)) / denominator
+    half = z * math.sqrt(p * (1 - p) / sampled + z * z / (4 * sampled * sampled)) / denominator
+
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+def _between(value: float, kwargs: dict) -> bool:
+    low, high = kwargs.get("min_value"), kwargs.get("max_value")
+    if low is not None and (value <= low if kwargs.get("strict_min") else value < low):
+        return False
+    if high is not None and (value >= high if kwargs.get("strict_max") else value > high):
+        return False
+    return True
+
+
+def _interval_decides(low: float, high: float, kwargs: dict) -> bool:
+    """
+    True when the whole interval is on one side of the between check.
+    """
+    return _between(low, kwargs) == _between(high, kwargs)
+
+
+# -------------------------------------------------------------------
+# Result adjustment
+# -------------------------------------------------------------------
+def _approximate_info(method: str, scan: SheetScan, **figures) -> dict:
+    return {
+        "method": method,
+        "sample_size": scan.sample_size,
+        "population": scan.row_count,
+        **figures,
+    }
+
+
+def _row_count_result(result: dict, kwargs: dict, scan: SheetScan) -> bool:
+    if "value" in kwargs:
+        success = scan.row_count == kwargs["value"]
+    else:
+        success = _between(scan.row_count, kwargs)
+
+    result["success"] = success
+    result["result"] = {"observed_value": scan.row_count}
+    return True
+
+
+def _not_null_result(result: dict, kwargs: dict, scan: SheetScan) -> bool:
+    """
+    Null counts come from the full scan: exact.
+    """
+    nulls = scan.null_counts[kwargs["column"]]
+    result["success"] = mostly_success(scan.row_count, nulls, kwargs.get("mostly"))
+    result["result"] = map_result(scan.row_count, None, nulls, [])
+    return True
+
+
+def _map_result(
+    result: dict,
+    kwargs: dict,
+    scan: SheetScan,
+    z: float,
+) -> bool:
+    """
+    Row-level expectation evaluated on the sample: counts scaled to the
+    table, Wilson interval on the unexpected share. Returns whether the
+    interval settles success either way.
+    """
+    figures = result["result"]
+    sampled = figures["element_count"] - (figures.get("missing_count") or 0)
+    unexpected = figures["unexpected_count"]
+
+    column = kwargs.get("column")
+    if isinstance(column, str) and column in scan.null_counts and "missing_count" in figures:
+        missing = scan.null_counts[column]
+    elif figures["element_count"]:
+        missing = round(scan.row_count * (figures.get("missing_count") or 0) / figures["element_count"])
+    else:
+        missing = 0
+    population = scan.row_count - missing
+
+    share = unexpected / sampled if sampled else 0.0
+    low, high = proportion_interval(unexpected, sampled, population, z)
+    estimate = round(share * population)
+
+    figures["element_count"] = scan.row_count
+    figures["unexpected_count"] = estimate
+    figures["unexpected_percent"] = share * 100 if population else None
+    figures["unexpected_percent_total"] = (
+        estimate / scan.row_count * 100 if scan.row_count and population else None
+    )
+    if "missing_count" in figures:
+        figures["missing_count"] = missing
+        figures["missing_percent"] = missing / scan.row_count * 100 if scan.row_count else None
+        figures["unexpected_percent_nonmissing"] = figures["unexpected_percent"]
+
+    figures["approximate"] = _approximate_info(
+        "sample",
+        scan,
+        unexpected_percent_interval=[low * 100, high * 100],
+    )
+
+    # Success itself stays GE's verdict on the sample (same share)
+    allowed = 1 - kwargs["mostly"] if kwargs.get("mostly") is not None else 0.0
+    return high <= allowed or low > allowed
+
+
+def _distinct_result(
+    result: dict,
+    expectation_type: str,
+    kwargs: dict,
+    scan: SheetScan,
+    z: float,
+) -> bool:
+    """
+    Uniqueness / distinct-count expectation from the sketches.
+    Returns whether the error bound settles success either way.
+    """
+    if "column_list" in kwargs:
+        key = (
+            tuple(kwargs["column_list"]),
+            kwargs.get("ignore_row_if", "all_values_are_missing"),
+        )
+    else:
+        key = ((kwargs["column"],), "any_value_is_missing")
+
+    considered = scan.considered[key]
+    distinct, error = scan.distinct(key)
+    low = max(0.0, distinct * (1 - z * error))
+    high = min(float(considered), distinct * (1 + z * error))
+    info = _approximate_info(
+        "hyperloglog",
+        scan,
+        distinct_count=round(distinct),
+        distinct_count_interval=[round(low), round(high)],
+    )
+
+    if expectation_type == "expect_column_unique_value_count_to_be_between":
+        result["success"] = _between(round(distinct), kwargs)
+        result["result"] = {"observed_value": round(distinct), "approximate": info}
+        return _interval_decides(low, high, kwargs)
+
+    if expectation_type == "expect_column_proportion_of_unique_values_to_be_between":
+        share = distinct / considered if considered else 0.0
+        bounds = (low / considered, high / considered) if considered else (0.0, 0.0)
+        result["success"] = _between(share, kwargs)
+        result["result"] = {"observed_value": share, "approximate": info}
+        return _interval_decides(*bounds, kwargs)
+
+    # Uniqueness: rows repeating an earlier value (the sketch cannot tell
+    # how many rows share each value, so first occurrences are not counted)
+    excess = max(0, round(considered - distinct))
+    excess_low = max(0.0, considered - high)
+    excess_high = max(0.0, considered - low)
+
+    allowed = (1 - kwargs["mostly"]) * considered if kwargs.get("mostly") is not None else 0.0
+    # Duplicates seen in the sample are real duplicates
+    proven = kwargs.get("mostly") is None and result["result"].get("unexpected_count", 0) > 0
+
+    # Fail only on evidence beyond the sketch error
+    result["success"] = not proven and excess_low <= allowed
+
+    figures = result["result"]
+    figures["element_count"] = scan.row_count
+    figures["unexpected_count"] = excess
+    if "missing_count" in figures:
+        figures["missing_count"] = scan.row_count - considered
+        figures["missing_percent"] = (
+            figures["missing_count"] / scan.row_count * 100 if scan.row_count else None
+        )
+    figures["unexpected_percent"] = excess / considered * 100 if considered else None
+    figures["unexpected_percent_total"] = (
+        excess / scan.row_count * 100 if scan.row_count and considered else None
+    )
+    if "unexpected_percent_nonmissing" in figures:
+        figures["unexpected_percent_nonmissing"] = figures["unexpected_percent"]
+    figures["approximate"] = {
+        **info,
+        "unexpected_count_interval": [round(excess_low), round(excess_high)],
+    }
+
+    return proven or excess_high <= allowed or excess_low > allowed
+
+
+def approximate_suite_result(ge_result: dict, scan: SheetScan, z: float) -> tuple[dict, int, int]:
+    """
+    Turn a suite result computed on `scan.sample` into table-level
+    estimates. Returns (ge_result, uncertain_passed, uncertain_failed):
+    expectations whose verdict the error bounds do not settle.
+    """
+    uncertain_passed = uncertain_failed = 0
+
+    for result in ge_result["results"]:
+        config = result["expectation_config"]
+        expectation_type = config["expectation_type"]
+        kwargs = config["kwargs"]
+
+        if result["exception_info"].get("raised_exception") or expectation_type in SCHEMA_EXPECTATIONS:
+            settled = True
+        elif (
+            expectation_type == "expect_column_values_to_not_be_null"
+            and kwargs.get("column") in scan.null_counts
+        ):
+            settled = _not_null_result(result, kwargs, scan)
+        elif expectation_type in ROW_COUNT_EXPECTATIONS:
+            settled = _row_count_result(result, kwargs, scan)
+        elif expectation_type in DISTINCT_EXPECTATIONS:
+            settled = _distinct_result(result, expectation_type, kwargs, scan, z)
+        elif "unexpected_count" in result["result"] and "element_count" in result["result"]:
+            settled = _map_result(result, kwargs, scan, z)
+        else:
+            # Aggregates (mean, quantiles, ...) on the sample: no bound
+            result["result"]["approximate"] = _approximate_info("sample", scan)
+            settled = False
+
+        if not settled:
+            if result["success"]:
+                uncertain_passed += 1
+            else:
+                uncertain_failed += 1
+
+    summary = suite_result(ge_result["meta"].get("expectation_suite_name"), ge_result["results"])
+    ge_result["success"] = summary["success"]
+    ge_result["statistics"] = summary["statistics"]
+
+    return ge_result, uncertain_passed, uncertain_failed
+
+
+def scan_stats(scan: SheetScan) -> dict:
+    """
+    Dataset-level figures for compute_metrics. Duplicate rows within
+    the sketch error are not distinguishable from none and count as 0.
+    """
+    distinct, error = scan.distinct(ROW_KEY)
+    excess = scan.row_count - distinct
+    duplicate_rows = round(excess) if excess > distinct * error else 0
+
+    return {
+        "columns": scan.columns,
+        "row_count": scan.row_count,
+        "total_cells": scan.row_count * len(scan.columns),
+        "null_cells": sum(scan.null_counts.values()),
+        "duplicate_rows": duplicate_rows,
+    }
+
+
+def validate_sample(
+    scan: SheetScan,
+    suite,
+    confidence: float,
+    run=None,
+) -> dict:
+    """
+    Validate `suite` on the scan's sample and extrapolate to the table.
+    `run(frame, suite)` evaluates the suite (GE with the sample's column
+    profile by default). Metrics carry the error bounds:
+
+        approximate, sample_rows, rules_passed_lower / _upper,
+        quality_score_lower / _upper
+    """
+    start = time.time()
+
+    if run is None:
+        profile = FrameProfile(scan.sample)
+        ge_result = run_suite_with_profile(scan.sample, suite, profile)
+    else:
+        ge_result = run(scan.sample, suite)
+
+    ge_result, uncertain_passed, uncertain_failed = approximate_suite_result(
+        ge_result,
+        scan,
+        z_score(confidence),
+    )
+
+    duration_ms = int((time.time() - start) * 1000)
+    metrics = compute_metrics(
+        ge_result,
+        suite,
+        duration_ms=duration_ms,
+        **scan_stats(scan),
+    )
+
+    rules_total = metrics["rules_total"]
+    passed_lower = metrics["rules_passed"] - uncertain_passed
+    passed_upper = metrics["rules_passed"] + uncertain_failed
+    metrics.update(
+        {
+            "approximate": True,
+            "sample_rows": scan.sample_size,
+            "rules_passed_lower": passed_lower,
+            "rules_passed_upper": passed_upper,
+            "quality_score_lower": round(passed_lower / rules_total, 4) if rules_total else 1.0,
+            "quality_score_upper": round(passed_upper / rules_total, 4) if rules_total else 1.0,
+        }
+    )
+    ge_result["metrics"] = metrics
+
+    logger.info(
+        "Approximate validation | rows=%d sample=%d quality_score=%s [%s, %s]",
+        scan.row_count,
+        scan.sample_size,
+        metrics["quality_score"],
+        metrics["quality_score_lower"],
+        metrics["quality_score_upper"],
+    )
+
+    return ge_result
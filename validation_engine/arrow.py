@@ -0,0 +1,81 @@
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from validation_engine.hashing import DuplicateTracker, hash_rows
+from validation_engine.projection import suite_columns
+
+# Expectations that look at the whole column list, not single columns
+TABLE_COLUMN_EXPECTATIONS = {
+    "expect_table_columns_to_match_ordered_list",
+    "expect_table_columns_to_match_set",
+    "expect_table_column_count_to_equal",
+    "expect_table_column_count_to_be_between",
+}
+
+
+def null_cell_count(table: pa.Table) -> int:
+    """
+    Nulls from the Arrow validity bitmaps (floating NaN counted too,
+    as pandas would after conversion).
+    """
+    total = 0
+    for column in table.columns:
+        total += column.null_count
+        if pa.types.is_floating(column.type):
+            total += int(pc.sum(pc.is_nan(column)).as_py() or 0)
+    return total
+
+
+def duplicate_row_count(table: pa.Table) -> int:
+    """
+    Rows repeating an earlier row (pandas `duplicated()` semantics),
+    via an Arrow hash aggregation without converting to pandas.
+    """
+    if not table.num_rows or not table.num_columns:
+        return 0
+
+    try:
+        distinct = table.group_by(table.column_names).aggregate([])
+    except (pa.ArrowNotImplementedError, pa.ArrowTypeError):
+        # Nested / unsupported key types: fingerprint via pandas
+        tracker = DuplicateTracker()
+        tracker.update(hash_rows(table.to_pandas()))
+        return tracker.duplicate_count
+
+    return table.num_rows - distinct.num_rows
+
+
+def table_stats(table: pa.Table) -> dict:
+    """
+    Dataset-level figures used by compute_metrics, computed once per
+    sheet and shared by all of its suites.
+    """
+    return {
+        "columns": table.column_names,
+        "row_count": table.num_rows,
+        "total_cells": table.num_rows * table.num_columns,
+        "null_cells": null_cell_count(table),
+        "duplicate_rows": duplicate_row_count(table),
+    }
+
+
+def suite_frame(table: pa.Table, suite) -> pd.DataFrame:
+    """
+    pandas view of only the columns a suite references.
+    Table-level column expectations get every column.
+    """
+    if any(
+        e.expectation_type in TABLE_COLUMN_EXPECTATIONS
+        for e in suite.expectations
+    ):
+        return table.to_pandas(split_blocks=True)
+
+    wanted = set(suite_columns(suite))
+    columns = [name for name in table.column_names if name in wanted]
+
+    if not columns:
+        # Row-count only suites: an empty frame of the right length
+        return pd.DataFrame(index=pd.RangeIndex(table.num_rows))
+
+    return table.select(columns).to_pandas(split_blocks=True)
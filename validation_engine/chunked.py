@@ -0,0 +1,534 @@
+import copy
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable
+
+import pandas as pd
+
+from validation_engine.fail_fast import SheetGate, skipped_result
+from validation_engine.hashing import DuplicateTracker, hash_rows
+from validation_engine.results import (
+    PARTIAL_UNEXPECTED_COUNT,
+    map_result,
+    mostly_success,
+    suite_result,
+)
+from validation_engine.statistics import result_key
+from validation_engine.validation import compute_metrics, ge_order, load_suite, run_suite
+
+# Row-local expectations: counts simply add up across chunks
+MAP_EXPECTATIONS = {
+    "expect_column_values_to_not_be_null",
+    "expect_column_values_to_be_null",
+    "expect_column_values_to_be_between",
+    "expect_column_values_to_be_in_set",
+    "expect_column_values_to_not_be_in_set",
+    "expect_column_values_to_match_regex",
+    "expect_column_values_to_not_match_regex",
+    "expect_column_values_to_match_regex_list",
+    "expect_column_values_to_not_match_regex_list",
+    "expect_column_values_to_match_strftime_format",
+    "expect_column_values_to_be_dateutil_parseable",
+    "expect_column_values_to_be_json_parseable",
+    "expect_column_value_lengths_to_be_between",
+    "expect_column_value_lengths_to_equal",
+}
+
+# Schema-level expectations: must hold for every chunk
+SCHEMA_EXPECTATIONS = {
+    "expect_column_to_exist",
+    "expect_table_columns_to_match_ordered_list",
+    "expect_table_columns_to_match_set",
+    "expect_table_column_count_to_equal",
+    "expect_table_column_count_to_be_between",
+    "expect_column_values_to_be_of_type",
+    "expect_column_values_to_be_in_type_list",
+}
+
+# Re-evaluated on the total row count
+ROW_COUNT_EXPECTATIONS = {
+    "expect_table_row_count_to_be_between",
+    "expect_table_row_count_to_equal",
+}
+
+# Need every row at once: evaluated with a global hash index instead of GE
+UNIQUE_EXPECTATIONS = {
+    "expect_column_values_to_be_unique",
+    "expect_compound_columns_to_be_unique",
+}
+
+CHUNKABLE_EXPECTATIONS = (
+    MAP_EXPECTATIONS
+    | SCHEMA_EXPECTATIONS
+    | ROW_COUNT_EXPECTATIONS
+    | UNIQUE_EXPECTATIONS
+)
+
+
+def _merge_map(merged: dict, chunk: dict) -> None:
+    result = merged["result"]
+    part = chunk["result"]
+
+    result["element_count"] += part.get("element_count", 0)
+    result["unexpected_count"] += part.get("unexpected_count", 0)
+    if "missing_count" in result:
+        result["missing_count"] += part.get("missing_count", 0)
+
+    for key in ("partial_unexpected_list", "partial_unexpected_index_list"):
+        if key in result:
+            room = PARTIAL_UNEXPECTED_COUNT - len(result[key])
+            result[key].extend(part.get(key, [])[:max(room, 0)])
+
+    if "partial_unexpected_counts" in result:
+        counts = merged.setdefault("_counts", Counter())
+        for item in part.get("partial_unexpected_counts", []):
+            if "value" in item:
+                counts[item["value"]] += item["count"]
+
+
+def _finish_map(merged: dict) -> dict:
+    result = merged["result"]
+    kwargs = merged["expectation_config"]["kwargs"]
+    missing_count = result.get("missing_count")
+
+    merged["result"] = map_result(
+        element_count=result["element_count"],
+        missing_count=missing_count,
+        unexpected_count=result["unexpected_count"],
+        partial_unexpected_list=result.get("partial_unexpected_list", []),
+        partial_unexpected_index_list=result.get("partial_unexpected_index_list"),
+        unexpected_value_counts=merged.pop("_counts", None),
+    )
+    merged["success"] = mostly_success(
+        result["element_count"] - (missing_count or 0),
+        result["unexpected_count"],
+        kwargs.get("mostly"),
+    )
+    return merged
+
+
+def _finish_row_count(merged: dict, row_count: int) -> dict:
+    kwargs = merged["expectation_config"]["kwargs"]
+
+    if merged["expectation_config"]["expectation_type"] == "expect_table_row_count_to_equal":
+        success = row_count == kwargs.get("value")
+    else:
+        min_value = kwargs.get("min_value")
+        max_value = kwargs.get("max_value")
+        success = True
+        if min_value is not None:
+            success &= row_count > min_value if kwargs.get("strict_min") else row_count >= min_value
+        if max_value is not None:
+            success &= row_count < max_value if kwargs.get("strict_max") else row_count <= max_value
+
+    merged["success"] = bool(success)
+    merged["result"] = {"observed_value": row_count}
+    return merged
+
+
+class UniqueCheck:
+    """
+    Column / compound-key uniqueness evaluated over all chunks
+    with one fingerprint index.
+
+    Shared by every expectation (in any suite) on the same key, so each
+    chunk is hashed once. `tracker` is an in-memory DuplicateTracker
+    unless a persistent index with the same interface is supplied.
+    """
+
+    def __init__(
+        self,
+        columns: list[str],
+        compound: bool,
+        ignore_row_if: str,
+        tracker=None,
+    ):
+        self.columns = list(columns)
+        self.compound = compound
+        self.ignore_row_if = ignore_row_if
+        self.tracker = tracker if tracker is not None else DuplicateTracker()
+
+        self.element_count = 0
+        self.missing_count = 0
+        self.partial_values: list = []
+        self.partial_index: list = []
+        self.error: str | None = None
+        self.duration_ms = 0.0
+
+    @staticmethod
+    def key(expectation: dict) -> tuple:
+        kwargs = expectation["kwargs"]
+        if expectation["expectation_type"] == "expect_compound_columns_to_be_unique":
+            return (
+                tuple(kwargs["column_list"]),
+                True,
+                kwargs.get("ignore_row_if", "all_values_are_missing"),
+            )
+        return ((kwargs["column"],), False, "any_value_is_missing")
+
+    @property
+    def key_name(self) -> str:
+        """
+        Stable name of the key, e.g. "id" or "a,b|all_values_are_missing".
+        """
+        name = ",".join(self.columns)
+        return f"{name}|{self.ignore_row_if}" if self.compound else name
+
+    def _considered(self, chunk: pd.DataFrame) -> pd.Series:
+        missing = chunk[self.columns].isna()
+
+        if self.ignore_row_if == "any_value_is_missing":
+            return ~missing.any(axis=1)
+        if self.ignore_row_if == "never":
+            return pd.Series(True, index=chunk.index)
+        return ~missing.all(axis=1)
+
+    def add(self, chunk: pd.DataFrame) -> None:
+        if self.error is not None:
+            return
+
+        started = time.perf_counter()
+        try:
+            self._add(chunk)
+        finally:
+            self.duration_ms += (time.perf_counter() - started) * 1000
+
+    def _add(self, chunk: pd.DataFrame) -> None:
+        absent = [c for c in self.columns if c not in chunk.columns]
+        if absent:
+            self.error = f"Columns not found in chunk: {absent}"
+            return
+
+        considered = self._considered(chunk)
+        rows = chunk.loc[considered, self.columns]
+
+        self.element_count += len(chunk)
+        self.missing_count += len(chunk) - len(rows)
+
+        duplicated = self.tracker.update(hash_rows(rows))
+
+        room = PARTIAL_UNEXPECTED_COUNT - len(self.partial_values)
+        if room > 0 and duplicated.any():
+            sample = rows[duplicated].head(room)
+            values = (
+                sample.to_dict(orient="records")
+                if self.compound
+                else sample.iloc[:, 0].tolist()
+            )
+            self.partial_values.extend(values)
+            self.partial_index.extend(sample.index.tolist())
+
+    def result(self, config: dict) -> dict:
+        merged = {
+            "success": False,
+            "expectation_config": config,
+            "meta": {"duration_ms": round(self.duration_ms, 3)},
+            "exception_info": {
+                "raised_exception": self.error is not None,
+                "exception_message": self.error,
+                "exception_traceback": None,
+            },
+        }
+
+        if self.error is not None:
+            merged["result"] = {}
+            return merged
+
+        # Counts are taken over the sampled values only
+        counts = None if self.compound else Counter(self.partial_values)
+
+        merged["result"] = map_result(
+            element_count=self.element_count,
+            missing_count=self.missing_count,
+            unexpected_count=self.tracker.unexpected_count,
+            partial_unexpected_list=self.partial_values,
+            partial_unexpected_index_list=self.partial_index,
+            unexpected_value_counts=counts,
+        )
+        merged["success"] = mostly_success(
+            self.element_count - self.missing_count,
+            self.tracker.unexpected_count,
+            config["kwargs"].get("mostly"),
+        )
+        return merged
+
+
+class ChunkedSuiteRun:
+    """
+    Validate one expectation suite chunk by chunk.
+
+    Each chunk runs through GE; map expectation counts are summed,
+    schema expectations must pass in every chunk, row counts are
+    checked on the total and uniqueness uses a global hash index
+    (a UniqueCheck shared with the other suites of the sheet).
+    The `partial_unexpected_*` fields are samples drawn from the
+    first chunks that had unexpected values.
+
+    Fail-fast runs (`gate`) stop evaluating an expectation once it has
+    certainly failed: an error, a failed schema check, or an unexpected
+    value without `mostly` (with `mostly`, the total is only known at
+    the end of the stream).
+    """
+
+    def __init__(
+        self,
+        suite_name: str,
+        unique_check: Callable[[dict], UniqueCheck],
+        gate: SheetGate | None = None,
+    ):
+        self.suite_name = suite_name
+        self.gate = gate
+        self.suite = load_suite(suite_name)
+
+        unsupported = sorted(
+            {
+                e.expectation_type
+                for e in self.suite.expectations
+                if e.expectation_type not in CHUNKABLE_EXPECTATIONS
+            }
+        )
+        if unsupported:
+            raise ValueError(
+                f"Suite '{suite_name}' cannot be validated in chunks; "
+                f"unsupported expectations: {unsupported}"
+            )
+
+        self._chunk_suite = copy.deepcopy(self.suite)
+        self._chunk_suite.expectations = [
+            e for e in self.suite.expectations
+            if e.expectation_type not in UNIQUE_EXPECTATIONS
+        ]
+
+        # (expectation config, shared check) pairs
+        self._unique = []
+        for expectation in self.suite.expectations:
+            if expectation.expectation_type in UNIQUE_EXPECTATIONS:
+                config = expectation.to_json_dict()
+                self._unique.append((config, unique_check(config)))
+
+        self._merged: dict[str, dict] = {}
+        # Keys of the results no further chunk can change (fail-fast)
+        self._decided: set[str] = set()
+        self.duration_ms = 0
+
+    def add(self, chunk: pd.DataFrame) -> None:
+        start = time.time()
+
+        if self._chunk_suite.expectations:
+            chunk_result = run_suite(chunk, self._chunk_suite)
+
+            for result in chunk_result["results"]:
+                key = result_key(result["expectation_config"])
+                merged = self._merged.get(key)
+                expectation_type = result["expectation_config"]["expectation_type"]
+
+                if merged is not None:
+                    # Time adds up over the chunks, whichever result is kept
+                    duration_ms = round(
+                        merged["meta"].get("duration_ms", 0) + result["meta"].get("duration_ms", 0),
+                        3,
+                    )
+                    merged["meta"]["duration_ms"] = result["meta"]["duration_ms"] = duration_ms
+
+                if merged is None:
+                    self._merged[key] = result
+                elif merged["exception_info"]["raised_exception"]:
+                    continue
+                elif result["exception_info"]["raised_exception"]:
+                    self._merged[key] = result
+                elif expectation_type in MAP_EXPECTATIONS:
+                    _merge_map(merged, result)
+                elif expectation_type in SCHEMA_EXPECTATIONS and not result["success"]:
+                    if merged["success"]:
+                        self._merged[key] = result
+
+        if self.gate is not None:
+            self._short_circuit()
+
+        self.duration_ms += int((time.time() - start) * 1000)
+
+    def _failed(self, merged: dict) -> bool:
+        """
+        Whether a result is failed whatever the remaining chunks hold.
+        """
+        config = merged["expectation_config"]
+        if merged["exception_info"]["raised_exception"]:
+            return True
+        if config["expectation_type"] in MAP_EXPECTATIONS:
+            return (
+                config["kwargs"].get("mostly") is None
+                and merged["result"].get("unexpected_count", 0) > 0
+            )
+        if config["expectation_type"] in SCHEMA_EXPECTATIONS:
+            return not merged["success"]
+        return False
+
+    def _short_circuit(self) -> None:
+        decided = set()
+        for key, merged in self._merged.items():
+            if key in self._decided or not self._failed(merged):
+                continue
+
+            self._decided.add(key)
+            decided.add(result_key(merged["expectation_config"]))
+            merged["_evaluated_count"] = merged["result"].get("element_count")
+            self.gate.check(merged["expectation_config"], merged)
+
+        if decided:
+            self._chunk_suite.expectations = [
+                e for e in self._chunk_suite.expectations
+                if result_key(e.to_json_dict()) not in decided
+            ]
+
+        # Uniqueness: a duplicate is final once seen (the shared index
+        # keeps running for the other expectations on the key)
+        for config, unique in self._unique:
+            if unique.error is not None or (
+                config["kwargs"].get("mostly") is None
+                and unique.tracker.unexpected_count > 0
+            ):
+                self._decided.add(result_key(config))
+                self.gate.check(config, {"success": False})
+
+    def results(self, row_count: int, stopped: bool = False) -> list[dict]:
+        """
+        stopped: the stream ended early (fail-fast, blocking failure);
+                 undecided expectations are reported as skipped
+        """
+        finished = {}
+
+        for key, merged in self._merged.items():
+            expectation_type = merged["expectation_config"]["expectation_type"]
+            evaluated_count = merged.pop("_evaluated_count", None)
+
+            if stopped and key not in self._decided:
+                finished[key] = skipped_result(merged["expectation_config"], self.gate.reason)
+            elif merged["exception_info"]["raised_exception"]:
+                finished[key] = merged
+            elif expectation_type in MAP_EXPECTATIONS:
+                merged = _finish_map(merged)
+                if evaluated_count is not None:
+                    merged["result"]["details"] = {
+                        "short_circuited": True,
+                        "evaluated_count": evaluated_count,
+                    }
+                finished[key] = merged
+            elif expectation_type in ROW_COUNT_EXPECTATIONS:
+                finished[key] = _finish_row_count(merged, row_count)
+            else:
+                finished[key] = merged
+
+        for config, unique in self._unique:
+            key = result_key(config)
+            if stopped and key not in self._decided:
+                finished[key] = skipped_result(config, self.gate.reason)
+            else:
+                finished[key] = unique.result(config)
+
+        # Same order as a whole-file GE run
+        expectations = self.suite.expectations
+        ordered = [
+            finished.get(result_key(expectations[position].to_json_dict()))
+            for position in ge_order(expectations)
+        ]
+        return [result for result in ordered if result is not None]
+
+
+class ChunkMetrics:
+    """
+    Dataset-level metrics accumulated across chunks
+    (shared by every suite of the sheet).
+    """
+
+    def __init__(self):
+        self.columns: list[str] = []
+        self.chunk_count = 0
+        self.row_count = 0
+        self.total_cells = 0
+        self.null_cells = 0
+        self.duplicates = DuplicateTracker()
+
+    def add(self, chunk: pd.DataFrame) -> None:
+        if not self.chunk_count:
+            self.columns = list(chunk.columns)
+
+        self.chunk_count += 1
+        self.row_count += len(chunk)
+        self.total_cells += chunk.size
+        self.null_cells += int(chunk.isna().sum().sum())
+        self.duplicates.update(hash_rows(chunk))
+
+
+def validate_chunks(
+    chunks: Iterable[pd.DataFrame],
+    suite_names: list[str],
+    *,
+    key_index: Callable[[str], object] | None = None,
+    table_row_count: int | None = None,
+    gate: SheetGate | None = None,
+) -> tuple[dict[str, dict], int]:
+    """
+    Stream chunks through every suite of a sheet in a single pass.
+    Peak memory is one chunk plus the fingerprint indexes.
+
+    key_index:       factory returning the duplicate tracker for a
+                     UniqueCheck.key_name; in-memory by default
+    table_row_count: row count checked by row-count expectations when
+                     the chunks are only part of the table
+    gate:            fail-fast runs: the stream stops at the first chunk
+                     in which a blocking expectation fails
+
+    Returns ({suite_name: ge_result}, total_row_count).
+    """
+    unique_checks: dict[tuple, UniqueCheck] = {}
+
+    def unique_check(config: dict) -> UniqueCheck:
+        key = UniqueCheck.key(config)
+        if key not in unique_checks:
+            unique = UniqueCheck(*key)
+            if key_index is not None:
+                unique.tracker = key_index(unique.key_name)
+            unique_checks[key] = unique
+        return unique_checks[key]
+
+    runs = [ChunkedSuiteRun(name, unique_check, gate) for name in suite_names]
+    metrics = ChunkMetrics()
+
+    for chunk in chunks:
+        metrics.add(chunk)
+
+        start = time.time()
+        for unique in unique_checks.values():
+            unique.add(chunk)
+        unique_ms = int((time.time() - start) * 1000)
+
+        for run in runs:
+            run.add(chunk)
+            run.duration_ms += unique_ms
+
+        if gate is not None and gate.blocked_by is not None:
+            break
+
+    stopped = gate is not None and gate.blocked_by is not None
+
+    if table_row_count is None:
+        table_row_count = metrics.row_count
+
+    ge_results = {}
+    for run in runs:
+        ge_result = suite_result(run.suite_name, run.results(table_row_count, stopped))
+        ge_result["meta"]["chunk_count"] = metrics.chunk_count
+
+        ge_result["metrics"] = compute_metrics(
+            ge_result,
+            run.suite,
+            duration_ms=run.duration_ms,
+            columns=metrics.columns,
+            row_count=metrics.row_count,
+            total_cells=metrics.total_cells,
+            null_cells=metrics.null_cells,
+            duplicate_rows=metrics.duplicates.duplicate_count,
+        )
+        ge_results[run.suite_name] = ge_result
+
+    return ge_results, metrics.row_count
@@ -0,0 +1,82 @@
+import logging
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+NOT_A_STRING = (
+    "Values passed to expect_column_values_to_match_strftime_format "
+    "must be of type string.\nIf you want to validate a column of dates "
+    "or timestamps, please call the expectation before converting from "
+    "string format."
+)
+
+# pandas parses offsets / zone names differently from strptime
+# (mixed offsets, "Z", "+01:00"): those formats are checked one by one
+UNVECTORIZED_DIRECTIVES = ("%z", "%Z", "%:z")
+
+
+def check_format(strftime_format: str) -> None:
+    """
+    The format must both format and parse a datetime
+    (GE's check: %D formats but does not parse).
+    """
+    try:
+        datetime.strptime(datetime.now().strftime(strftime_format), strftime_format)
+    except ValueError as e:
+        raise ValueError(f"Unable to use provided strftime_format. {e!s}") from e
+
+
+def _parses(value: str, strftime_format: str) -> bool:
+    try:
+        datetime.strptime(value, strftime_format)
+        return True
+    except ValueError:
+        return False
+
+
+def _canonical(strings: pd.Series, strftime_format: str) -> np.ndarray:
+    """
+    Strings that are exactly what strftime prints for the date pandas
+    parses from them. strptime accepts those by construction, so only
+    the others need the exact (per value) check.
+    """
+    if any(directive in strftime_format for directive in UNVECTORIZED_DIRECTIVES):
+        return np.zeros(len(strings), dtype=bool)
+
+    try:
+        parsed = pd.to_datetime(strings, format=strftime_format, errors="coerce")
+        printed = parsed.dt.strftime(strftime_format)
+    except (ValueError, TypeError) as e:
+        logger.debug("Vectorized parsing not available for %r: %s", strftime_format, e)
+        return np.zeros(len(strings), dtype=bool)
+
+    return (printed == strings).to_numpy(dtype=bool, na_value=False)
+
+
+def strftime_mismatch(values: pd.Series, strftime_format: str) -> pd.Series:
+    """
+    Boolean mask of `values` (non-null strings) that
+    `datetime.strptime(value, strftime_format)` rejects.
+
+    Each distinct string is checked once: parsed and printed back
+    vectorized (pandas), and only strings that do not round-trip
+    (unpadded fields, other case, out-of-range dates, garbage) go
+    through strptime. The verdicts are strptime's.
+    """
+    check_format(strftime_format)
+
+    distinct = pd.unique(values)
+    if pd.api.types.infer_dtype(distinct, skipna=False) != "string":
+        if not all(isinstance(value, str) for value in distinct):
+            raise TypeError(NOT_A_STRING)
+
+    strings = pd.Series(distinct, dtype=object)
+    valid = _canonical(strings, strftime_format)
+
+    for position in np.flatnonzero(~valid):
+        valid[position] = _parses(strings.iat[position], strftime_format)
+
+    return values.isin(distinct[~valid])
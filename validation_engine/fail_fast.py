@@ -0,0 +1,133 @@
+import math
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from validation_engine.results import expectation_result, mostly_success
+from validation_engine.scheduling import RuleCost, cost_order
+
+# Rows per block when a column rule is evaluated until its verdict is known
+FAIL_FAST_BLOCK_ROWS = 65_536
+
+
+def is_blocking(config: dict) -> bool:
+    """
+    Blocking expectations carry `"meta": {"blocking": true}`
+    (template rules: `blocking: true`); in fail-fast runs their
+    failure stops the whole sheet.
+    """
+    return bool((config.get("meta") or {}).get("blocking"))
+
+
+def allowed_unexpected(nonnull_count: int, mostly: float | None) -> int:
+    """
+    Most unexpected values a column map expectation over
+    `nonnull_count` values can have and still pass.
+    """
+    if nonnull_count <= 0:
+        return 0
+    if mostly is None:
+        return 0
+
+    # Floating point: settle the boundary with the success rule itself
+    allowed = math.floor(nonnull_count * (1 - mostly))
+    while allowed > 0 and not mostly_success(nonnull_count, allowed, mostly):
+        allowed -= 1
+    while allowed < nonnull_count and mostly_success(nonnull_count, allowed + 1, mostly):
+        allowed += 1
+    return allowed
+
+
+def skipped_result(config: dict, reason: str) -> dict:
+    """
+    Result of an expectation a fail-fast run did not evaluate.
+    Counted as not passed; `meta.skipped` tells it from a failure.
+    """
+    entry = expectation_result(
+        config["expectation_type"],
+        config["kwargs"],
+        False,
+        meta={"skipped": True, "skipped_reason": reason},
+    )
+    entry["expectation_config"]["meta"] = config.get("meta") or {}
+    return entry
+
+
+def is_skipped(result: dict) -> bool:
+    return bool((result.get("meta") or {}).get("skipped"))
+
+
+def describe(config: dict) -> str:
+    """
+    Short name of an expectation for skip reasons, e.g.
+    "expect_column_values_to_be_unique(id)".
+    """
+    kwargs = config["kwargs"]
+    target = kwargs.get("column", kwargs.get("column_list"))
+    if isinstance(target, list):
+        target = ",".join(map(str, target))
+    return f"{config['expectation_type']}({target if target is not None else ''})"
+
+
+@dataclass
+class SheetGate:
+    """
+    Fail-fast state of one sheet, shared by all of its suites:
+    set once a blocking expectation fails.
+
+    costs: rule history by scheduling.cost_key; when given, blocking
+           expectations run one at a time, cheapest-to-fail first
+    """
+
+    blocked_by: str | None = None
+    costs: dict[tuple[str, str | None], RuleCost] | None = None
+
+    @property
+    def reason(self) -> str:
+        return f"blocking expectation failed: {self.blocked_by}"
+
+    def check(self, config: dict, result: dict) -> None:
+        if self.blocked_by is None and is_blocking(config) and not result["success"]:
+            self.blocked_by = describe(config)
+
+
+def gated_results(
+    configs: list[dict],
+    evaluate: Callable[[list[int]], dict[int, dict]],
+    gate: SheetGate,
+) -> dict[int, dict]:
+    """
+    Fail-fast evaluation of one suite (`configs` are its expectation
+    configs): blocking expectations first, then the others unless one
+    of them failed (here or in an earlier suite of the sheet), in which
+    case the rest are skipped. With rule costs on the gate, blocking
+    expectations are scheduled one by one (scheduling.cost_order).
+
+    evaluate: results by position for the given positions
+
+    Returns {position: result}.
+    """
+    blocking = [p for p, config in enumerate(configs) if is_blocking(config)]
+    others = [p for p, config in enumerate(configs) if not is_blocking(config)]
+
+    if gate.costs is not None and len(blocking) > 1:
+        batches = [[p] for p in cost_order(configs, blocking, gate.costs)]
+    else:
+        batches = [blocking]
+    batches.append(others)
+
+    results = {}
+    for positions in batches:
+        if not positions:
+            continue
+
+        if gate.blocked_by is not None:
+            for position in positions:
+                results[position] = skipped_result(configs[position], gate.reason)
+            continue
+
+        evaluated = evaluate(positions)
+        for position in positions:
+            results[position] = evaluated[position]
+            gate.check(configs[position], evaluated[position])
+
+    return results
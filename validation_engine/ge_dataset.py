@@ -0,0 +1,28 @@
+from great_expectations.data_asset.util import DocInherit
+from great_expectations.dataset import MetaPandasDataset, PandasDataset
+
+from validation_engine.dates import strftime_mismatch
+
+
+class ValidationDataset(PandasDataset):
+    """
+    GE's legacy pandas dataset with vectorized implementations of its
+    slowest expectations. Same kwargs, same column-map handling by GE
+    (nulls, `mostly`, result format), same verdicts per value.
+    """
+
+    @DocInherit
+    @MetaPandasDataset.column_map_expectation
+    def expect_column_values_to_match_strftime_format(
+        self,
+        column,
+        strftime_format,
+        mostly=None,
+        result_format=None,
+        row_condition=None,
+        condition_parser=None,
+        include_config=True,
+        catch_exceptions=None,
+        meta=None,
+    ):
+        return ~strftime_mismatch(column, strftime_format)
@@ -1,27 +1,74 @@
 import logging
+import multiprocessing
 import os
 import re
+import threading
 import uuid
-from datetime import datetime
+from concurrent.futures import (
+    BrokenExecutor,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from itertools import chain
+
+import pandas as pd
+import pyarrow as pa
 
+from core.env import env_int
 from core.logging_config import setup_logging
-from data_loader.s3_loader import download_file_bytes
-from data_loader.s3_writer import upload_bytes, upload_json
+from data_loader.s3_loader import download_file, parse_s3_path
+from data_loader.s3_writer import copy_object, render_json, upload_json
+from data_loader.spool import SpooledInput
+from db.bulk import BULK_WRITE_METHODS, BulkWriter
 from db.connection import get_db_cursor
 from file_parser.csv import CsvParser
 from file_parser.excel import ExcelParser
 from file_parser.iceberg import IcebergParser
 from file_parser.parquet import ParquetParser
-from repository.structural_validation_repository import insert_structural_result
-from repository.validation_rule_repository import insert_rule_results
-from repository.validation_run_repository import insert_validation_run
+from file_parser.types import coerce_chunks, coerce_types, read_typed, text_dtypes
+from repository.iceberg_state_repository import (
+    get_last_snapshot,
+    reset_keys,
+    upsert_snapshot,
+)
+from repository.structural_validation_repository import add_structural_result
+from repository.validation_rule_repository import add_rule_results, get_rule_costs
+from repository.validation_run_repository import add_validation_run
+from template_engine.models import SheetDef, TemplateDef
 from template_engine.registry import TemplateRegistry
 from template_engine.resolver import TemplateResolver
+from validation_engine.approximate import scan_batches, sketch_keys, validate_sample
+from validation_engine.arrow import table_stats
+from validation_engine.chunked import validate_chunks
+from validation_engine.fail_fast import SheetGate
+from validation_engine.incremental import (
+    PersistentKeyIndex,
+    appended_since,
+    table_row_count,
+)
+from validation_engine.native import compile_rules, evaluate_suite, validate_rules
+from validation_engine.profile import FrameProfile
+from validation_engine.projection import plan_columns
+from validation_engine.result_sink import RESULT_SINKS, ResultRecord, get_result_sink
+from validation_engine.scheduling import RuleCost
+from validation_engine.statistics import iceberg_units, parquet_units
 from validation_engine.structural import (
     StructuralValidationError,
     run_structural_checks,
+    type_violation_warnings,
+)
+from validation_engine.validation import (
+    load_suite,
+    validate_dataframe,
+    validate_suites,
+    validate_table,
 )
-from validation_engine.validation import validate_dataframe
 
 # -------------------------------------------------------------------
 # Logging
@@ -41,6 +88,17 @@ PARSERS = {
 }
 
 
+RULE_ENGINES = {"ge", "native"}
+
+SUITE_EXECUTIONS = {"separate", "merged"}
+
+SHEET_EXECUTORS = {"thread", "process"}
+
+RUN_MODES = {"full", "fail_fast"}
+
+RULE_SCHEDULINGS = {"declared", "cost"}
+
+
 registry = TemplateRegistry("templates")
 resolver = TemplateResolver(registry.templates)
 
@@ -86,11 +144,19 @@ def init_run_summary(meta: dict) -> dict:
             "rules_total": 0,
             "rules_passed": 0,
             "rules_failed": 0,
+            "rules_skipped": 0,
             "quality_score": 1.0,
             "null_ratio": 0.0,
             "duplicate_ratio": 0.0,
             "schema_changed": False,
             "invalid_row_count": 0,
+            # Error bounds of quality_score (equal to it unless sampled)
+            "approximate": False,
+            "sample_rows": None,
+            "rules_passed_lower": 0,
+            "rules_passed_upper": 0,
+            "quality_score_lower": 1.0,
+            "quality_score_upper": 1.0,
         },
         "success": True,
     }
@@ -105,12 +171,21 @@ def accumulate_metrics(run_summary: dict, ge_result: dict) -> None:
     meta["rules_total"] += metrics["rules_total"]
     meta["rules_passed"] += metrics["rules_passed"]
     meta["rules_failed"] += metrics["rules_failed"]
+    meta["rules_skipped"] += metrics.get("rules_skipped", 0)
     meta["invalid_row_count"] += metrics["invalid_row_count"]
 
     meta["null_ratio"] = max(meta["null_ratio"], metrics["null_ratio"])
     meta["duplicate_ratio"] = max(meta["duplicate_ratio"], metrics["duplicate_ratio"])
     meta["schema_changed"] |= metrics["schema_changed"]
 
+    # Approximate results: rules whose verdict is within the error
+    # bounds may go either way
+    meta["rules_passed_lower"] += metrics.get("rules_passed_lower", metrics["rules_passed"])
+    meta["rules_passed_upper"] += metrics.get("rules_passed_upper", metrics["rules_passed"])
+    if metrics.get("approximate"):
+        meta["approximate"] = True
+        meta["sample_rows"] = max(meta["sample_rows"] or 0, metrics["sample_rows"])
+
     if metrics["rules_failed"] > 0:
         run_summary["success"] = False
 
@@ -118,6 +193,498 @@ def accumulate_metrics(run_summary: dict, ge_result: dict) -> None:
         meta["quality_score"] = round(
             meta["rules_passed"] / meta["rules_total"], 4
         )
+        meta["quality_score_lower"] = round(
+            meta["rules_passed_lower"] / meta["rules_total"], 4
+        )
+        meta["quality_score_upper"] = round(
+            meta["rules_passed_upper"] / meta["rules_total"], 4
+        )
+
+
+# -------------------------------------------------------------------
+# Sheet processing
+# -------------------------------------------------------------------
+@dataclass
+class SheetJob:
+    """
+    Parse, structural checks and validation of one sheet, with the run
+    configuration. Picklable, so it can be handed to a worker process.
+    """
+
+    template: TemplateDef
+    sheet_index: int
+    s3_path: str
+    meta: dict
+    csv_chunk_rows: int
+    rule_engine: str
+    suite_execution: str
+    run_mode: str = "full"
+    # Rule history of the sheet (cost-based scheduling), by cost_key
+    rule_costs: dict[tuple[str, str | None], RuleCost] | None = None
+    snapshot_id: int | None = None
+    from_snapshot_id: int | None = None
+
+    @property
+    def sheet(self) -> SheetDef:
+        return self.template.sheets[self.sheet_index]
+
+
+@dataclass
+class SheetOutcome:
+    """
+    What one sheet contributes to the run; persisted by the caller.
+    `suite_results` is empty when the structural checks failed.
+    """
+
+    sheet_name: str
+    structural_result: dict
+    structural_failed: bool = False
+    suite_results: list[tuple[str, dict]] = field(default_factory=list)
+
+
+def process_sheet(
+    job: SheetJob,
+    *,
+    source=None,
+    workbook=None,
+    table=None,
+    snapshot=None,
+    cur=None,
+    release_input: bool = False,
+) -> SheetOutcome:
+    """
+    Read, check and validate one sheet. Nothing is persisted here,
+    except the key index of incremental runs (through `cur`).
+
+    release_input: the last sheet of a sequential run frees the
+                   downloaded input as soon as it is parsed
+    """
+    template = job.template
+    sheet = job.sheet
+    parser = PARSERS[template.file_type]
+
+    logger.info("Processing sheet '%s'", sheet.name)
+
+    # Chunked reads always go through the (chunk-aware) GE suites
+    chunked_csv = template.file_type == "csv" and job.csv_chunk_rows > 0
+    native = (
+        job.rule_engine == "native"
+        and bool(sheet.rules)
+        and not template.incremental
+        and not chunked_csv
+    )
+
+    # Sampling + sketches instead of exact checks (never incremental)
+    approximation = None if template.incremental else template.approximation(sheet)
+
+    # Fail-fast: one gate for all suites of the sheet. Incremental runs
+    # always read the whole delta (it is marked validated afterwards)
+    gate = (
+        SheetGate(costs=job.rule_costs)
+        if job.run_mode == "fail_fast" and not template.incremental
+        else None
+    )
+
+    suites = (
+        []
+        if native
+        else [load_suite(name) for name in sheet.expectation_suite or []]
+    )
+
+    # Schema-only probe: structural checks see every column,
+    # parsers decode only the planned projection
+    if table is not None:
+        available_columns = [field.name for field in table.schema().fields]
+    elif template.file_type == "excel":
+        available_columns = workbook.read_columns(
+            sheet_name=sheet.name,
+            header=sheet.header_row,
+        )
+    else:
+        available_columns = parser.read_columns(source=source.open())
+
+    usecols = plan_columns(sheet, suites, available_columns)
+
+    # Template types become explicit reader dtypes (CSV / Excel);
+    # Parquet and Iceberg are typed by their own schema
+    column_types = {
+        name: column.type
+        for name, column in (sheet.columns or {}).items()
+        if column.type and name in (usecols or available_columns)
+    }
+    type_violations = {}
+
+    # Read data
+    chunks = None
+    parquet_metadata = None
+    if template.incremental:
+        # Only rows appended since the last validated snapshot,
+        # streamed batch by batch
+        chunks = parser.iter_batches(
+            table,
+            columns=usecols,
+            snapshot_id=snapshot.snapshot_id,
+            from_snapshot_id=job.from_snapshot_id,
+        )
+        df_raw = next(
+            chunks,
+            pd.DataFrame(columns=usecols or available_columns),
+        )
+    elif template.file_type == "iceberg" and approximation is not None:
+        # Streamed once into the sample and sketches
+        chunks = parser.iter_batches(
+            table,
+            columns=usecols,
+            snapshot_id=snapshot.snapshot_id if snapshot else None,
+        )
+        df_raw = next(
+            chunks,
+            pd.DataFrame(columns=usecols or available_columns),
+        )
+    elif template.file_type == "iceberg":
+        # Arrow-native: converted to pandas per suite, lazily
+        df_raw = parser.read_table(
+            table,
+            columns=usecols,
+            snapshot_id=snapshot.snapshot_id if snapshot else None,
+        )
+    elif template.file_type == "excel":
+        df_raw, type_violations = read_typed(
+            workbook.read,
+            column_types,
+            sheet_name=sheet.name,
+            header=sheet.header_row,
+            usecols=usecols,
+        )
+    elif chunked_csv:
+        # Bounded memory: structural checks see the first chunk,
+        # validation streams all of them
+        # Typed columns are read as text and converted per chunk
+        # (a typed reader cannot recover mid-stream); violations of
+        # every chunk are collected and reported once the stream ends
+        raw_chunks = parser.iter_chunks(
+            source=source.open(),
+            chunksize=job.csv_chunk_rows,
+            usecols=usecols,
+            dtype=text_dtypes(column_types, dates_as_text=True),
+        )
+        df_raw, type_violations = coerce_types(
+            next(raw_chunks, pd.DataFrame()),
+            column_types,
+        )
+        chunks = coerce_chunks(raw_chunks, column_types, type_violations)
+    elif template.file_type == "parquet":
+        df_raw = parser.read_table(source=source.open(), usecols=usecols)
+        parquet_metadata = parser.read_metadata(source.open())
+    else:
+        df_raw, type_violations = read_typed(
+            parser.read,
+            column_types,
+            dates_as_text=True,
+            source=source.open(),
+            usecols=usecols,
+        )
+
+    if release_input and source is not None and chunks is None:
+        # Nothing left to parse: free the input before validating
+        if workbook is not None:
+            workbook.close()
+        source.close()
+
+    # Structural validation
+    try:
+        structural_result = run_structural_checks(
+            df_raw,
+            sheet,
+            columns=available_columns,
+            # Chunked CSV: reported after the stream, for all chunks
+            type_violations=None if chunked_csv else type_violations,
+        )
+    except StructuralValidationError as e:
+        if chunked_csv:
+            e.args[0]["warnings"].extend(type_violation_warnings(type_violations))
+        logger.error(
+            "Structural validation failed | sheet=%s errors=%s",
+            sheet.name,
+            e.args[0]["errors"],
+        )
+        return SheetOutcome(sheet.name, e.args[0], structural_failed=True)
+
+    outcome = SheetOutcome(sheet.name, structural_result)
+
+    # GE validation (already projected at read time)
+    df = df_raw
+    row_count = len(df)
+
+    # Approximate: one pass over every row / batch for exact counts and
+    # sketches; the rules then run on the sample only
+    scan = None
+    if approximation is not None and (
+        chunks is not None or row_count > approximation.sample_rows
+    ):
+        if native:
+            # Compiled for their expectation types / columns only
+            head = df_raw.slice(0, 0).to_pandas() if isinstance(df_raw, pa.Table) else df_raw
+            suites = [compile_rules(sheet, head)]
+
+        scan = scan_batches(
+            chain([df_raw], chunks if chunks is not None else []),
+            sketch_keys(suites),
+            sample_rows=approximation.sample_rows,
+            precision=approximation.hll_precision,
+            seed=approximation.seed,
+        )
+        chunks = None
+        if scan.exhaustive:
+            # Not more rows than the sample: validate them exactly
+            df, scan = scan.sample, None
+            row_count = len(df)
+        else:
+            row_count = scan.row_count
+
+    # Arrow tables: dataset metrics from pyarrow.compute, once per sheet;
+    # DataFrames: one lazily computed column profile shared by all suites
+    stats = table_stats(df) if isinstance(df, pa.Table) else None
+    profile = (
+        FrameProfile(df)
+        if stats is None and chunks is None and scan is None
+        else None
+    )
+
+    # Row group / data file statistics settle what they can
+    # before any column is converted for GE
+    units = None
+    if stats is not None and not native and scan is None:
+        if template.file_type == "parquet":
+            units = parquet_units(parquet_metadata, df)
+        elif template.file_type == "iceberg":
+            units = iceberg_units(
+                table,
+                snapshot.snapshot_id if snapshot else None,
+                df.column_names,
+            )
+
+    if not native and not sheet.expectation_suite:
+        raise ValueError(
+            f"No validation expectation_suite defined for sheet '{sheet.name}' "
+            f"in template '{template.template_id}'"
+        )
+
+    if sheet.rules and not native:
+        logger.warning(
+            "Rules are defined in template but ignored at runtime | sheet=%s",
+            sheet.name,
+        )
+
+    chunked_results = None
+    if template.incremental:
+        # Row-local rules run on the delta; uniqueness is checked
+        # against the keys of every snapshot validated so far
+        chunked_results, row_count = validate_chunks(
+            chain([df_raw], chunks),
+            sheet.expectation_suite,
+            key_index=lambda key_name: PersistentKeyIndex(
+                cur,
+                job.s3_path,
+                template.template_id,
+                f"{sheet.name}:{key_name}",
+            ),
+            table_row_count=table_row_count(snapshot),
+        )
+    elif chunks is not None:
+        chunked_results, row_count = validate_chunks(
+            chain([df_raw], chunks),
+            sheet.expectation_suite,
+            gate=gate,
+        )
+
+    suite_names = (
+        [f"{sheet.name}_rules"] if native else sheet.expectation_suite
+    )
+
+    # Chunked runs already stream every suite in one pass
+    merged_results = None
+    if (
+        job.suite_execution == "merged"
+        and not native
+        and chunked_results is None
+        and scan is None
+        and len(suite_names) > 1
+    ):
+        merged_results = validate_suites(
+            df,
+            suite_names,
+            profile=profile,
+            stats=stats,
+            units=units,
+            gate=gate,
+        )
+
+    for position, suite_name in enumerate(suite_names):
+        if scan is not None and native:
+            ge_result = validate_sample(
+                scan,
+                compile_rules(sheet, scan.sample),
+                approximation.confidence,
+                run=evaluate_suite,
+            )
+        elif scan is not None:
+            ge_result = validate_sample(
+                scan,
+                suites[position],
+                approximation.confidence,
+            )
+        elif native:
+            ge_result = validate_rules(df, sheet, stats, profile, gate)
+        elif chunked_results is not None:
+            ge_result = chunked_results[suite_name]
+        elif merged_results is not None:
+            ge_result = merged_results[suite_name]
+        elif stats is not None:
+            ge_result = validate_table(df, suite_name, stats, units, gate)
+        else:
+            ge_result = validate_dataframe(df, suite_name, profile, gate)
+
+        ge_result["meta"] = {
+            **job.meta,
+            "sheet_name": sheet.name,
+            "row_count": row_count,
+            **ge_result["metrics"],
+        }
+
+        if template.incremental:
+            ge_result["meta"]["snapshot_id"] = snapshot.snapshot_id
+            ge_result["meta"]["from_snapshot_id"] = job.from_snapshot_id
+
+        outcome.suite_results.append((suite_name, ge_result))
+
+    if chunked_csv:
+        # The stream has been consumed (or stopped early): type
+        # violations of every chunk read
+        structural_result["warnings"].extend(type_violation_warnings(type_violations))
+
+    return outcome
+
+
+def _process_sheet_in_worker(
+    job: SheetJob,
+    source_path: str | None,
+    source_data: bytes | None,
+) -> SheetOutcome:
+    """
+    Worker-process entry point: opens its own view of the input
+    (spooled file or bytes), workbook and Iceberg table.
+    """
+    parser = PARSERS[job.template.file_type]
+
+    source = None
+    if source_path is not None:
+        source = SpooledInput.from_file(source_path)
+    elif source_data is not None:
+        source = SpooledInput(len(source_data), threshold=len(source_data))
+        source.write_at(0, source_data)
+
+    workbook = (
+        parser.open_workbook(source.open())
+        if job.template.file_type == "excel"
+        else None
+    )
+
+    table = None
+    snapshot = None
+    if job.template.file_type == "iceberg":
+        table = parser.load_table(job.s3_path.replace("iceberg://", ""), "glue")
+        if job.snapshot_id is not None:
+            snapshot = table.snapshot_by_id(job.snapshot_id)
+
+    with source or nullcontext(), workbook or nullcontext():
+        return process_sheet(
+            job,
+            source=source,
+            workbook=workbook,
+            table=table,
+            snapshot=snapshot,
+        )
+
+
+def submit_sheets(
+    pool: Executor,
+    executor: str,
+    jobs: list[SheetJob],
+    *,
+    source,
+    workbook,
+    table,
+    snapshot,
+) -> list[Future]:
+    """
+    Start every sheet on `pool`. Threads share the open input, workbook
+    and table; worker processes re-open the spooled file (or receive
+    the in-memory bytes) and load their own workbook / table.
+    """
+    if executor == "thread":
+        return [
+            pool.submit(
+                process_sheet,
+                job,
+                source=source,
+                workbook=workbook,
+                table=table,
+                snapshot=snapshot,
+            )
+            for job in jobs
+        ]
+
+    source_path = source.path if source is not None else None
+    source_data = (
+        bytes(source.open().getbuffer())
+        if source is not None and source_path is None
+        else None
+    )
+
+    return [
+        pool.submit(_process_sheet_in_worker, job, source_path, source_data)
+        for job in jobs
+    ]
+
+
+# Pools live for the whole process: worker processes keep their imports
+# and GE context from one run to the next
+_pool_lock = threading.Lock()
+_pools: dict[tuple[str, int], Executor] = {}
+
+
+def sheet_pool(executor: str, workers: int) -> Executor:
+    """
+    Process-wide sheet pool for this executor kind and size.
+    """
+    with _pool_lock:
+        pool = _pools.get((executor, workers))
+        if pool is None:
+            if executor == "process":
+                # spawn: workers must not inherit the parent's DB
+                # connection or S3 client threads
+                pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                pool = ThreadPoolExecutor(
+                    max_workers=workers,
+                    thread_name_prefix="sheet",
+                )
+            _pools[(executor, workers)] = pool
+        return pool
+
+
+def discard_sheet_pool(executor: str, workers: int) -> None:
+    """
+    Drop a pool that can no longer run work (a worker process died).
+    """
+    with _pool_lock:
+        pool = _pools.pop((executor, workers), None)
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
 
 
 # -------------------------------------------------------------------
@@ -132,6 +699,72 @@ def handle_file(s3_path: str) -> dict:
     RESULTS_BUCKET = os.getenv("RESULTS_BUCKET")
     ENABLE_S3_OUTPUTS = bool(RESULTS_BUCKET)
 
+    # CSV only: validate in chunks of this many rows (0 = whole file)
+    CSV_CHUNK_ROWS = env_int("CSV_CHUNK_ROWS", 0)
+
+    # "native": sheets with template rules run them directly (vectorized,
+    # no GE) instead of the suites compiled from them
+    RULE_ENGINE = os.getenv("RULE_ENGINE", "ge")
+    if RULE_ENGINE not in RULE_ENGINES:
+        raise ValueError(
+            f"Unsupported RULE_ENGINE '{RULE_ENGINE}', expected one of {sorted(RULE_ENGINES)}"
+        )
+
+    # "merged": a sheet's suites run as one deduplicated suite, results
+    # are split back per suite
+    SUITE_EXECUTION = os.getenv("SUITE_EXECUTION", "separate")
+    if SUITE_EXECUTION not in SUITE_EXECUTIONS:
+        raise ValueError(
+            f"Unsupported SUITE_EXECUTION '{SUITE_EXECUTION}', "
+            f"expected one of {sorted(SUITE_EXECUTIONS)}"
+        )
+
+    # "fail_fast": column rules stop once they are known to fail, and a
+    # failed blocking rule skips the rest of its sheet
+    RUN_MODE = os.getenv("RUN_MODE", "full")
+    if RUN_MODE not in RUN_MODES:
+        raise ValueError(
+            f"Unsupported RUN_MODE '{RUN_MODE}', expected one of {sorted(RUN_MODES)}"
+        )
+
+    # "cost": fail-fast runs evaluate blocking rules cheapest-to-fail
+    # first, from the timings / failures of the last RULE_COST_HISTORY_DAYS
+    RULE_SCHEDULING = os.getenv("RULE_SCHEDULING", "declared")
+    if RULE_SCHEDULING not in RULE_SCHEDULINGS:
+        raise ValueError(
+            f"Unsupported RULE_SCHEDULING '{RULE_SCHEDULING}', "
+            f"expected one of {sorted(RULE_SCHEDULINGS)}"
+        )
+    RULE_COST_HISTORY_DAYS = env_int("RULE_COST_HISTORY_DAYS", 30)
+
+    # Sheets validated concurrently (1 = one after another)
+    SHEET_WORKERS = env_int("SHEET_WORKERS", 1)
+    SHEET_EXECUTOR = os.getenv("SHEET_EXECUTOR", "thread")
+    if SHEET_WORKERS < 1:
+        raise ValueError("SHEET_WORKERS must be at least 1")
+    if SHEET_EXECUTOR not in SHEET_EXECUTORS:
+        raise ValueError(
+            f"Unsupported SHEET_EXECUTOR '{SHEET_EXECUTOR}', "
+            f"expected one of {sorted(SHEET_EXECUTORS)}"
+        )
+
+    # Result rows are buffered for the whole run and written at its end,
+    # "copy" (COPY FROM STDIN) or "values" (multi-row INSERT)
+    DB_BULK_WRITE = os.getenv("DB_BULK_WRITE", "copy")
+    if DB_BULK_WRITE not in BULK_WRITE_METHODS:
+        raise ValueError(
+            f"Unsupported DB_BULK_WRITE '{DB_BULK_WRITE}', "
+            f"expected one of {sorted(BULK_WRITE_METHODS)}"
+        )
+
+    # "spool": results (rows and S3 outputs) are spooled to local disk and
+    # delivered by a background writer instead of inside the run
+    RESULT_SINK = os.getenv("RESULT_SINK", "sync")
+    if RESULT_SINK not in RESULT_SINKS:
+        raise ValueError(
+            f"Unsupported RESULT_SINK '{RESULT_SINK}', expected one of {sorted(RESULT_SINKS)}"
+        )
+
     if ENABLE_S3_OUTPUTS:
         logger.info("S3 outputs enabled | bucket=%s", RESULTS_BUCKET)
     else:
@@ -155,9 +788,17 @@ def handle_file(s3_path: str) -> dict:
     parser = PARSERS[template.file_type]
 
     # ---- read input ----
-    file_bytes = (
+    # Spooled to RAM or a temp file; released once the last sheet is parsed
+    source = (
         None if template.file_type == "iceberg"
-        else download_file_bytes(s3_path)
+        else download_file(s3_path)
+    )
+
+    # Excel: one workbook session for all sheets (unzipped/loaded once)
+    workbook = (
+        parser.open_workbook(source.open())
+        if template.file_type == "excel"
+        else None
     )
 
     run_id = str(uuid.uuid4())
@@ -172,123 +813,222 @@ def handle_file(s3_path: str) -> dict:
         "template_version": template.version,
     }
 
-    run_summary = init_run_summary(meta)
-
-    # ---- main execution ----
-    with get_db_cursor() as cur:
-        for sheet in template.sheets:
-            logger.info("Processing sheet '%s'", sheet.name)
-
-            # Read data
-            if template.file_type == "iceberg":
-                df_raw = parser.read(
-                    table_identifier=s3_path.replace("iceberg://", ""),
-                    columns=None,
-                )
-            else:
-                read_kwargs = {"file_bytes": file_bytes}
-                if template.file_type == "excel":
-                    read_kwargs.update(
-                        {
-                            "sheet_name": sheet.name,
-                            "header": sheet.header_row,
-                        }
-                    )
-                df_raw = parser.read(**read_kwargs)
+    # ---- iceberg: pin the snapshot for reads and file statistics ----
+    table = None
+    snapshot = None
+    from_snapshot_id = None
+    if template.file_type == "iceberg":
+        table_identifier = s3_path.replace("iceberg://", "")
+        table = parser.load_table(table_identifier, "glue")
+        snapshot = table.current_snapshot()
 
-            # Structural validation
-            try:
-                structural_result = run_structural_checks(df_raw, sheet)
-            except StructuralValidationError as e:
-                structural_result = e.args[0]
-
-                insert_structural_result(
-                    result=structural_result,
-                    meta=meta,
-                    sheet_name=sheet.name,
-                    cur=cur,
-                )
+    # ---- incremental iceberg: snapshot range to validate ----
+    if template.incremental:
+        with get_db_cursor() as cur:
+            last_snapshot_id = get_last_snapshot(s3_path, template.template_id, cur)
 
-                run_summary["success"] = False
-                logger.error(
-                    "Structural validation failed | sheet=%s errors=%s",
-                    sheet.name,
-                    structural_result["errors"],
-                )
-                continue
+        if snapshot is None or snapshot.snapshot_id == last_snapshot_id:
+            logger.info(
+                "No new snapshot since last validation | dataset=%s snapshot=%s",
+                s3_path,
+                last_snapshot_id,
+            )
+            return {
+                "run_id": run_id,
+                "success": True,
+                "outputs_enabled": ENABLE_S3_OUTPUTS,
+                "results_location": None,
+            }
 
-            insert_structural_result(
-                result=structural_result,
-                meta=meta,
-                sheet_name=sheet.name,
-                cur=cur,
+        if last_snapshot_id is not None and appended_since(table, last_snapshot_id):
+            from_snapshot_id = last_snapshot_id
+        elif last_snapshot_id is not None:
+            logger.warning(
+                "Table history changed since snapshot %s, rescanning | dataset=%s",
+                last_snapshot_id,
+                s3_path,
             )
 
-            # GE validation
-            df = (
-                df_raw.loc[:, list(sheet.columns.keys())]
-                if sheet.columns
-                else df_raw
+        logger.info(
+            "Incremental validation | dataset=%s from_snapshot=%s to_snapshot=%s",
+            s3_path,
+            from_snapshot_id,
+            snapshot.snapshot_id,
+        )
+
+    # ---- rule history for cost-based scheduling ----
+    rule_costs: dict[str, dict] = {}
+    if RULE_SCHEDULING == "cost" and RUN_MODE == "fail_fast":
+        with get_db_cursor() as cur:
+            history = get_rule_costs(
+                template.template_id,
+                validated_at - timedelta(days=RULE_COST_HISTORY_DAYS),
+                cur,
             )
+        for (sheet_name, expectation_type, column_name), row in history.items():
+            rule_costs.setdefault(sheet_name, {})[(expectation_type, column_name)] = RuleCost(*row)
 
-            if not sheet.expectation_suite:
-                raise ValueError(
-                    f"No validation expectation_suite defined for sheet '{sheet.name}' "
-                    f"in template '{template.template_id}'"
-                )
+        logger.info(
+            "Rule history loaded | template=%s rules=%d",
+            template.template_id,
+            len(history),
+        )
+
+    run_summary = init_run_summary(meta)
+
+    jobs = [
+        SheetJob(
+            template=template,
+            sheet_index=index,
+            s3_path=s3_path,
+            meta=meta,
+            csv_chunk_rows=CSV_CHUNK_ROWS,
+            rule_engine=RULE_ENGINE,
+            suite_execution=SUITE_EXECUTION,
+            run_mode=RUN_MODE,
+            rule_costs=(
+                rule_costs.get(template.sheets[index].name, {})
+                if RULE_SCHEDULING == "cost"
+                else None
+            ),
+            snapshot_id=snapshot.snapshot_id if snapshot else None,
+            from_snapshot_id=from_snapshot_id,
+        )
+        for index in range(len(template.sheets))
+    ]
+
+    # Incremental runs update the key index through the run's cursor
+    workers = min(SHEET_WORKERS, len(jobs))
+    parallel = workers > 1 and not template.incremental
 
-            if sheet.rules:
-                logger.warning(
-                    "Rules are defined in template but ignored at runtime | sheet=%s",
-                    sheet.name,
+    # ... and so persist their results in that transaction too
+    spooled = RESULT_SINK == "spool" and not template.incremental
+    writer = BulkWriter(DB_BULK_WRITE)
+    record = ResultRecord(run_id=run_id, tables=writer.tables)
+
+    def persist(outcome: SheetOutcome) -> None:
+        add_structural_result(
+            result=outcome.structural_result,
+            meta=meta,
+            sheet_name=outcome.sheet_name,
+            writer=writer,
+        )
+
+        if outcome.structural_failed:
+            run_summary["success"] = False
+            return
+
+        for suite_name, ge_result in outcome.suite_results:
+            # ---- S3: GE JSON ----
+            if ENABLE_S3_OUTPUTS:
+                ge_key = build_key(
+                    validated_at=validated_at,
+                    dataset=dataset_name,
+                    sheet=outcome.sheet_name,
+                    extension="json",
+                    prefix="validation-results",
                 )
 
-            for suite_name in sheet.expectation_suite:
-                ge_result = validate_dataframe(df, suite_name)
-
-                ge_result["meta"] = {
-                    **meta,
-                    "sheet_name": sheet.name,
-                    "row_count": len(df),
-                    **ge_result["metrics"],
-                }
-
-                # ---- S3: GE JSON ----
-                if ENABLE_S3_OUTPUTS:
-                    ge_key = build_key(
-                        validated_at=validated_at,
-                        dataset=dataset_name,
-                        sheet=sheet.name,
-                        extension="json",
-                        prefix="validation-results",
-                    )
+                logger.info(
+                    "Uploading GE result | bucket=%s key=%s",
+                    RESULTS_BUCKET,
+                    ge_key,
+                )
 
-                    logger.info(
-                        "Uploading GE result | bucket=%s key=%s",
-                        RESULTS_BUCKET,
-                        ge_key,
+                if spooled:
+                    record.uploads.append(
+                        {
+                            "bucket": RESULTS_BUCKET,
+                            "key": ge_key,
+                            "body": render_json(ge_result).decode("utf-8"),
+                            "content_type": "application/json",
+                        }
                     )
-
+                else:
                     upload_json(
                         bucket=RESULTS_BUCKET,
                         key=ge_key,
                         payload=ge_result,
                     )
 
-                accumulate_metrics(run_summary, ge_result)
-                insert_rule_results(ge_result, cur)
+            accumulate_metrics(run_summary, ge_result)
+            add_rule_results(ge_result, writer)
 
-                logger.info(
-                    "GE validation completed | sheet=%s suite=%s",
-                    sheet.name,
-                    suite_name,
+            logger.info(
+                "GE validation completed | sheet=%s suite=%s",
+                outcome.sheet_name,
+                suite_name,
+            )
+
+    # ---- main execution ----
+    with (
+        (nullcontext() if spooled else get_db_cursor()) as cur,
+        source or nullcontext(),
+        workbook or nullcontext(),
+    ):
+        if template.incremental and from_snapshot_id is None:
+            # Full rescan: rebuild the key index from scratch
+            reset_keys(s3_path, template.template_id, cur)
+
+        if parallel:
+            logger.info(
+                "Validating %d sheets on %d %s workers",
+                len(jobs),
+                workers,
+                SHEET_EXECUTOR,
+            )
+            futures = submit_sheets(
+                sheet_pool(SHEET_EXECUTOR, workers),
+                SHEET_EXECUTOR,
+                jobs,
+                source=source,
+                workbook=workbook,
+                table=table,
+                snapshot=snapshot,
+            )
+            try:
+                # Persisted in template order, whatever finishes first;
+                # the input stays open until every sheet is done
+                for future in futures:
+                    persist(future.result())
+            except BaseException as e:
+                for future in futures:
+                    future.cancel()
+                wait(futures)
+                if isinstance(e, BrokenExecutor):
+                    discard_sheet_pool(SHEET_EXECUTOR, workers)
+                raise
+        else:
+            for job in jobs:
+                persist(
+                    process_sheet(
+                        job,
+                        source=source,
+                        workbook=workbook,
+                        table=table,
+                        snapshot=snapshot,
+                        cur=cur,
+                        release_input=job is jobs[-1],
+                    )
                 )
 
-        # Persist run summary (single row)
-        insert_validation_run(run_summary, cur)
+        # Run summary (single row), then every buffered result row
+        add_validation_run(run_summary, writer)
+        if not spooled:
+            writer.flush(cur)
+
+        if template.incremental:
+            # Same transaction: the snapshot only advances with its results
+            upsert_snapshot(
+                s3_path,
+                template.template_id,
+                snapshot.snapshot_id,
+                meta,
+                cur,
+            )
 
     # ---- S3: archive original dataset ----
-    if ENABLE_S3_OUTPUTS and file_bytes:
+    if ENABLE_S3_OUTPUTS and source is not None:
         status_prefix = "passes" if run_summary["success"] else "failed"
 
         archive_key = build_key(
@@ -299,11 +1039,26 @@ def handle_file(s3_path: str) -> dict:
             prefix=status_prefix,
         )
 
-        upload_bytes(
-            bucket=RESULTS_BUCKET,
-            key=archive_key,
-            content=file_bytes,
-        )
+        # Server-side copy: the input is no longer held locally;
+        # pinned to the object version that was validated
+        source_bucket, source_key = parse_s3_path(s3_path)
+        archive = {
+            "source_bucket": source_bucket,
+            "source_key": source_key,
+            "bucket": RESULTS_BUCKET,
+            "key": archive_key,
+            "etag": source.etag,
+            "version_id": source.version_id,
+        }
+        if spooled:
+            record.copies.append(archive)
+        else:
+            copy_object(**archive)
+
+    if spooled:
+        # Acknowledged once durably spooled; the background writer
+        # delivers it (also after a restart)
+        get_result_sink().submit(record)
 
     return {
         "run_id": run_id,
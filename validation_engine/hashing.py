@@ -0,0 +1,212 @@
+import numpy as np
+import pandas as pd
+
+# Rows hashed at a time by hash_frame
+HASH_CHUNK_ROWS = 100_000
+
+
+# int64 range as float64: [-2**63, 2**63)
+_INT64_MIN = float(np.iinfo(np.int64).min)
+_INT64_END = -_INT64_MIN
+
+
+def _normalize(series: pd.Series) -> pd.Series:
+    """
+    Numeric columns can change dtype between chunks (int64 → float64
+    once a chunk contains a NaN, Int64 when read typed); hash their
+    values so equal numbers get equal fingerprints regardless of the
+    chunk they came from. Integral values are hashed as int64, so
+    integers above 2**53 stay distinct; other floats as float64, and
+    missing values as NaN.
+    """
+    if not pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series):
+        return series
+
+    if pd.api.types.is_integer_dtype(series) and not series.hasnans:
+        if series.dtype == np.uint64 and len(series) and series.max() > np.iinfo(np.int64).max:
+            return pd.Series(pd.util.hash_array(series.to_numpy()), index=series.index)
+        return pd.Series(
+            pd.util.hash_array(series.to_numpy(dtype=np.int64)),
+            index=series.index,
+        )
+
+    if pd.api.types.is_integer_dtype(series):
+        # Nullable integers with missing values: exact values, NaN hash for <NA>
+        values = series.to_numpy(dtype=np.int64, na_value=0)
+        missing = series.isna().to_numpy()
+        hashes = pd.util.hash_array(values)
+        hashes[missing] = pd.util.hash_array(np.array([np.nan]))[0]
+        return pd.Series(hashes, index=series.index)
+
+    floats = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    with np.errstate(invalid="ignore"):
+        integral = (
+            np.isfinite(floats)
+            & (np.floor(floats) == floats)
+            & (floats >= _INT64_MIN)
+            & (floats < _INT64_END)
+        )
+
+    hashes = pd.util.hash_array(floats)
+    if integral.any():
+        hashes[integral] = pd.util.hash_array(floats[integral].astype(np.int64))
+    return pd.Series(hashes, index=series.index)
+
+
+def hash_rows(df: pd.DataFrame, columns: list[str] | None = None) -> np.ndarray:
+    """
+    64-bit fingerprint per row over `columns` (all columns by default).
+    """
+    frame = df if columns is None else df.loc[:, columns]
+    frame = frame.apply(_normalize)
+    return pd.util.hash_pandas_object(frame, index=False).to_numpy()
+
+
+def hash_frame(
+    df: pd.DataFrame,
+    columns: list[str] | None = None,
+    chunk_rows: int = HASH_CHUNK_ROWS,
+) -> np.ndarray:
+    """
+    hash_rows over slices of `chunk_rows` rows, so the normalized copies
+    of a wide frame never exist for all rows at once.
+    """
+    if len(df) <= chunk_rows:
+        return hash_rows(df, columns)
+
+    return np.concatenate(
+        [
+            hash_rows(df.iloc[start:start + chunk_rows], columns)
+            for start in range(0, len(df), chunk_rows)
+        ]
+    )
+
+
+def duplicated_mask(
+    df: pd.DataFrame,
+    columns: list[str] | None = None,
+    keep: str | bool = "first",
+    verify: bool = True,
+) -> np.ndarray:
+    """
+    pandas `duplicated(subset=columns, keep=keep)` via row fingerprints.
+
+    Rows of several columns are reduced to 8 bytes each (a single column
+    is deduplicated directly); only rows whose fingerprint occurs
+    more than once are compared on their actual values (`verify`), which
+    rules out hash collisions. Without `verify` equal fingerprints count
+    as equal rows.
+    """
+    frame = df if columns is None else df.loc[:, columns]
+    if not len(frame) or not len(frame.columns):
+        return np.zeros(len(frame), dtype=bool)
+
+    if len(frame.columns) == 1:
+        # A single column is hashed exactly by pandas' own hash table
+        return frame.iloc[:, 0].duplicated(keep=keep).to_numpy()
+
+    hashes = pd.Series(hash_frame(frame))
+    if not verify:
+        return hashes.duplicated(keep=keep).to_numpy()
+
+    mask = np.zeros(len(frame), dtype=bool)
+    candidates = hashes.duplicated(keep=False).to_numpy()
+    if candidates.any():
+        mask[candidates] = frame[candidates].duplicated(keep=keep).to_numpy()
+    return mask
+
+
+class DuplicateTracker:
+    """
+    Counts duplicate fingerprints across any number of chunks.
+
+    Keeps one uint64 key per distinct value plus a saturating counter
+    (0/1/2+), so memory grows with distinct values, not rows.
+
+    - duplicate_count:  rows that repeat an earlier row
+                        (pandas `duplicated()` semantics)
+    - unexpected_count: rows belonging to a group of size > 1
+                        (GE `expect_column_values_to_be_unique` semantics)
+
+    Keys are held in sorted runs, each key in exactly one of them. A
+    chunk's new keys form a new run, which is merged into the last run
+    while that one is not larger (size doubling). There are O(log n)
+    runs, and every key is re-sorted O(log n) times overall, so a chunk
+    costs time in proportion to its own size, not to the keys seen so far.
+    """
+
+    def __init__(self):
+        # (sorted keys, counts) per run, largest first
+        self._runs: list[tuple[np.ndarray, np.ndarray]] = []
+        self.duplicate_count = 0
+        self.unexpected_count = 0
+
+    def _lookup(self, keys: np.ndarray) -> list[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Per run: the run's counts, positions of `keys` in it and
+        the mask of `keys` found there.
+        """
+        found = []
+        for run_keys, run_counts in self._runs:
+            pos = np.searchsorted(run_keys, keys)
+            hit = pos < len(run_keys)
+            hit[hit] = run_keys[pos[hit]] == keys[hit]
+            found.append((run_counts, pos, hit))
+        return found
+
+    def _push(self, keys: np.ndarray, counts: np.ndarray) -> None:
+        while self._runs and len(self._runs[-1][0]) <= len(keys):
+            run_keys, run_counts = self._runs.pop()
+            keys = np.concatenate([run_keys, keys])
+            counts = np.concatenate([run_counts, counts])
+            order = np.argsort(keys, kind="stable")
+            keys, counts = keys[order], counts[order]
+
+        self._runs.append((keys, counts))
+
+    def update(self, hashes: np.ndarray) -> np.ndarray:
+        """
+        Add a chunk of fingerprints.
+        Returns a mask of the chunk rows that are (so far) duplicated.
+        """
+        if len(hashes) == 0:
+            return np.zeros(0, dtype=bool)
+
+        keys, counts = np.unique(hashes, return_counts=True)
+
+        prior = np.zeros(len(keys), dtype=np.int64)
+        seen = np.zeros(len(keys), dtype=bool)
+        found = self._lookup(keys)
+        for run_counts, pos, hit in found:
+            prior[hit] = run_counts[pos[hit]]
+            seen |= hit
+        total = prior + counts
+
+        self.duplicate_count += int(
+            (np.maximum(total - 1, 0) - np.maximum(prior - 1, 0)).sum()
+        )
+        self.unexpected_count += int(
+            (np.where(total >= 2, total, 0) - np.where(prior >= 2, prior, 0)).sum()
+        )
+
+        saturated = np.minimum(total, 2).astype(np.uint8)
+        for run_counts, pos, hit in found:
+            run_counts[pos[hit]] = saturated[hit]
+
+        if not seen.all():
+            self._push(keys[~seen], saturated[~seen])
+
+        return np.isin(hashes, keys[total >= 2])
+
+    @property
+    def distinct_count(self) -> int:
+        return sum(len(run_keys) for run_keys, _ in self._runs)
+
+    def counts_of(self, keys: np.ndarray) -> np.ndarray:
+        """
+        Saturated occurrence count (0/1/2) of each key seen so far.
+        """
+        counts = np.zeros(len(keys), dtype=np.uint8)
+        for run_counts, pos, hit in self._lookup(keys):
+            counts[hit] = run_counts[pos[hit]]
+        return counts
@@ -0,0 +1,94 @@
+import logging
+
+import numpy as np
+from pyiceberg.table.snapshots import Operation
+
+from repository.iceberg_state_repository import insert_keys
+from validation_engine.hashing import DuplicateTracker
+
+logger = logging.getLogger(__name__)
+
+
+def appended_since(table, snapshot_id: int) -> bool:
+    """
+    True when the current snapshot descends from `snapshot_id` through
+    APPEND snapshots only, i.e. the rows added since then are exactly
+    what an incremental append scan returns.
+
+    Overwrites, deletes, rollbacks or an expired snapshot mean the
+    previously validated rows may have changed: rescan everything.
+    """
+    snapshot = table.current_snapshot()
+
+    while snapshot is not None and snapshot.snapshot_id != snapshot_id:
+        if snapshot.summary is None or snapshot.summary.operation != Operation.APPEND:
+            return False
+        if snapshot.parent_snapshot_id is None:
+            return False
+        snapshot = table.snapshot_by_id(snapshot.parent_snapshot_id)
+
+    return snapshot is not None
+
+
+def table_row_count(snapshot) -> int | None:
+    """
+    Total rows of a snapshot from its summary (no data read).
+    """
+    if snapshot.summary is None:
+        return None
+
+    total = snapshot.summary.get("total-records")
+    return int(total) if total is not None else None
+
+
+class PersistentKeyIndex:
+    """
+    DuplicateTracker-compatible key index backed by dq.iceberg_key_index.
+
+    Keys validated by earlier runs count as duplicates of the new rows;
+    counts cover the rows of this run only. New keys are written in the
+    run's transaction, so a failed run leaves the index untouched.
+    """
+
+    def __init__(self, cur, dataset: str, template_id: str, key_name: str):
+        self.cur = cur
+        self.dataset = dataset
+        self.template_id = template_id
+        self.key_name = key_name
+
+        self._delta = DuplicateTracker()
+        self._existing = np.empty(0, dtype=np.uint64)
+
+    def update(self, hashes: np.ndarray) -> np.ndarray:
+        keys = np.unique(hashes)
+
+        # Keys first seen in this run are looked up / inserted once
+        fresh = keys[self._delta.counts_of(keys) == 0]
+        duplicated = self._delta.update(hashes)
+
+        inserted = insert_keys(
+            self.dataset,
+            self.template_id,
+            self.key_name,
+            fresh.view(np.int64).tolist(),
+            self.cur,
+        )
+        inserted = np.array(inserted, dtype=np.int64).view(np.uint64)
+
+        existing = np.setdiff1d(fresh, inserted)
+        if len(existing):
+            self._existing = np.union1d(self._existing, existing)
+
+        return duplicated | np.isin(hashes, self._existing)
+
+    @property
+    def duplicate_count(self) -> int:
+        # Every new row whose key was validated before repeats an earlier row
+        return self._delta.duplicate_count + len(self._existing)
+
+    @property
+    def unexpected_count(self) -> int:
+        # Rows in duplicate groups of this run, plus single new rows
+        # clashing with an already validated key
+        singles = int((self._delta.counts_of(self._existing) == 1).sum())
+        return self._delta.unexpected_count + singles
@@ -0,0 +1,462 @@
+import time
+import traceback
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from template_engine.models import SheetDef
+from validation_engine.dates import strftime_mismatch
+from validation_engine.fail_fast import (
+    FAIL_FAST_BLOCK_ROWS,
+    SheetGate,
+    allowed_unexpected,
+    gated_results,
+)
+from validation_engine.hashing import duplicated_mask
+from validation_engine.profile import FrameProfile
+from validation_engine.results import (
+    PARTIAL_UNEXPECTED_COUNT,
+    expectation_result,
+    map_result,
+    mostly_success,
+    suite_result,
+)
+from validation_engine.rule_registry import apply_sheet_rules
+from validation_engine.statistics import plan_from_stats
+from validation_engine.validation import compute_metrics
+
+# GE fills this in when a suite is validated
+RESULT_FORMAT = "SUMMARY"
+
+
+@dataclass
+class RuleSuite:
+    """
+    Expectations compiled from a sheet's template rules
+    (plain configs, same shape as a GE suite's `to_json_dict()`).
+    """
+    name: str
+    expectations: list[dict] = field(default_factory=list)
+
+
+class RecordingValidator:
+    """
+    Stand-in for a GE validator: the rule functions of rule_registry
+    run against it unchanged, and each expect_* call is recorded
+    instead of evaluated. Like GE, a second expectation of the same
+    type on the same column replaces the first.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self.expectations: list[dict] = []
+
+    def get_column(self, column: str) -> pd.Series:
+        """
+        The column, or an empty one if the file lacks it (an optional
+        column): the rule still adds its expectation, which evaluates
+        to an exception result like GE's.
+        """
+        if column not in self.df.columns:
+            return pd.Series(dtype="float64", name=column)
+        return self.df[column]
+
+    def _add(self, expectation_type: str, **kwargs) -> None:
+        meta = kwargs.pop("meta", None) or {}
+        kwargs["result_format"] = RESULT_FORMAT
+        config = {"expectation_type": expectation_type, "kwargs": kwargs, "meta": meta}
+
+        for i, existing in enumerate(self.expectations):
+            if (
+                existing["expectation_type"] == expectation_type
+                and existing["kwargs"].get("column") == kwargs.get("column")
+                and existing["kwargs"].get("column_list") == kwargs.get("column_list")
+            ):
+                self.expectations[i] = config
+                return
+
+        self.expectations.append(config)
+
+    def expect_column_to_exist(self, column, **kwargs):
+        self._add("expect_column_to_exist", column=column, **kwargs)
+
+    def expect_table_row_count_to_be_between(self, **kwargs):
+        self._add("expect_table_row_count_to_be_between", **kwargs)
+
+    def expect_column_values_to_not_be_null(self, column, **kwargs):
+        self._add("expect_column_values_to_not_be_null", column=column, **kwargs)
+
+    def expect_column_values_to_be_between(self, column, **kwargs):
+        self._add("expect_column_values_to_be_between", column=column, **kwargs)
+
+    def expect_column_values_to_be_unique(self, column, **kwargs):
+        self._add("expect_column_values_to_be_unique", column=column, **kwargs)
+
+    def expect_compound_columns_to_be_unique(self, column_list, **kwargs):
+        self._add(
+            "expect_compound_columns_to_be_unique",
+            column_list=column_list,
+            **kwargs,
+        )
+
+    def expect_column_values_to_be_in_set(self, column, value_set, **kwargs):
+        self._add(
+            "expect_column_values_to_be_in_set",
+            column=column,
+            value_set=value_set,
+            **kwargs,
+        )
+
+    def expect_column_values_to_match_strftime_format(self, column, strftime_format, **kwargs):
+        self._add(
+            "expect_column_values_to_match_strftime_format",
+            column=column,
+            strftime_format=strftime_format,
+            **kwargs,
+        )
+
+    def expect_column_values_to_be_of_type(self, column, type_, **kwargs):
+        self._add(
+            "expect_column_values_to_be_of_type",
+            column=column,
+            type_=type_,
+            **kwargs,
+        )
+
+
+def compile_rules(sheet: SheetDef, df: pd.DataFrame) -> RuleSuite:
+    """
+    The expectations scripts.create_expectation_suite would build
+    for this sheet, without going through GE.
+    """
+    validator = RecordingValidator(df)
+    apply_sheet_rules(validator, sheet)
+    return RuleSuite(f"{sheet.name}_rules", validator.expectations)
+
+
+# -------------------------------------------------------------------
+# Vectorized evaluation
+# -------------------------------------------------------------------
+def _short_circuit(
+    nonnull: pd.Series,
+    unexpected: Callable[[pd.Series], pd.Series],
+    limit: int,
+) -> np.ndarray:
+    """
+    `unexpected` evaluated block by block, stopping at the first block
+    that takes the count past `limit` (the verdict is then known).
+    Returns the mask of the evaluated prefix.
+    """
+    masks = []
+    found = 0
+    for start in range(0, len(nonnull), FAIL_FAST_BLOCK_ROWS):
+        mask = np.asarray(
+            unexpected(nonnull.iloc[start:start + FAIL_FAST_BLOCK_ROWS]),
+            dtype=bool,
+        )
+        masks.append(mask)
+        found += int(mask.sum())
+        if found > limit:
+            break
+
+    return np.concatenate(masks) if masks else np.zeros(0, dtype=bool)
+
+
+def _map(
+    series: pd.Series,
+    kwargs: dict,
+    missing: np.ndarray,
+    unexpected: Callable[[pd.Series], pd.Series],
+    fail_fast: bool = False,
+):
+    """
+    Column map expectation over the non-null values: `unexpected`
+    returns a boolean mask aligned with them.
+
+    fail_fast: stop once `mostly` can no longer be met; the counts are
+               then those of the rows evaluated so far (result.details)
+    """
+    nonnull = series[~missing]
+    if fail_fast:
+        mask = _short_circuit(
+            nonnull,
+            unexpected,
+            allowed_unexpected(len(nonnull), kwargs.get("mostly")),
+        )
+        if len(mask) < len(nonnull):
+            result = _map_result(series, nonnull, nonnull.iloc[:len(mask)][mask])
+            result["details"] = {"short_circuited": True, "evaluated_count": len(mask)}
+            return False, result
+    else:
+        mask = np.asarray(unexpected(nonnull), dtype=bool)
+
+    values = nonnull[mask]
+    success = mostly_success(len(nonnull), len(values), kwargs.get("mostly"))
+    return success, _map_result(series, nonnull, values)
+
+
+def _map_result(series: pd.Series, nonnull: pd.Series, values: pd.Series) -> dict:
+    # Counter in first-appearance order: ties break like GE's
+    counts = values.value_counts(sort=False, dropna=False)
+    sample = values.head(PARTIAL_UNEXPECTED_COUNT)
+
+    return map_result(
+        element_count=len(series),
+        missing_count=len(series) - len(nonnull),
+        unexpected_count=len(values),
+        partial_unexpected_list=sample.tolist(),
+        partial_unexpected_index_list=sample.index.tolist(),
+        unexpected_value_counts=Counter(dict(zip(counts.index.tolist(), counts.tolist(), strict=True))),
+    )
+
+
+def _not_null(series: pd.Series, kwargs: dict, missing: np.ndarray, fail_fast: bool = False):
+    # The null mask is already computed (column profile)
+    unexpected_count = int(missing.sum())
+    result = map_result(len(series), None, unexpected_count, [])
+    return mostly_success(len(series), unexpected_count, kwargs.get("mostly")), result
+
+
+def _between(series: pd.Series, kwargs: dict, missing: np.ndarray, fail_fast: bool = False):
+    min_value = kwargs.get("min_value")
+    max_value = kwargs.get("max_value")
+
+    if min_value is None and max_value is None:
+        raise ValueError("min_value and max_value cannot both be None")
+    if not pd.api.types.is_numeric_dtype(series):
+        raise TypeError(
+            "Column values, min_value, and max_value must either be None or of the same type."
+        )
+
+    def unexpected(values: pd.Series) -> pd.Series:
+        ok = pd.Series(True, index=values.index)
+        if min_value is not None:
+            ok &= values > min_value if kwargs.get("strict_min") else values >= min_value
+        if max_value is not None:
+            ok &= values < max_value if kwargs.get("strict_max") else values <= max_value
+        return ~ok
+
+    return _map(series, kwargs, missing, unexpected, fail_fast)
+
+
+def _unique(series: pd.Series, kwargs: dict, missing: np.ndarray, fail_fast: bool = False):
+    # Duplicates are only known over the whole column: never short-circuited
+    return _map(
+        series,
+        kwargs,
+        missing,
+        lambda values: duplicated_mask(values.to_frame(), keep=False),
+    )
+
+
+def _compound_unique(df: pd.DataFrame, kwargs: dict):
+    columns = kwargs["column_list"]
+    absent = [c for c in columns if c not in df.columns]
+    if absent:
+        raise KeyError(f"{absent} not in index")
+
+    frame = df[columns]
+    missing = frame.isna()
+
+    ignore_row_if = kwargs.get("ignore_row_if", "all_values_are_missing")
+    if ignore_row_if == "any_value_is_missing":
+        skipped = missing.any(axis=1)
+    elif ignore_row_if == "never":
+        skipped = pd.Series(False, index=frame.index)
+    else:
+        skipped = missing.all(axis=1)
+
+    rows = frame[~skipped.to_numpy()]
+    values = rows[duplicated_mask(rows, keep=False)]
+
+    # Missing parts of a key are reported as None (GE's JSON form)
+    sample = values.head(PARTIAL_UNEXPECTED_COUNT).astype(object)
+    sample = sample.where(sample.notna(), None)
+
+    result = map_result(
+        element_count=len(frame),
+        missing_count=len(frame) - len(rows),
+        unexpected_count=len(values),
+        partial_unexpected_list=sample.to_dict(orient="records"),
+        partial_unexpected_index_list=sample.index.tolist(),
+        unexpected_value_counts=Counter(values.itertuples(index=False, name=None)),
+    )
+    success = mostly_success(len(rows), len(values), kwargs.get("mostly"))
+    return success, result
+
+
+def _in_set(series: pd.Series, kwargs: dict, missing: np.ndarray, fail_fast: bool = False):
+    value_set = kwargs["value_set"]
+    return _map(series, kwargs, missing, lambda values: ~values.isin(value_set), fail_fast)
+
+
+def _strftime(series: pd.Series, kwargs: dict, missing: np.ndarray, fail_fast: bool = False):
+    fmt = kwargs["strftime_format"]
+    return _map(series, kwargs, missing, lambda values: strftime_mismatch(values, fmt), fail_fast)
+
+
+def _of_type(series: pd.Series, kwargs: dict, missing: np.ndarray, fail_fast: bool = False):
+    if series.dtype == object:
+        raise TypeError("Object columns are not supported by the native rule engine")
+
+    observed = series.dtype.type.__name__
+    success = np.dtype(kwargs["type_"]).type == series.dtype.type
+    return success, {"observed_value": observed}
+
+
+COLUMN_EXPECTATIONS = {
+    "expect_column_values_to_not_be_null": _not_null,
+    "expect_column_values_to_be_between": _between,
+    "expect_column_values_to_be_unique": _unique,
+    "expect_column_values_to_be_in_set": _in_set,
+    "expect_column_values_to_match_strftime_format": _strftime,
+    "expect_column_values_to_be_of_type": _of_type,
+}
+
+
+def _exception_result(config: dict, exc: Exception) -> dict:
+    entry = expectation_result(config["expectation_type"], config["kwargs"], False)
+    entry["exception_info"] = {
+        "raised_exception": True,
+        "exception_message": f"{type(exc).__name__}: {exc}",
+        "exception_traceback": traceback.format_exc(),
+    }
+    return entry
+
+
+def evaluate(
+    df: pd.DataFrame,
+    config: dict,
+    profile: FrameProfile | None = None,
+    fail_fast: bool = False,
+) -> dict:
+    """
+    One expectation config evaluated with pandas / NumPy vector ops,
+    returned in GE's result shape. Null masks come from `profile`.
+    fail_fast: column map rules stop as soon as they are known to fail
+    The time taken is in the result's meta (`duration_ms`).
+    """
+    if profile is None:
+        profile = FrameProfile(df)
+
+    started = time.perf_counter()
+    expectation_type = config["expectation_type"]
+    kwargs = config["kwargs"]
+
+    try:
+        if expectation_type == "expect_column_to_exist":
+            success, result = kwargs["column"] in df.columns, {}
+        elif expectation_type == "expect_table_row_count_to_be_between":
+            row_count = len(df)
+            min_value = kwargs.get("min_value")
+            max_value = kwargs.get("max_value")
+            success = (min_value is None or row_count >= min_value) and (
+                max_value is None or row_count <= max_value
+            )
+            result = {"observed_value": row_count}
+        elif expectation_type == "expect_compound_columns_to_be_unique":
+            success, result = _compound_unique(df, kwargs)
+        elif expectation_type in COLUMN_EXPECTATIONS:
+            column = kwargs["column"]
+            if column not in df.columns:
+                raise KeyError(column)
+            success, result = COLUMN_EXPECTATIONS[expectation_type](
+                df[column],
+                kwargs,
+                profile.missing(column),
+                fail_fast,
+            )
+        else:
+            raise ValueError(f"Unsupported expectation for the native engine: {expectation_type}")
+    except Exception as e:
+        entry = _exception_result(config, e)
+    else:
+        entry = expectation_result(expectation_type, kwargs, bool(success), result)
+
+    entry["meta"]["duration_ms"] = round((time.perf_counter() - started) * 1000, 3)
+    return entry
+
+
+def _ge_order(expectations: list[dict]) -> list[int]:
+    """
+    GE reports results grouped by column (first appearance first).
+    """
+    groups: dict = {}
+    for position, config in enumerate(expectations):
+        groups.setdefault(config["kwargs"].get("column", "_nocolumn"), []).append(position)
+    return [position for group in groups.values() for position in group]
+
+
+def evaluate_suite(
+    df: pd.DataFrame,
+    suite: RuleSuite,
+    profile: FrameProfile | None = None,
+    gate: SheetGate | None = None,
+) -> dict:
+    """
+    Every expectation of a compiled rule suite, as a GE validation result.
+    Whatever the column profile settles is not evaluated again.
+    With a `gate` (fail-fast runs) blocking rules go first and column
+    rules stop as soon as they are known to fail.
+    """
+    if profile is None:
+        profile = FrameProfile(df)
+
+    settled = plan_from_stats(suite, [profile.unit(suite)], profile.schema()).settled
+
+    def run(positions: list[int]) -> dict[int, dict]:
+        return {
+            position: settled[position] if position in settled
+            else evaluate(df, suite.expectations[position], profile, gate is not None)
+            for position in positions
+        }
+
+    if gate is None:
+        results = run(list(range(len(suite.expectations))))
+    else:
+        results = gated_results(suite.expectations, run, gate)
+
+    return suite_result(
+        suite.name,
+        [results[position] for position in _ge_order(suite.expectations)],
+    )
+
+
+def validate_rules(
+    df: pd.DataFrame | pa.Table,
+    sheet: SheetDef,
+    stats: dict | None = None,
+    profile: FrameProfile | None = None,
+    gate: SheetGate | None = None,
+) -> dict:
+    """
+    Run a sheet's template rules natively. Result and metrics have the
+    same shape as validate_dataframe's, so persistence is unchanged.
+    Arrow tables pass their precomputed `stats` (arrow.table_stats);
+    DataFrames may pass the sheet's shared FrameProfile.
+    """
+    start = time.time()
+
+    if isinstance(df, pa.Table):
+        df = df.to_pandas(split_blocks=True)
+
+    if profile is None:
+        profile = FrameProfile(df)
+
+    suite = compile_rules(sheet, df)
+    ge_result = evaluate_suite(df, suite, profile, gate)
+
+    duration_ms = int((time.time() - start) * 1000)
+
+    ge_result["metrics"] = compute_metrics(
+        ge_result,
+        suite,
+        duration_ms=duration_ms,
+        **(stats or profile.stats()),
+    )
+
+    return ge_result
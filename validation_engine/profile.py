@@ -0,0 +1,124 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from validation_engine.hashing import duplicated_mask
+from validation_engine.statistics import ColumnStats, StatsUnit
+
+# Distinct values kept per column (set membership checks); larger
+# columns only record their distinct count
+VALUES_LIMIT = 1000
+
+# Expectations that need the distinct values of their column
+DISTINCT_EXPECTATIONS = {
+    "expect_column_values_to_be_unique",
+    "expect_column_values_to_be_in_set",
+}
+
+
+class FrameProfile:
+    """
+    Column statistics of one sheet's DataFrame, computed on first use
+    and shared by the dataset metrics and every suite of the sheet:
+
+    - null counts (NaN included), numeric min / max
+    - distinct count and, for small sets, the distinct values
+      (only for columns with uniqueness / set expectations)
+    - duplicate row count
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self._columns: dict[str, ColumnStats] = {}
+        self._distinct: set[str] = set()
+        self._missing: dict[str, np.ndarray] = {}
+        self._null_counts: dict[str, int] = {}
+        self._duplicate_rows: int | None = None
+
+    def missing(self, name: str) -> np.ndarray:
+        """
+        Null / NaN mask of a column.
+        """
+        mask = self._missing.get(name)
+        if mask is None:
+            mask = self.df[name].isna().to_numpy()
+            self._missing[name] = mask
+        return mask
+
+    def null_count(self, name: str) -> int:
+        count = self._null_counts.get(name)
+        if count is None:
+            # Columns no expectation looked at: count without keeping a mask
+            mask = self._missing.get(name)
+            count = int(mask.sum() if mask is not None else self.df[name].isna().sum())
+            self._null_counts[name] = count
+        return count
+
+    def column(self, name: str, distinct: bool = False) -> ColumnStats:
+        stats = self._columns.get(name)
+        series = self.df[name]
+
+        if stats is None:
+            stats = ColumnStats(null_count=int(self.missing(name).sum()))
+            self._null_counts[name] = stats.null_count
+
+            if (
+                pd.api.types.is_numeric_dtype(series)
+                and not pd.api.types.is_bool_dtype(series)
+                and stats.null_count < len(series)
+            ):
+                stats.min, stats.max = series.min(), series.max()
+
+            self._columns[name] = stats
+
+        if distinct and name not in self._distinct:
+            self._distinct.add(name)
+            try:
+                values = pd.unique(series[~self.missing(name)])
+            except TypeError:
+                # Unhashable values (lists, dicts): left to the expectation
+                return stats
+            stats.distinct_count = len(values)
+            if len(values) <= VALUES_LIMIT:
+                stats.values = frozenset(values.tolist())
+
+        return stats
+
+    def unit(self, suite) -> StatsUnit:
+        """
+        The whole frame as a single statistics unit, profiled for the
+        columns `suite` references.
+        """
+        columns = {}
+        for expectation in suite.expectations:
+            name = expectation["kwargs"].get("column")
+            if not isinstance(name, str) or name not in self.df.columns:
+                continue
+            distinct = expectation["expectation_type"] in DISTINCT_EXPECTATIONS
+            columns[name] = self.column(name, distinct)
+
+        return StatsUnit(len(self.df), columns, offset=0)
+
+    def schema(self) -> pa.Schema:
+        """
+        Arrow types of the columns (as plan_from_stats expects).
+        """
+        return pa.Schema.from_pandas(self.df.head(0), preserve_index=False)
+
+    @property
+    def duplicate_rows(self) -> int:
+        if self._duplicate_rows is None:
+            self._duplicate_rows = int(duplicated_mask(self.df).sum())
+        return self._duplicate_rows
+
+    def stats(self) -> dict:
+        """
+        Dataset-level figures used by compute_metrics.
+        """
+        return {
+            "columns": self.df.columns,
+            "row_count": len(self.df),
+            "total_cells": self.df.size,
+            "null_cells": sum(self.null_count(name) for name in self.df.columns),
+            "duplicate_rows": self.duplicate_rows,
+        }
@@ -0,0 +1,51 @@
+from template_engine.models import SheetDef
+
+# Expectation kwargs that name columns
+COLUMN_KWARGS = ("column", "column_A", "column_B")
+COLUMN_LIST_KWARGS = ("column_list", "column_set")
+
+
+def suite_columns(suite) -> list[str]:
+    """
+    Columns referenced by the expectations of a suite.
+    """
+    columns: dict[str, None] = {}
+
+    for expectation in suite.expectations:
+        kwargs = expectation["kwargs"]
+
+        for key in COLUMN_KWARGS:
+            if kwargs.get(key) is not None:
+                columns[kwargs[key]] = None
+
+        for key in COLUMN_LIST_KWARGS:
+            for column in kwargs.get(key) or []:
+                columns[column] = None
+
+    return list(columns)
+
+
+def plan_columns(
+    sheet: SheetDef,
+    suites: list,
+    available: list[str],
+) -> list[str] | None:
+    """
+    Columns to decode for a sheet: template columns plus anything the
+    expectation suites reference, limited to what the input has
+    (missing ones are reported by the structural checks).
+
+    Returns None (read everything) when the template declares no columns
+    or none of the planned columns exist.
+    """
+    if not sheet.columns:
+        return None
+
+    wanted = dict.fromkeys(sheet.columns)
+    for suite in suites:
+        wanted.update(dict.fromkeys(suite_columns(suite)))
+
+    # Input order, as an unprojected read would return them
+    planned = [column for column in available if column in wanted]
+
+    return planned or None
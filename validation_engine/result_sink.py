@@ -0,0 +1,441 @@
+import fcntl
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+
+import numpy as np
+import psycopg2
+from botocore.exceptions import ClientError
+from psycopg2.extras import Json
+
+from core.env import env_int
+from data_loader.s3_writer import copy_object, upload_bytes
+from db.bulk import BulkWriter
+from db.connection import get_db_cursor
+from repository.validation_run_repository import get_existing_runs
+
+logger = logging.getLogger(__name__)
+
+# "sync": results are written by handle_file in the run's transaction;
+# "spool": handle_file spools them and a background writer delivers them
+RESULT_SINKS = {"sync", "spool"}
+
+DEFAULT_SPOOL_DIR = os.path.join(tempfile.gettempdir(), "dq-result-spool")
+# Runs delivered per database transaction
+DEFAULT_BATCH_RUNS = 16
+# Longest wait between delivery attempts while S3 / the database fail
+DEFAULT_RETRY_MAX_S = 60
+# How long a stopping process keeps trying to deliver spooled runs
+DEFAULT_DRAIN_S = 30
+
+RECORD_SUFFIX = ".json"
+BAD_SUFFIX = ".bad"
+LOCK_NAME = ".lock"
+# Partial records older than this were left by a process that died
+# while spooling (never acknowledged)
+STALE_PARTIAL_S = 3600
+
+# Failures no retry can fix: the record's own rows are rejected, or the
+# object to archive is gone / was replaced since it was validated
+PERMANENT_DB_ERRORS = (psycopg2.DataError, psycopg2.IntegrityError)
+PERMANENT_S3_ERROR_CODES = {"NoSuchKey", "NoSuchVersion", "PreconditionFailed", "404", "412"}
+
+
+# -------------------------------------------------------------------
+# Records
+# -------------------------------------------------------------------
+def _spool_default(obj):
+    """
+    Row values as JSON: the text COPY / INSERT would send for them.
+    """
+    if isinstance(obj, Json):
+        return obj.dumps(obj.adapted)
+    if isinstance(obj, datetime | date):
+        return obj.isoformat()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {obj.__class__.__name__} cannot be spooled")
+
+
+@dataclass
+class ResultRecord:
+    """
+    Everything one run persists:
+
+    tables:  database rows by table, {table: (columns, rows)} (BulkWriter.tables)
+    uploads: S3 objects to put (bucket, key, body, content_type)
+    copies:  S3 server-side copies (source_bucket, source_key, bucket, key)
+    """
+
+    run_id: str
+    tables: dict[str, tuple[tuple[str, ...], list[tuple]]]
+    uploads: list[dict] = field(default_factory=list)
+    copies: list[dict] = field(default_factory=list)
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "run_id": self.run_id,
+                "tables": {
+                    table: {"columns": list(columns), "rows": rows}
+                    for table, (columns, rows) in self.tables.items()
+                },
+                "uploads": self.uploads,
+                "copies": self.copies,
+            },
+            default=_spool_default,
+        )
+
+    @classmethod
+    def from_json(cls, text: str) -> "ResultRecord":
+        data = json.loads(text)
+        return cls(
+            run_id=data["run_id"],
+            tables={
+                table: (tuple(entry["columns"]), [tuple(row) for row in entry["rows"]])
+                for table, entry in data["tables"].items()
+            },
+            uploads=data["uploads"],
+            copies=data["copies"],
+        )
+
+
+class ResultSpool:
+    """
+    Write-ahead directory of ResultRecords, one file per run, in
+    submission order. A record is on disk (fsynced, atomically renamed
+    into place) before `append` returns, and is removed only after it
+    was delivered.
+    """
+
+    def __init__(self, directory: str | os.PathLike):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        for partial in self.directory.glob(".*.tmp"):
+            if time.time() - partial.stat().st_mtime > STALE_PARTIAL_S:
+                partial.unlink(missing_ok=True)
+
+    def _sync_directory(self) -> None:
+        fd = os.open(self.directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def append(self, record: ResultRecord) -> Path:
+        name = f"{time.time_ns():020d}-{record.run_id}{RECORD_SUFFIX}"
+        path = self.directory / name
+        partial = self.directory / f".{name}.tmp"
+
+        with open(partial, "w", encoding="utf-8") as f:
+            f.write(record.to_json())
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(partial, path)
+        self._sync_directory()
+        return path
+
+    def pending(self) -> list[Path]:
+        return sorted(self.directory.glob(f"*{RECORD_SUFFIX}"))
+
+    def load(self, path: Path) -> ResultRecord | None:
+        """
+        The record in `path`; unreadable records are set aside
+        (renamed to *.bad) so they cannot block the ones behind them.
+        """
+        try:
+            return ResultRecord.from_json(path.read_text(encoding="utf-8"))
+        except (ValueError, KeyError, TypeError):
+            logger.exception("Unreadable result record, setting it aside | path=%s", path)
+            self.set_aside(path)
+            return None
+
+    def set_aside(self, path: Path) -> None:
+        """
+        Keep the record for inspection (*.bad) but out of the queue.
+        """
+        path.rename(path.with_suffix(BAD_SUFFIX))
+        self._sync_directory()
+
+    def remove(self, paths: list[Path]) -> None:
+        for path in paths:
+            path.unlink(missing_ok=True)
+        self._sync_directory()
+
+    @contextmanager
+    def lock(self):
+        """
+        Exclusive across processes sharing the directory: one of them
+        delivers a given record.
+        """
+        with open(self.directory / LOCK_NAME, "a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+# -------------------------------------------------------------------
+# Delivery
+# -------------------------------------------------------------------
+def is_permanent_failure(exc: Exception) -> bool:
+    """
+    Whether delivering a record failed for a reason retrying cannot fix
+    (as opposed to S3 / the database being unavailable).
+    """
+    if isinstance(exc, PERMANENT_DB_ERRORS):
+        return True
+    if isinstance(exc, ClientError):
+        return exc.response.get("Error", {}).get("Code") in PERMANENT_S3_ERROR_CODES
+    return False
+
+
+def deliver_records(
+    records: list[ResultRecord],
+    method: str,
+    cursor=get_db_cursor,
+) -> None:
+    """
+    S3 objects first, then the database rows of all `records` in one
+    transaction. Runs that already have their validation_runs row were
+    delivered before (a replay after a crash) and are skipped; S3
+    writes are idempotent, so a run whose rows failed is simply
+    uploaded again on retry.
+    """
+    with cursor() as cur:
+        delivered = get_existing_runs([record.run_id for record in records], cur)
+
+    records = [record for record in records if record.run_id not in delivered]
+    if delivered:
+        logger.info("Skipping %d already delivered runs", len(delivered))
+    if not records:
+        return
+
+    for record in records:
+        for upload in record.uploads:
+            upload_bytes(
+                bucket=upload["bucket"],
+                key=upload["key"],
+                content=upload["body"].encode("utf-8"),
+                content_type=upload["content_type"],
+            )
+        for copy in record.copies:
+            copy_object(**copy)
+
+    writer = BulkWriter(method)
+    for record in records:
+        for table, (columns, rows) in record.tables.items():
+            writer.add(table, columns, rows)
+
+    with cursor() as cur:
+        writer.flush(cur)
+
+
+class ResultSink:
+    """
+    Background writer of spooled run results.
+
+    `submit` returns once the record is durably spooled; a daemon
+    thread delivers pending records in batches of up to `batch_runs`
+    runs, retrying with exponential backoff (up to `retry_max_s`)
+    while S3 or the database fail. Records spooled by an earlier
+    process are delivered first (replay after a restart).
+    """
+
+    def __init__(
+        self,
+        spool: ResultSpool,
+        *,
+        method: str = "copy",
+        batch_runs: int = DEFAULT_BATCH_RUNS,
+        retry_max_s: float = DEFAULT_RETRY_MAX_S,
+        deliver: Callable[[list[ResultRecord], str], None] = deliver_records,
+    ):
+        if batch_runs < 1:
+            raise ValueError("batch_runs must be at least 1")
+        # Fail on a bad method now, not in the writer thread
+        BulkWriter(method)
+
+        self.spool = spool
+        self.method = method
+        self.batch_runs = batch_runs
+        self.retry_max_s = retry_max_s
+        self._deliver = deliver
+
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        # Set by close: the writer keeps retrying until then
+        self._drain_deadline = float("inf")
+        self._thread = threading.Thread(
+            target=self._run,
+            name="result-sink",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def submit(self, record: ResultRecord) -> None:
+        if self._stopping.is_set():
+            raise ValueError("Result sink is closed")
+
+        path = self.spool.append(record)
+        logger.info("Results spooled | run_id=%s path=%s", record.run_id, path)
+        self._wake.set()
+
+    def _deliver_batch(self) -> int:
+        with self.spool.lock():
+            records, paths = [], []
+            for path in self.spool.pending():
+                if len(records) == self.batch_runs:
+                    break
+                record = self.spool.load(path)
+                if record is not None:
+                    records.append(record)
+                    paths.append(path)
+
+            if not records:
+                return 0
+
+            try:
+                self._deliver(records, self.method)
+            except Exception as exc:
+                if len(records) > 1:
+                    logger.warning(
+                        "Batch delivery failed, delivering its runs one at a time",
+                        exc_info=True,
+                    )
+                    return self._deliver_each(records, paths)
+                if not is_permanent_failure(exc):
+                    raise
+                self._set_aside(records[0], paths[0])
+                return 1
+
+            self.spool.remove(paths)
+
+        logger.info("Delivered spooled results | runs=%d", len(records))
+        return len(records)
+
+    def _deliver_each(self, records: list[ResultRecord], paths: list[Path]) -> int:
+        """
+        Deliver `records` one by one. Those that fail for good are set
+        aside so they cannot block the runs behind them; a transient
+        failure is raised (the rest is retried with backoff).
+        """
+        for record, path in zip(records, paths, strict=True):
+            try:
+                self._deliver([record], self.method)
+            except Exception as exc:
+                if not is_permanent_failure(exc):
+                    raise
+                self._set_aside(record, path)
+                continue
+
+            self.spool.remove([path])
+            logger.info("Delivered spooled results | runs=1 run_id=%s", record.run_id)
+
+        return len(records)
+
+    def _set_aside(self, record: ResultRecord, path: Path) -> None:
+        logger.exception(
+            "Result delivery failed permanently, setting the run aside | run_id=%s path=%s",
+            record.run_id,
+            path,
+        )
+        self.spool.set_aside(path)
+
+    def _run(self) -> None:
+        retry_s = 0.0
+
+        while True:
+            try:
+                delivered = self._deliver_batch()
+            except Exception:
+                retry_s = min(max(retry_s * 2, 1.0), self.retry_max_s)
+
+                if (
+                    self._stopping.is_set()
+                    and time.monotonic() + retry_s >= self._drain_deadline
+                ):
+                    logger.exception("Result delivery failed, runs stay spooled")
+                    return
+
+                logger.warning(
+                    "Result delivery failed, retrying in %.0fs",
+                    retry_s,
+                    exc_info=True,
+                )
+            else:
+                retry_s = 0.0
+                if delivered:
+                    continue
+                if self._stopping.is_set():
+                    return
+
+            self._wake.wait(retry_s or None)
+            self._wake.clear()
+
+    def close(self, timeout: float = DEFAULT_DRAIN_S) -> bool:
+        """
+        Stop accepting records and try to deliver the pending ones for
+        up to `timeout` seconds. Returns whether none is left; the rest
+        is delivered by the next process using the spool directory.
+        """
+        self._drain_deadline = time.monotonic() + timeout
+        self._stopping.set()
+        self._wake.set()
+        self._thread.join(timeout)
+
+        left = len(self.spool.pending())
+        if left:
+            logger.warning("%d runs left in the result spool | dir=%s", left, self.spool.directory)
+        return left == 0
+
+
+_sink: ResultSink | None = None
+_sink_pid: int | None = None
+_sink_lock = threading.Lock()
+
+
+def get_result_sink() -> ResultSink:
+    """
+    The process-wide sink, configured from RESULT_SPOOL_DIR,
+    RESULT_SINK_BATCH_RUNS, RESULT_SINK_RETRY_MAX_S and DB_BULK_WRITE
+    on first use.
+    """
+    global _sink, _sink_pid
+
+    with _sink_lock:
+        if _sink is None or _sink_pid != os.getpid():
+            _sink = ResultSink(
+                ResultSpool(os.getenv("RESULT_SPOOL_DIR") or DEFAULT_SPOOL_DIR),
+                method=os.getenv("DB_BULK_WRITE", "copy"),
+                batch_runs=env_int("RESULT_SINK_BATCH_RUNS", DEFAULT_BATCH_RUNS),
+                retry_max_s=env_int("RESULT_SINK_RETRY_MAX_S", DEFAULT_RETRY_MAX_S),
+            )
+            _sink_pid = os.getpid()
+        return _sink
+
+
+def close_result_sink() -> bool:
+    """
+    Drain and stop the sink if this process started one
+    (RESULT_SINK_DRAIN_S). Returns whether no run is left spooled.
+    """
+    global _sink
+
+    with _sink_lock:
+        sink, _sink = _sink, None
+
+    if sink is None:
+        return True
+    return sink.close(env_int("RESULT_SINK_DRAIN_S", DEFAULT_DRAIN_S))
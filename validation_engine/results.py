@@ -0,0 +1,144 @@
+from collections import Counter
+from typing import Any
+
+# GE default for SUMMARY result_format
+PARTIAL_UNEXPECTED_COUNT = 20
+
+
+def mostly_success(
+    nonnull_count: int,
+    unexpected_count: int,
+    mostly: float | None,
+) -> bool:
+    """
+    Same success rule as GE column map expectations:
+    vacuously true without non-null values, otherwise
+    the share of expected values must reach `mostly` (all if unset).
+    """
+    if nonnull_count <= 0:
+        return True
+
+    if mostly is None:
+        return unexpected_count == 0
+
+    return (nonnull_count - unexpected_count) / nonnull_count >= mostly
+
+
+def expectation_result(
+    expectation_type: str,
+    kwargs: dict,
+    success: bool,
+    result: dict | None = None,
+    meta: dict | None = None,
+) -> dict:
+    """
+    Build one entry of `ge_result["results"]` in GE's JSON shape.
+    """
+    return {
+        "success": bool(success),
+        "expectation_config": {
+            "expectation_type": expectation_type,
+            "kwargs": kwargs,
+            "meta": {},
+        },
+        "result": result or {},
+        "meta": meta or {},
+        "exception_info": {
+            "raised_exception": False,
+            "exception_message": None,
+            "exception_traceback": None,
+        },
+    }
+
+
+def map_result(
+    element_count: int,
+    missing_count: int | None,
+    unexpected_count: int,
+    partial_unexpected_list: list[Any],
+    partial_unexpected_index_list: list[Any] | None = None,
+    unexpected_value_counts: Counter | None = None,
+) -> dict:
+    """
+    `result` payload of a column map expectation (SUMMARY format).
+    `missing_count=None` mimics expect_column_values_to_not_be_null,
+    which reports no missing/nonmissing figures or sample values.
+    """
+    nonnull_count = element_count - (missing_count or 0)
+
+    unexpected_percent_total = (
+        unexpected_count / element_count * 100 if element_count and nonnull_count else None
+    )
+    unexpected_percent = (
+        unexpected_count / nonnull_count * 100 if nonnull_count else None
+    )
+
+    result = {
+        "element_count": element_count,
+        "unexpected_count": unexpected_count,
+        "unexpected_percent": unexpected_percent,
+        "unexpected_percent_total": unexpected_percent_total,
+        "partial_unexpected_list": partial_unexpected_list[:PARTIAL_UNEXPECTED_COUNT],
+    }
+
+    if missing_count is None:
+        # GE reports no sample values for not_null checks
+        result["partial_unexpected_list"] = []
+        return result
+
+    result.update(
+        {
+            "missing_count": missing_count,
+            "missing_percent": missing_count / element_count * 100 if element_count else None,
+            "unexpected_percent_nonmissing": unexpected_percent,
+        }
+    )
+
+    if partial_unexpected_index_list is not None:
+        result["partial_unexpected_index_list"] = (
+            partial_unexpected_index_list[:PARTIAL_UNEXPECTED_COUNT]
+        )
+
+    if unexpected_value_counts is not None:
+        # Ties ordered by value, as GE does; unorderable values give none
+        try:
+            result["partial_unexpected_counts"] = [
+                {"value": value, "count": count}
+                for value, count in sorted(
+                    unexpected_value_counts.most_common(PARTIAL_UNEXPECTED_COUNT),
+                    key=lambda item: (-item[1], item[0]),
+                )
+            ]
+        except TypeError:
+            result["partial_unexpected_counts"] = []
+            result["details"] = {
+                "partial_unexpected_counts_error": (
+                    "partial_unexpected_counts requested, but requires a hashable type"
+                )
+            }
+
+    return result
+
+
+def suite_result(suite_name: str, results: list[dict]) -> dict:
+    """
+    Wrap expectation results into a GE validation result dict
+    (`validator.validate(...).to_json_dict()` shape).
+    """
+    evaluated = len(results)
+    successful = sum(r["success"] for r in results)
+
+    return {
+        "success": successful == evaluated,
+        "results": results,
+        "evaluation_parameters": {},
+        "statistics": {
+            "evaluated_expectations": evaluated,
+            "successful_expectations": successful,
+            "unsuccessful_expectations": evaluated - successful,
+            "success_percent": successful / evaluated * 100 if evaluated else None,
+        },
+        "meta": {
+            "expectation_suite_name": suite_name,
+        },
+    }
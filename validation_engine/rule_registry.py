@@ -7,6 +7,9 @@ from template_engine.models import RuleDef, SheetDef
 
 RuleFn = Callable[[RuleDef, Any, SheetDef], None]
 
+# Which rows a composite key check skips (GE semantics)
+IGNORE_ROW_IF = {"all_values_are_missing", "any_value_is_missing", "never"}
+
 def _get_mostly(rule: RuleDef) -> float | None:
     """
     Extract and validate `mostly` parameter.
@@ -100,6 +103,35 @@ def rule_unique(rule: RuleDef, validator, sheet: SheetDef) -> None:
             result_format="SUMMARY",
         )
 
+def rule_unique_composite(rule: RuleDef, validator, sheet: SheetDef) -> None:
+    """
+    Expect the combination of the given columns to be unique
+    (composite key). Supports `mostly` and `ignore_row_if`.
+    """
+    columns = _require_columns(sheet, rule.columns, "unique_composite")
+
+    if len(columns) < 2:
+        raise ValueError(
+            "Rule 'unique_composite' requires at least two columns"
+        )
+
+    kwargs = {
+        "column_list": columns,
+        "mostly": _get_mostly(rule),
+        "result_format": "SUMMARY",
+    }
+
+    ignore_row_if = rule.params.get("ignore_row_if") if rule.params else None
+    if ignore_row_if is not None:
+        if ignore_row_if not in IGNORE_ROW_IF:
+            raise ValueError(
+                f"Rule 'unique_composite': ignore_row_if must be one of {sorted(IGNORE_ROW_IF)}"
+            )
+        kwargs["ignore_row_if"] = ignore_row_if
+
+    validator.expect_compound_columns_to_be_unique(**kwargs)
+
+
 def rule_distinct_values_in_set(rule: RuleDef, validator, sheet: SheetDef) -> None:
     """
     Expect column values to be in an allowed set.
@@ -190,16 +222,55 @@ RULES: dict[str, RuleFn] = {
     "not_null_required": rule_not_null_required,
     "positive": rule_positive,
     "unique": rule_unique,
+    "unique_composite": rule_unique_composite,
     "date_format": rule_date_format,
     "date_type": rule_date_type,
     "distinct_values_in_set": rule_distinct_values_in_set,
 }
 
 
+class BlockingValidator:
+    """
+    Validator wrapper marking every expectation a rule declares as
+    blocking (`meta.blocking`): in fail-fast runs its failure stops
+    the sheet.
+    """
+
+    def __init__(self, validator):
+        self._validator = validator
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._validator, name)
+        if not name.startswith("expect_"):
+            return attr
+
+        def expect(*args, meta: dict | None = None, **kwargs):
+            return attr(*args, meta={**(meta or {}), "blocking": True}, **kwargs)
+
+        return expect
+
+
 def apply_rule(rule: RuleDef, validator, sheet: SheetDef) -> None:
     fn = RULES.get(rule.name)
 
     if not fn:
         raise ValueError(f"Unknown rule: {rule.name}")
 
+    if rule.blocking:
+        validator = BlockingValidator(validator)
+
     fn(rule, validator, sheet)
+
+
+def apply_sheet_rules(validator, sheet: SheetDef) -> None:
+    """
+    Everything a sheet's suite is built from: column existence,
+    the template rules and a non-empty table check.
+    """
+    for column in (sheet.columns or {}).keys():
+        validator.expect_column_to_exist(column)
+
+    for rule in sheet.rules or []:
+        apply_rule(rule, validator, sheet)
+
+    validator.expect_table_row_count_to_be_between(min_value=1)
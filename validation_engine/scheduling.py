@@ -0,0 +1,55 @@
+from dataclasses import dataclass
+from statistics import median
+
+
+@dataclass(frozen=True)
+class RuleCost:
+    """
+    History of one expectation (validation_rule_results): how often it
+    ran, how often it failed, and its mean duration (None = not timed).
+    """
+
+    runs: int
+    failures: int
+    duration_ms: float | None = None
+
+    @property
+    def failure_rate(self) -> float:
+        """
+        Laplace-smoothed: never-seen expectations get 1/2.
+        """
+        return (self.failures + 1) / (self.runs + 2)
+
+
+def cost_key(config: dict) -> tuple[str, str | None]:
+    """
+    (expectation_type, column) - how rule history is looked up.
+    """
+    column = config["kwargs"].get("column")
+    return config["expectation_type"], column if isinstance(column, str) else None
+
+
+def cost_order(
+    configs: list[dict],
+    positions: list[int],
+    costs: dict[tuple[str, str | None], RuleCost],
+) -> list[int]:
+    """
+    `positions` ordered to reach a failure as cheaply as possible:
+    ascending expected duration per failure found (duration divided by
+    failure rate). Expectations without timings count as the median of
+    the timed ones; ties keep the declared order.
+    """
+    known = [
+        cost.duration_ms
+        for cost in costs.values()
+        if cost.duration_ms is not None
+    ]
+    default_ms = median(known) if known else 1.0
+
+    def priority(position: int) -> float:
+        cost = costs.get(cost_key(configs[position]), RuleCost(0, 0))
+        duration_ms = cost.duration_ms if cost.duration_ms is not None else default_ms
+        return duration_ms / cost.failure_rate
+
+    return sorted(positions, key=priority)
@@ -0,0 +1,417 @@
+import copy
+import json
+from collections import Counter
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from validation_engine.results import expectation_result, map_result, mostly_success
+
+# Expectations that can be settled from null counts and min/max bounds
+# (uniqueness and set membership also from distinct values, when known)
+STATS_EXPECTATIONS = {
+    "expect_column_values_to_not_be_null",
+    "expect_column_values_to_be_between",
+    "expect_column_values_to_be_in_set",
+    "expect_column_values_to_be_unique",
+}
+
+# Anything else in kwargs (row_condition, parse_strings_as_datetimes, ...)
+# changes the semantics: leave those to GE
+STATS_KWARGS = {
+    "column",
+    "mostly",
+    "min_value",
+    "max_value",
+    "strict_min",
+    "strict_max",
+    "value_set",
+    "result_format",
+    "include_config",
+    "catch_exceptions",
+    "meta",
+}
+
+
+@dataclass
+class ColumnStats:
+    """
+    Statistics of one column in one unit; None = unknown.
+    """
+    null_count: int | None = None
+    nan_count: int | None = 0
+    min: Any = None
+    max: Any = None
+    # Non-missing distinct values; `values` only for small sets
+    distinct_count: int | None = None
+    values: frozenset | None = None
+
+
+@dataclass
+class StatsUnit:
+    """
+    A Parquet row group or an Iceberg data file.
+    `offset` is its first row in the table that was read, when known.
+    """
+    row_count: int
+    columns: dict[str, ColumnStats]
+    offset: int | None = None
+
+
+@dataclass
+class StatsPlan:
+    """
+    How each expectation of a suite (by position) gets evaluated.
+    """
+    settled: dict[int, dict] = field(default_factory=dict)
+    # inconclusive unit ids -> [(position, settled (element, missing, unexpected))]
+    partial: dict[tuple[int, ...], list[tuple[int, tuple[int, int, int]]]] = field(
+        default_factory=dict
+    )
+    remaining: list[int] = field(default_factory=list)
+
+
+# -------------------------------------------------------------------
+# Statistics readers
+# -------------------------------------------------------------------
+def parquet_units(metadata, table: pa.Table) -> list[StatsUnit]:
+    """
+    Row-group statistics from a Parquet footer, for the columns of the
+    table read from the same file. Float NaN counts (not part of Parquet
+    statistics) are counted on the already decoded Arrow columns.
+    """
+    names = set(table.column_names)
+    floating = {
+        f.name for f in table.schema if pa.types.is_floating(f.type)
+    }
+
+    units = []
+    offset = 0
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        columns = {}
+
+        for j in range(row_group.num_columns):
+            chunk = row_group.column(j)
+            name = chunk.path_in_schema
+            if name not in names:
+                continue
+
+            stats = ColumnStats()
+            statistics = chunk.statistics
+            if statistics is not None:
+                if statistics.has_null_count:
+                    stats.null_count = statistics.null_count
+                if statistics.has_min_max:
+                    stats.min, stats.max = statistics.min, statistics.max
+
+            if name in floating:
+                nans = pc.sum(pc.is_nan(table[name].slice(offset, row_group.num_rows)))
+                stats.nan_count = int(nans.as_py() or 0)
+
+            columns[name] = stats
+
+        units.append(StatsUnit(row_group.num_rows, columns, offset))
+        offset += row_group.num_rows
+
+    # Table does not line up with the footer: statistics unusable
+    if offset != table.num_rows:
+        return []
+
+    return units
+
+
+def iceberg_units(table, snapshot_id: int | None, columns: list[str]) -> list[StatsUnit]:
+    """
+    Per data file statistics from the Iceberg manifests of a snapshot.
+    Row offsets are unknown (file order is up to the scan), so these
+    units can settle an expectation only as a whole.
+    """
+    from pyiceberg.conversions import from_bytes
+    from pyiceberg.types import DecimalType, DoubleType, FloatType, IntegerType, LongType
+
+    if snapshot_id is None:
+        return []
+
+    numeric = (IntegerType, LongType, FloatType, DoubleType, DecimalType)
+    floating = (FloatType, DoubleType)
+
+    schema = table.schema()
+    fields = {
+        f.name: f for f in schema.fields
+        if f.name in set(columns)
+    }
+
+    units = []
+    for task in table.scan(snapshot_id=snapshot_id).plan_files():
+        if task.delete_files:
+            # Row-level deletes: file statistics overcount
+            return []
+
+        data_file = task.file
+        null_counts = data_file.null_value_counts or {}
+        nan_counts = data_file.nan_value_counts or {}
+        lower_bounds = data_file.lower_bounds or {}
+        upper_bounds = data_file.upper_bounds or {}
+
+        unit_columns = {}
+        for name, f in fields.items():
+            stats = ColumnStats(null_count=null_counts.get(f.field_id))
+
+            if isinstance(f.field_type, floating):
+                stats.nan_count = nan_counts.get(f.field_id)
+
+            # String bounds may be truncated: only numeric bounds are used
+            lower = lower_bounds.get(f.field_id)
+            upper = upper_bounds.get(f.field_id)
+            if isinstance(f.field_type, numeric) and lower is not None and upper is not None:
+                stats.min = from_bytes(f.field_type, lower)
+                stats.max = from_bytes(f.field_type, upper)
+
+            unit_columns[name] = stats
+
+        units.append(StatsUnit(data_file.record_count, unit_columns))
+
+    return units
+
+
+# -------------------------------------------------------------------
+# Evaluation
+# -------------------------------------------------------------------
+def _is_number(value) -> bool:
+    return isinstance(value, int | float | Decimal | np.number) and not isinstance(value, bool)
+
+
+def _within(stats: ColumnStats, kwargs: dict) -> bool:
+    min_value = kwargs.get("min_value")
+    max_value = kwargs.get("max_value")
+
+    if min_value is None and max_value is None:
+        return False
+    if not (_is_number(stats.min) and _is_number(stats.max)):
+        return False
+
+    if min_value is not None:
+        if not _is_number(min_value):
+            return False
+        if stats.min < min_value or (kwargs.get("strict_min") and stats.min == min_value):
+            return False
+
+    if max_value is not None:
+        if not _is_number(max_value):
+            return False
+        if stats.max > max_value or (kwargs.get("strict_max") and stats.max == max_value):
+            return False
+
+    return True
+
+
+def unit_counts(
+    expectation_type: str,
+    kwargs: dict,
+    unit: StatsUnit,
+    arrow_type: pa.DataType,
+) -> tuple[int, int, int] | None:
+    """
+    (element_count, missing_count, unexpected_count) of one unit when its
+    statistics settle the expectation, else None (rows must be decoded).
+    """
+    stats = unit.columns.get(kwargs.get("column"))
+    if stats is None or stats.null_count is None or stats.nan_count is None:
+        return None
+
+    missing = stats.null_count + stats.nan_count
+
+    if expectation_type == "expect_column_values_to_not_be_null":
+        return unit.row_count, 0, missing
+
+    # Only missing values: nothing to check
+    if missing >= unit.row_count:
+        return unit.row_count, unit.row_count, 0
+
+    if expectation_type == "expect_column_values_to_be_unique":
+        if stats.distinct_count == unit.row_count - missing:
+            return unit.row_count, missing, 0
+        return None
+
+    if (
+        expectation_type == "expect_column_values_to_be_in_set"
+        and stats.values is not None
+        and isinstance(kwargs.get("value_set"), list | set | tuple)
+        and all(value in kwargs["value_set"] for value in stats.values)
+    ):
+        return unit.row_count, missing, 0
+
+    if stats.min is None or stats.max is None:
+        return None
+
+    if expectation_type == "expect_column_values_to_be_between":
+        numeric = (
+            pa.types.is_integer(arrow_type)
+            or pa.types.is_floating(arrow_type)
+            or pa.types.is_decimal(arrow_type)
+        )
+        if numeric and _within(stats, kwargs):
+            return unit.row_count, missing, 0
+
+    if expectation_type == "expect_column_values_to_be_in_set":
+        value_set = kwargs.get("value_set")
+        if (
+            isinstance(value_set, list | set | tuple)
+            and stats.min == stats.max
+            and stats.min in value_set
+        ):
+            return unit.row_count, missing, 0
+
+    return None
+
+
+def _config(expectation) -> dict:
+    """
+    Plain config of a GE expectation (or a copy of an already plain one).
+    """
+    if isinstance(expectation, dict):
+        return copy.deepcopy(expectation)
+    return expectation.to_json_dict()
+
+
+def settled_result(config: dict, totals: tuple[int, int, int]) -> dict:
+    """
+    GE-shaped result of an expectation answered from statistics.
+    """
+    expectation_type = config["expectation_type"]
+    element_count, missing_count, unexpected_count = totals
+
+    if expectation_type == "expect_column_values_to_not_be_null":
+        result = map_result(element_count, None, unexpected_count, [])
+        nonnull_count = element_count
+    else:
+        result = map_result(
+            element_count,
+            missing_count,
+            unexpected_count,
+            [],
+            partial_unexpected_index_list=[],
+            unexpected_value_counts=Counter(),
+        )
+        nonnull_count = element_count - missing_count
+
+    success = mostly_success(nonnull_count, unexpected_count, config["kwargs"].get("mostly"))
+
+    entry = expectation_result(expectation_type, config["kwargs"], success, result)
+    entry["expectation_config"] = config
+    return entry
+
+
+def plan_from_stats(
+    suite,
+    units: list[StatsUnit],
+    schema: pa.Schema,
+    result_format: str = "SUMMARY",
+) -> StatsPlan:
+    """
+    Settle what the statistics can answer:
+    - every unit conclusive        -> result built from metadata only
+    - some units conclusive        -> only the other units are decoded
+      (needs row offsets, i.e. Parquet row groups)
+    - nothing conclusive           -> regular GE evaluation
+    """
+    plan = StatsPlan()
+
+    for position, expectation in enumerate(suite.expectations):
+        config = _config(expectation)
+        expectation_type = config["expectation_type"]
+        kwargs = config["kwargs"]
+        column = kwargs.get("column")
+
+        if (
+            not units
+            or expectation_type not in STATS_EXPECTATIONS
+            # Duplicates may span units
+            or (
+                expectation_type == "expect_column_values_to_be_unique"
+                and len(units) > 1
+            )
+            or set(kwargs) - STATS_KWARGS
+            or column not in schema.names
+        ):
+            plan.remaining.append(position)
+            continue
+
+        arrow_type = schema.field(column).type
+        counts = [
+            unit_counts(expectation_type, kwargs, unit, arrow_type)
+            for unit in units
+        ]
+        settled = [c for c in counts if c is not None]
+        totals = tuple(int(sum(values)) for values in zip(*settled, strict=True)) or (0, 0, 0)
+
+        if len(settled) == len(units):
+            # expectation_config as GE reports it
+            config["kwargs"]["result_format"] = result_format
+            plan.settled[position] = settled_result(config, totals)
+        elif settled and all(unit.offset is not None for unit in units):
+            inconclusive = tuple(i for i, c in enumerate(counts) if c is None)
+            plan.partial.setdefault(inconclusive, []).append((position, totals))
+        else:
+            plan.remaining.append(position)
+
+    return plan
+
+
+def finish_partial(result: dict, totals: tuple[int, int, int]) -> dict:
+    """
+    Combine a GE result over the decoded units with the counts of the
+    units settled from statistics.
+    """
+    if result["exception_info"]["raised_exception"]:
+        return result
+
+    part = result["result"]
+    config = result["expectation_config"]
+    element_count = totals[0] + part["element_count"]
+    unexpected_count = totals[2] + part["unexpected_count"]
+
+    if config["expectation_type"] == "expect_column_values_to_not_be_null":
+        missing_count = None
+        nonnull_count = element_count
+    else:
+        missing_count = totals[1] + part.get("missing_count", 0)
+        nonnull_count = element_count - missing_count
+
+    counts = None
+    if "partial_unexpected_counts" in part:
+        counts = Counter(
+            {item["value"]: item["count"] for item in part["partial_unexpected_counts"]}
+        )
+
+    result["result"] = map_result(
+        element_count=element_count,
+        missing_count=missing_count,
+        unexpected_count=unexpected_count,
+        partial_unexpected_list=part.get("partial_unexpected_list", []),
+        partial_unexpected_index_list=part.get("partial_unexpected_index_list"),
+        unexpected_value_counts=counts,
+    )
+    result["success"] = mostly_success(
+        nonnull_count,
+        unexpected_count,
+        config["kwargs"].get("mostly"),
+    )
+    return result
+
+
+def result_key(config: dict) -> str:
+    """
+    Identity of an expectation within a suite result.
+    """
+    kwargs = {k: v for k, v in config["kwargs"].items() if k != "result_format"}
+    return json.dumps(
+        [config["expectation_type"], kwargs],
+        sort_keys=True,
+        default=str,
+    )
@@ -1,6 +1,7 @@
 from typing import Any
 
 import pandas as pd
+import pyarrow as pa
 
 from template_engine.models import SheetDef
 
@@ -11,13 +12,34 @@ class StructuralValidationError(Exception):
     """
     pass
 
+
+def type_violation_warnings(type_violations: dict[str, dict] | None) -> list[str]:
+    """
+    One structural warning per column with values that did not match
+    the template type.
+    """
+    return [
+        f"Column '{column}': {violation['count']} value(s) are not "
+        f"of type {violation['type']} and were read as null, "
+        f"e.g. {violation['sample']}"
+        for column, violation in (type_violations or {}).items()
+    ]
+
+
 def run_structural_checks(
-        df: pd.DataFrame,
+        df: pd.DataFrame | pa.Table,
         sheet_def: SheetDef,
+        columns: list[str] | None = None,
+        type_violations: dict[str, dict] | None = None,
 ) -> dict[str, Any]:
     """
     Run structural (schema-level) validation on a DataFrame
-    based on the SheetDef template.
+    (or Arrow table) based on the SheetDef template.
+
+    `columns` is the full column list from a schema-only probe,
+    for frames that were read with a column projection.
+    `type_violations` comes from the typed read (file_parser.types):
+    values that did not match the template type and were set to null.
 
     Returns a dict with structural validation results.
     Raises StructuralValidationError on hard failures.
@@ -29,8 +51,15 @@ def run_structural_checks(
         "warnings": [],
     }
 
+    if isinstance(df, pa.Table):
+        empty = df.num_rows == 0
+        frame_columns = df.column_names
+    else:
+        empty = df.empty
+        frame_columns = df.columns
+
     #Empty dataframe check
-    if df.empty:
+    if empty:
         results["passed"] = False
         results["errors"].append("Sheet is empty")
         raise StructuralValidationError(results)
@@ -38,7 +67,7 @@ def run_structural_checks(
     #Column presence check
     if sheet_def.columns:
         expected_columns = set(sheet_def.columns.keys())
-        actual_columns = set(df.columns)
+        actual_columns = set(frame_columns if columns is None else columns)
 
         #Required columns
         required_columns = {
@@ -60,6 +89,9 @@ def run_structural_checks(
                 f"Unexpected columns present: {sorted(unexpected_columns)}"
             )
 
+    #Column type check (warning only: offending values are now null)
+    results["warnings"].extend(type_violation_warnings(type_violations))
+
     # Final decision
     if not results["passed"]:
         raise StructuralValidationError(results)
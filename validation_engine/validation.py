@@ -1,40 +1,198 @@
+import copy
+import logging
+import os
+import threading
 import time
+from collections.abc import Callable, Hashable
 
 import great_expectations as ge
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 
+from validation_engine.arrow import suite_frame
+from validation_engine.fail_fast import SheetGate, gated_results, is_skipped
+from validation_engine.ge_dataset import ValidationDataset
+from validation_engine.profile import FrameProfile
+from validation_engine.results import suite_result
+from validation_engine.statistics import (
+    StatsUnit,
+    finish_partial,
+    plan_from_stats,
+    result_key,
+)
 
-def validate_dataframe(df: pd.DataFrame, suite_name: str) -> dict:
-    start = time.time()
+logger = logging.getLogger(__name__)
 
-    # Create validator from DataFrame
-    validator = ge.from_pandas(df)
 
-    # Load expectation suite from context
-    context = ge.get_context()
-    suite = context.get_expectation_suite(suite_name)
+# -------------------------------------------------------------------
+# Context / suite cache
+# -------------------------------------------------------------------
+# Building the data context (reading great_expectations.yml, wiring the
+# stores) is the expensive part; it is done once per process. Suites are
+# re-parsed only when their JSON file changes.
+_cache_lock = threading.Lock()
+_context = None
+_suites: dict[str, tuple[tuple[int, int], object]] = {}
+
+
+def get_context():
+    """
+    Process-wide GE data context.
+    """
+    global _context
+
+    with _cache_lock:
+        if _context is None:
+            _context = ge.get_context()
+        return _context
+
+
+def _suite_version(context, suite_name: str) -> tuple[int, int] | None:
+    """
+    (mtime, size) of the suite file in the filesystem expectations store,
+    None when it cannot be determined (the suite is then not cached).
+    """
+    root = getattr(context, "root_directory", None)
+    if not root:
+        return None
+
+    path = os.path.join(root, "expectations", *suite_name.split(".")) + ".json"
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    return stat.st_mtime_ns, stat.st_size
+
+
+def load_suite(suite_name: str):
+    """
+    Expectation suite by name, from the process-wide cache.
+    Callers get their own copy and are free to modify it.
+    """
+    context = get_context()
+    version = _suite_version(context, suite_name)
+
+    with _cache_lock:
+        cached = _suites.get(suite_name)
+
+    if cached is None or version is None or cached[0] != version:
+        suite = context.get_expectation_suite(suite_name)
+        if version is not None:
+            with _cache_lock:
+                _suites[suite_name] = (version, suite)
+        if cached is not None:
+            logger.info("Reloaded changed expectation suite %s", suite_name)
+    else:
+        suite = cached[1]
+
+    return copy.deepcopy(suite)
+
+
+def clear_suite_cache(suite_name: str | None = None) -> None:
+    """
+    Drop one cached suite, or every suite and the context itself.
+    """
+    global _context
+
+    with _cache_lock:
+        if suite_name is not None:
+            _suites.pop(suite_name, None)
+            return
+
+        _suites.clear()
+        _context = None
+
+
+# Not part of an expectation's identity (see statistics.result_key)
+_CALL_KWARGS = {"catch_exceptions", "include_config"}
+
+
+def _time_expectations(validator, suite) -> dict[str, list[float]]:
+    """
+    Wrap the validator's expectation methods so each top-level call is
+    timed. Returns {result_key: [duration_ms, ...]}, filled in call
+    order as validate() runs.
+    """
+    timings: dict[str, list[float]] = {}
+    depth = 0
+
+    def timed(expectation_type: str, method):
+        def call(*args, **kwargs):
+            nonlocal depth
+            depth += 1
+            started = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                depth -= 1
+                # Expectations implemented through other expectations
+                # are timed once, at the outermost call
+                if depth == 0:
+                    key = result_key({
+                        "expectation_type": expectation_type,
+                        "kwargs": {k: v for k, v in kwargs.items() if k not in _CALL_KWARGS},
+                    })
+                    timings.setdefault(key, []).append(
+                        (time.perf_counter() - started) * 1000
+                    )
+        return call
+
+    for expectation_type in {e.expectation_type for e in suite.expectations}:
+        method = getattr(validator, expectation_type, None)
+        if method is not None:
+            setattr(validator, expectation_type, timed(expectation_type, method))
+
+    return timings
+
+
+def run_suite(df: pd.DataFrame, suite) -> dict:
+    """
+    GE validation of `df`; each result's meta carries the time its
+    expectation took (`duration_ms`).
+    """
+    # Create validator from DataFrame (vectorized strftime checks)
+    validator = ge.from_pandas(df, dataset_class=ValidationDataset)
 
     # Attach suite to validator
     validator._expectation_suite = suite
+    timings = _time_expectations(validator, suite)
 
     # Run validation
     ge_result = validator.validate(result_format="SUMMARY").to_json_dict()
 
-    duration_ms = int((time.time() - start) * 1000)
+    for result in ge_result["results"]:
+        durations = timings.get(result_key(result["expectation_config"]))
+        if durations:
+            result["meta"]["duration_ms"] = round(durations.pop(0), 3)
 
-    # ---- Metrics ----
+    return ge_result
+
+
+def compute_metrics(
+    ge_result: dict,
+    suite,
+    *,
+    duration_ms: int,
+    columns,
+    row_count: int,
+    total_cells: int,
+    null_cells: int,
+    duplicate_rows: int,
+) -> dict:
     rules_total = len(ge_result["results"])
     rules_passed = sum(r["success"] for r in ge_result["results"])
-    rules_failed = rules_total - rules_passed
+    # Not evaluated after a blocking failure (fail-fast runs)
+    rules_skipped = sum(is_skipped(r) for r in ge_result["results"])
+    rules_failed = rules_total - rules_passed - rules_skipped
     quality_score = round(rules_passed / rules_total, 4) if rules_total else 1.0
 
     #Null ratio
-    total_cells = df.size
-    null_cells = df.isna().sum().sum()
     null_ratio = round(null_cells / total_cells, 4) if total_cells else 0
 
     #Duplicate ratio
-    duplicate_ratio = round(df.duplicated().sum() / len(df), 4) if len(df) else 0
+    duplicate_ratio = round(duplicate_rows / row_count, 4) if row_count else 0
 
     #Invalid rows estimate (from falling expectations)
     invalid_row_count = sum(
@@ -49,13 +207,14 @@ def validate_dataframe(df: pd.DataFrame, suite_name: str) -> dict:
         for e in suite.expectations
         if "column" in e["kwargs"]
     }
-    schema_changed = not expected_columns.issubset(set(df.columns))
+    schema_changed = not expected_columns.issubset(set(columns))
 
-    ge_result["metrics"] = {
+    return {
         "validation_duration_ms": duration_ms,
         "rules_total": rules_total,
         "rules_passed": rules_passed,
         "rules_failed": rules_failed,
+        "rules_skipped": rules_skipped,
         "quality_score": quality_score,
         "null_ratio": null_ratio,
         "duplicate_ratio": duplicate_ratio,
@@ -63,4 +222,337 @@ def validate_dataframe(df: pd.DataFrame, suite_name: str) -> dict:
         "invalid_row_count": invalid_row_count,
     }
 
+
+def validate_dataframe(
+    df: pd.DataFrame,
+    suite_name: str,
+    profile: FrameProfile | None = None,
+    gate: SheetGate | None = None,
+) -> dict:
+    """
+    `profile` is the sheet's shared FrameProfile: metrics and the
+    expectations its statistics settle are taken from it.
+    `gate` (fail-fast runs) is the sheet's SheetGate.
+    """
+    start = time.time()
+
+    if profile is None:
+        profile = FrameProfile(df)
+
+    # Load expectation suite from context
+    suite = load_suite(suite_name)
+
+    if gate is None:
+        ge_result = run_suite_with_profile(df, suite, profile)
+    else:
+        ge_result = run_gated(
+            suite,
+            lambda sub: run_suite_with_profile(df, sub, profile),
+            gate,
+        )
+
+    duration_ms = int((time.time() - start) * 1000)
+
+    # ---- Metrics ----
+    ge_result["metrics"] = compute_metrics(
+        ge_result,
+        suite,
+        duration_ms=duration_ms,
+        **profile.stats(),
+    )
+
+    return ge_result
+
+
+def ge_order(expectations) -> list[int]:
+    """
+    Positions in the order GE's legacy validate() evaluates and reports
+    expectations (grouped by column, first appearance first).
+    """
+    groups: dict = {}
+    for position, expectation in enumerate(expectations):
+        column = expectation.kwargs.get("column", "_nocolumn")
+        if not isinstance(column, Hashable):
+            column = "_nocolumn"
+        groups.setdefault(column, []).append(position)
+
+    return [position for group in groups.values() for position in group]
+
+
+def _sub_suite(suite, positions: list[int]):
+    sub = copy.deepcopy(suite)
+    sub.expectations = [suite.expectations[p] for p in positions]
+    return sub
+
+
+def _results_by_key(ge_result: dict) -> dict[str, dict]:
+    return {
+        result_key(r["expectation_config"]): r
+        for r in ge_result["results"]
+    }
+
+
+def _run_remaining(frame: pd.DataFrame, suite, positions: list[int], results: dict) -> dict:
+    """
+    Run the expectations at `positions` through GE, filling `results`.
+    """
+    ge_result = run_suite(frame, _sub_suite(suite, positions))
+
+    by_key = _results_by_key(ge_result)
+    for position in positions:
+        config = suite.expectations[position].to_json_dict()
+        results[position] = by_key[result_key(config)]
+
+    return ge_result
+
+
+def _assemble(suite, results: dict[int, dict], ge_result: dict | None) -> dict:
+    """
+    Results by position back into one GE validation result, in GE order.
+    """
+    if ge_result is None:
+        ge_result = suite_result(suite.expectation_suite_name, [])
+
+    ordered = [results[p] for p in ge_order(suite.expectations)]
+    summary = suite_result(suite.expectation_suite_name, ordered)
+
+    ge_result["results"] = ordered
+    ge_result["success"] = summary["success"]
+    ge_result["statistics"] = summary["statistics"]
+    return ge_result
+
+
+def run_suite_with_profile(df: pd.DataFrame, suite, profile: FrameProfile) -> dict:
+    """
+    Expectations answered by the column profile (null counts, bounds,
+    distinct values) skip GE; the rest run as usual.
+    """
+    plan = plan_from_stats(suite, [profile.unit(suite)], profile.schema())
+    results = dict(plan.settled)
+
+    ge_result = None
+    if plan.remaining:
+        ge_result = _run_remaining(df, suite, plan.remaining, results)
+
+    return _assemble(suite, results, ge_result)
+
+
+def run_suite_with_stats(table: pa.Table, suite, units: list[StatsUnit]) -> dict:
+    """
+    Metadata-first evaluation: expectations settled by row group / file
+    statistics are answered without touching the data, partially settled
+    ones are run on the inconclusive row groups only, the rest on the
+    converted columns as usual.
+    """
+    plan = plan_from_stats(suite, units, table.schema)
+    results = dict(plan.settled)
+
+    for unit_ids, items in plan.partial.items():
+        sub = _sub_suite(suite, [position for position, _ in items])
+        parts = [units[i] for i in unit_ids]
+
+        frame = suite_frame(
+            pa.concat_tables(table.slice(u.offset, u.row_count) for u in parts),
+            sub,
+        )
+        # Keep row numbers of the full table in partial_unexpected_index_list
+        frame.index = np.concatenate(
+            [np.arange(u.offset, u.offset + u.row_count) for u in parts]
+        )
+
+        by_key = _results_by_key(run_suite(frame, sub))
+        for position, totals in items:
+            config = suite.expectations[position].to_json_dict()
+            results[position] = finish_partial(by_key[result_key(config)], totals)
+
+    ge_result = None
+    if plan.remaining:
+        frame = suite_frame(table, _sub_suite(suite, plan.remaining))
+        ge_result = _run_remaining(frame, suite, plan.remaining, results)
+
+    return _assemble(suite, results, ge_result)
+
+
+def run_table_suite(table: pa.Table, suite, units: list[StatsUnit] | None = None) -> dict:
+    if units:
+        return run_suite_with_stats(table, suite, units)
+    return run_suite(suite_frame(table, suite), suite)
+
+
+def run_gated(suite, run: Callable[[object], dict], gate: SheetGate) -> dict:
+    """
+    Fail-fast run of `suite` (see fail_fast.gated_results): `run`
+    validates a sub-suite through the usual stages.
+    """
+    ge_result = None
+
+    def evaluate(positions: list[int]) -> dict[int, dict]:
+        nonlocal ge_result
+        ge_result = run(_sub_suite(suite, positions))
+
+        by_key = _results_by_key(ge_result)
+        return {
+            position: by_key[result_key(suite.expectations[position].to_json_dict())]
+            for position in positions
+        }
+
+    results = gated_results(
+        [expectation.to_json_dict() for expectation in suite.expectations],
+        evaluate,
+        gate,
+    )
+    return _assemble(suite, results, ge_result)
+
+
+def validate_table(
+    table: pa.Table,
+    suite_name: str,
+    stats: dict,
+    units: list[StatsUnit] | None = None,
+    gate: SheetGate | None = None,
+) -> dict:
+    """
+    Validate an Arrow table: only the columns the suite references are
+    converted to pandas; metrics come from `stats` (arrow.table_stats).
+    `units` (Parquet row groups / Iceberg files) enable the
+    statistics-first stage.
+    """
+    start = time.time()
+
+    suite = load_suite(suite_name)
+
+    if gate is None:
+        ge_result = run_table_suite(table, suite, units)
+    else:
+        ge_result = run_gated(
+            suite,
+            lambda sub: run_table_suite(table, sub, units),
+            gate,
+        )
+
+    duration_ms = int((time.time() - start) * 1000)
+
+    ge_result["metrics"] = compute_metrics(
+        ge_result,
+        suite,
+        duration_ms=duration_ms,
+        **stats,
+    )
+
     return ge_result
+
+
+# -------------------------------------------------------------------
+# Merged suites
+# -------------------------------------------------------------------
+# A sheet's suites often repeat expectations (column existence, not-null
+# on key columns). Merged, every distinct expectation is evaluated once
+# in a single pass; the results are then split back per suite.
+def merge_suites(suites: list):
+    """
+    One suite with the expectations of all `suites`; identical
+    expectations (same type and kwargs) are kept once.
+    """
+    merged = copy.deepcopy(suites[0])
+    merged.expectation_suite_name = "+".join(
+        suite.expectation_suite_name for suite in suites
+    )
+    merged.expectations = []
+
+    seen = set()
+    for suite in suites:
+        for expectation in suite.expectations:
+            key = result_key(expectation.to_json_dict())
+            if key not in seen:
+                seen.add(key)
+                merged.expectations.append(expectation)
+
+    return merged
+
+
+def split_result(merged_result: dict, suite) -> dict:
+    """
+    The part of a merged validation result that belongs to `suite`,
+    as if the suite had been run on its own.
+    """
+    by_key = _results_by_key(merged_result)
+
+    results = {}
+    for position, expectation in enumerate(suite.expectations):
+        config = expectation.to_json_dict()
+        result = copy.deepcopy(by_key[result_key(config)])
+        # Deduplicated expectations may carry different meta per suite
+        result["expectation_config"]["meta"] = config.get("meta") or {}
+        results[position] = result
+
+    ge_result = copy.deepcopy(
+        {key: value for key, value in merged_result.items() if key != "results"}
+    )
+    ge_result["meta"]["expectation_suite_name"] = suite.expectation_suite_name
+    if "expectation_suite_meta" in ge_result["meta"]:
+        ge_result["meta"]["expectation_suite_meta"] = copy.deepcopy(suite.meta)
+
+    return _assemble(suite, results, ge_result)
+
+
+def validate_suites(
+    data: pd.DataFrame | pa.Table,
+    suite_names: list[str],
+    *,
+    profile: FrameProfile | None = None,
+    stats: dict | None = None,
+    units: list[StatsUnit] | None = None,
+    gate: SheetGate | None = None,
+) -> dict[str, dict]:
+    """
+    Validate a sheet against all of its suites in one pass.
+
+    DataFrames use `profile` as validate_dataframe does; Arrow tables
+    take `stats` / `units` as validate_table does. The pass duration is
+    shared between the suites by their number of expectations.
+    With a `gate`, the merged suite runs fail-fast.
+
+    Returns {suite_name: ge_result}, each with its own metrics.
+    """
+    start = time.time()
+
+    suites = [load_suite(name) for name in suite_names]
+    merged = merge_suites(suites)
+
+    logger.info(
+        "Merged %d suites: %d expectations, %d distinct",
+        len(suites),
+        sum(len(suite.expectations) for suite in suites),
+        len(merged.expectations),
+    )
+
+    if isinstance(data, pa.Table):
+        def run(suite):
+            return run_table_suite(data, suite, units)
+    else:
+        if profile is None:
+            profile = FrameProfile(data)
+        stats = profile.stats()
+
+        def run(suite):
+            return run_suite_with_profile(data, suite, profile)
+
+    merged_result = run(merged) if gate is None else run_gated(merged, run, gate)
+
+    duration_ms = int((time.time() - start) * 1000)
+    total = sum(len(suite.expectations) for suite in suites)
+
+    results = {}
+    for name, suite in zip(suite_names, suites, strict=True):
+        ge_result = split_result(merged_result, suite)
+
+        share = len(suite.expectations) / total if total else 1 / len(suites)
+        ge_result["metrics"] = compute_metrics(
+            ge_result,
+            suite,
+            duration_ms=int(duration_ms * share),
+            **stats,
+        )
+        results[name] = ge_result
+
+    return results